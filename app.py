@@ -1,904 +1,2255 @@
-from flask import Flask, request, redirect, render_template_string, jsonify, session
-import psycopg2
-import psycopg2.extras
-import psycopg2.pool
-from datetime import datetime
-import os
-import json
-
-app = Flask(__name__)
-app.secret_key = "super_secret_key_123"   # 추가
-
-# ===== Supabase PostgreSQL 연결 설정 =====
-# Render 환경변수에 DATABASE_URL을 설정하세요
-# Supabase 대시보드 → Settings → Database → Connection string (URI) 복사
-DATABASE_URL = os.environ.get("DATABASE_URL", "")
-
-# ===== Connection Pool 설정 (속도 최적화) =====
-# 기존: 매 요청마다 psycopg2.connect() → conn.close() (200~500ms 소요)
-# 변경: 풀에서 가져와 재사용 → put_conn()으로 반환 (거의 0ms)
-_pool = psycopg2.pool.ThreadedConnectionPool(minconn=2, maxconn=10, dsn=DATABASE_URL)
-
-def get_conn_tuple():
-    """튜플 형태 결과를 위한 연결 (풀에서 가져오기)"""
-    conn = _pool.getconn()
-    conn.autocommit = False
-    return conn
-
-def put_conn(conn):
-    """연결을 풀에 반환 (기존 conn.close() 대체)"""
-    try:
-        conn.rollback()
-    except Exception:
-        pass
-    _pool.putconn(conn)
-
-def get_conn():
-    """PostgreSQL 연결 생성 (풀에서 가져오기)"""
-    return get_conn_tuple()
-
-def init_db():
-    conn = get_conn_tuple()
-    c = conn.cursor()
-    try:
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS investment (
-            id SERIAL PRIMARY KEY,
-            invest_type TEXT, product TEXT, corporation TEXT, purpose TEXT,
-            invest_item TEXT, order_target TEXT, order_actual TEXT,
-            setup_target TEXT, setup_actual TEXT, mass_target TEXT, mass_actual TEXT,
-            delay_reason TEXT, base_amount REAL, order_price_target REAL,
-            order_price_actual REAL, saving_target REAL, saving_actual REAL,
-            reduce_1 REAL, reduce_2 REAL, reduce_3 REAL, reduce_4 REAL,
-            reduce_5 REAL, reduce_6 REAL, reduce_7 REAL, reduce_8 REAL,
-            reduce_9 REAL, saving_total REAL, activity TEXT,
-            created_at TEXT, updated_at TEXT
-        )""")
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS investment_monthly (
-            id INTEGER, year_month TEXT,
-            monthly_target REAL DEFAULT 0, monthly_actual REAL DEFAULT 0,
-            PRIMARY KEY (id, year_month),
-            FOREIGN KEY (id) REFERENCES investment(id) ON DELETE CASCADE
-        )""")
-        conn.commit()
-    finally:
-        put_conn(conn)
-
-init_db()
-
-# ===== 로그인 데코레이터 =====
-from functools import wraps
-
-def login_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if "user" not in session:
-            return redirect("/login")
-        return f(*args, **kwargs)
-    return decorated_function
-
-PRODUCTS = ["키친", "빌트인쿠킹", "리빙", "부품", "ES"]
-CORPORATIONS = {
-    "키친": ["KR","TR","MN","IN_T","IL_N","IL_P","VH","RA"],
-    "빌트인쿠킹": ["KR","MN","IL_N","MZ","VH"],
-    "리빙": ["KR","PN","TH","VH","IL_N","IL_P","TN","MX","EG","RA"],
-    "ES": ["KR","TA","IL_N","IL_P","TH","SR","AZ","AT","AL"],
-    "부품": ["KR","TA","PN","TR","TH","IL_N","VH","MN"]
-}
-ALL_PURPOSES = ["신규라인","자동화","라인 개조","Overhaul","신모델 대응","T/Time 향상","고장 수리","안전","설비 이설","노후 교체","설비 개선","기타"]
-MONTHS = [f"{y}-{m:02d}" for y in [2026, 2027] for m in range(1, 13)]
-
-def nz(v, default=0.0):
-    if v is None or v == "": return default
-    try: return float(v) if isinstance(default, float) else str(v)
-    except: return default
-
-def get_processed_rows():
-    conn = get_conn_tuple()
-    try:
-        c = conn.cursor()
-        c.execute("SELECT * FROM investment ORDER BY id DESC"); rows = c.fetchall()
-    finally:
-        put_conn(conn)
-    processed = []
-    for r in rows:
-        r = list(r)
-        base = r[13] if r[13] else 0; sav_act = r[17] if r[17] else 0; product = r[2] if r[2] else ""
-        rate_target = 50 if product == "ES" else 30
-        rate_actual = "-"
-        if base and base != 0: rate_actual = round((sav_act/base)*100, 1) if sav_act else 0
-        r.append(rate_target); r.append(rate_actual)
-        timestamp = r[30] if len(r) > 30 and r[30] else (r[29] if len(r) > 29 else "")
-        r.append(timestamp); processed.append(r)
-    return processed
-
-# ===== 로그인 =====
-@app.route("/login", methods=["GET", "POST"])
-def login():
-    if request.method == "POST":
-        username = request.form.get("username")
-        password = request.form.get("password")
-
-        if username == "admin" and password == "1234":
-            session["user"] = username
-            return redirect("/dashboard")
-        else:
-            return render_template_string(LOGIN_TPL, error="아이디 또는 비밀번호 오류")
-
-    return render_template_string(LOGIN_TPL)
-
-
-# ===== 로그아웃 =====
-@app.route("/logout")
-def logout():
-    session.clear()
-    return redirect("/login")
-
-@app.route("/")
-@app.route("/edit/<int:row_id>")
-@login_required
-def index(row_id=None):
-    edit_data = None
-    if row_id:
-        conn = get_conn_tuple()
-        try:
-            c = conn.cursor()
-            c.execute("SELECT * FROM investment WHERE id = %s", (row_id,)); edit_data = c.fetchone()
-        finally:
-            put_conn(conn)
-        if not edit_data: return "데이터를 찾을 수 없습니다.", 404
-    return render_template_string(INPUT_TPL, products=PRODUCTS, corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False), all_purposes=ALL_PURPOSES, edit_data=edit_data, row_id=row_id)
-
-@app.route("/save", methods=["POST"])
-@login_required
-def save():
-    conn = get_conn_tuple()
-    try:
-        f = request.form; c = conn.cursor()
-        row_id = f.get("row_id"); now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        values = (f.get("invest_type") or "", f.get("product") or "", f.get("corporation") or "", f.get("purpose") or "",
-            f.get("invest_item") or "", f.get("order_target") or "", f.get("order_actual") or "",
-            f.get("setup_target") or "", f.get("setup_actual") or "", f.get("mass_target") or "", f.get("mass_actual") or "",
-            f.get("delay_reason") or "", nz(f.get("base_amount")), nz(f.get("order_price_target")),
-            nz(f.get("order_price_actual")), nz(f.get("saving_target")), nz(f.get("saving_actual")),
-            nz(f.get("reduce_1")), nz(f.get("reduce_2")), nz(f.get("reduce_3")), nz(f.get("reduce_4")),
-            nz(f.get("reduce_5")), nz(f.get("reduce_6")), nz(f.get("reduce_7")), nz(f.get("reduce_8")),
-            nz(f.get("reduce_9")), nz(f.get("saving_total")), f.get("activity") or "")
-        if row_id:
-            c.execute("""UPDATE investment SET invest_type=%s,product=%s,corporation=%s,purpose=%s,invest_item=%s,
-                order_target=%s,order_actual=%s,setup_target=%s,setup_actual=%s,mass_target=%s,mass_actual=%s,delay_reason=%s,
-                base_amount=%s,order_price_target=%s,order_price_actual=%s,saving_target=%s,saving_actual=%s,
-                reduce_1=%s,reduce_2=%s,reduce_3=%s,reduce_4=%s,reduce_5=%s,reduce_6=%s,reduce_7=%s,reduce_8=%s,reduce_9=%s,
-                saving_total=%s,activity=%s,updated_at=%s WHERE id=%s""", values + (now, row_id))
-            c.execute("DELETE FROM investment_monthly WHERE id=%s", (row_id,)); target_id = int(row_id)
-        else:
-            c.execute("""INSERT INTO investment (invest_type,product,corporation,purpose,invest_item,
-                order_target,order_actual,setup_target,setup_actual,mass_target,mass_actual,delay_reason,
-                base_amount,order_price_target,order_price_actual,saving_target,saving_actual,
-                reduce_1,reduce_2,reduce_3,reduce_4,reduce_5,reduce_6,reduce_7,reduce_8,reduce_9,
-                saving_total,activity,created_at,updated_at) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                RETURNING id""",
-                values + (now, now)); target_id = c.fetchone()[0]
-        conn.commit()
-        ot = f.get("order_target") or ""; oa = f.get("order_actual") or ""
-        st = nz(f.get("saving_target")); sa = nz(f.get("saving_actual"))
-        for ym in MONTHS:
-            t = st if ot == ym else 0.0; a = sa if oa == ym else 0.0
-            c.execute("""INSERT INTO investment_monthly (id, year_month, monthly_target, monthly_actual)
-                VALUES (%s,%s,%s,%s)
-                ON CONFLICT (id, year_month) DO UPDATE SET monthly_target=EXCLUDED.monthly_target, monthly_actual=EXCLUDED.monthly_actual""",
-                (target_id, ym, t, a))
-        conn.commit()
-    except Exception as e:
-        import traceback; traceback.print_exc()
-        try:
-            conn.rollback()
-        except Exception:
-            pass
-        put_conn(conn)
-        return f"저장 오류: {e}", 500
-    put_conn(conn)
-    return redirect("/list")
-
-@app.route("/dashboard")
-@login_required
-def dashboard():
-    processed = get_processed_rows()
-    months_2026 = [f"2026-{m:02d}" for m in range(1,13)]
-    mt = {m: 0.0 for m in months_2026}; ma = {m: 0.0 for m in months_2026}
-    for r in processed:
-        ot = r[6] if r[6] else ""; oa = r[7] if r[7] else ""
-        st = float(r[16]) if r[16] else 0.0; sa = float(r[17]) if r[17] else 0.0
-        if ot in mt: mt[ot] += st
-        if oa in ma: ma[oa] += sa
-    monthly_json = json.dumps({"labels": [f"{m}월" for m in range(1,13)],
-        "target": [round(mt[f"2026-{m:02d}"],2) for m in range(1,13)],
-        "actual": [round(ma[f"2026-{m:02d}"],2) for m in range(1,13)]}, ensure_ascii=False)
-    return render_template_string(DASHBOARD_TPL, processed_json=json.dumps(processed, ensure_ascii=False),
-        corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False), monthly_json=monthly_json,
-        all_purposes_json=json.dumps(ALL_PURPOSES, ensure_ascii=False))
-
-@app.route("/list")
-@login_required
-def list_page():
-    conn = get_conn_tuple()
-    try:
-        c = conn.cursor()
-        c.execute("SELECT * FROM investment ORDER BY id DESC"); rows = c.fetchall()
-    finally:
-        put_conn(conn)
-    processed = []
-    for r in rows:
-        r = list(r); base = r[13] if r[13] else 0; sav_act = r[17] if r[17] else 0; product = r[2] if r[2] else ""
-        rt = 50 if product == "ES" else 30; ra = "-"
-        if base and base != 0: ra = round((sav_act/base)*100, 1) if sav_act else 0
-        r.append(rt); r.append(ra)
-        ts = r[30] if len(r) > 30 and r[30] else r[29]; r.append(ts); processed.append(r)
-    return render_template_string(LIST_TPL, processed_json=json.dumps(processed, ensure_ascii=False),
-        months_json=json.dumps(MONTHS, ensure_ascii=False), corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False),
-        all_purposes_json=json.dumps(ALL_PURPOSES, ensure_ascii=False))
-
-@app.route("/delete/<int:row_id>", methods=["POST"])
-@login_required
-def delete_row(row_id):
-    conn = get_conn_tuple()
-    try:
-        c = conn.cursor()
-        c.execute("DELETE FROM investment WHERE id=%s", (row_id,)); c.execute("DELETE FROM investment_monthly WHERE id=%s", (row_id,))
-        conn.commit()
-    finally:
-        put_conn(conn)
-    return jsonify({"success": True})
-
-INPUT_TPL = r"""<!DOCTYPE html>
-<html lang="ko"><head><meta charset="utf-8"><title>설비투자비 한계돌파 실적 관리 시스템</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;600;700&display=swap');
-*{margin:0;padding:0;box-sizing:border-box}
-body{font-family:'Noto Sans KR',sans-serif;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);min-height:100vh;padding:16px;font-size:14px}
-.header{background:linear-gradient(135deg,#4a5f9d 0%,#5a4a8a 100%);border-radius:12px;padding:18px 30px;margin-bottom:16px;display:flex;justify-content:space-between;align-items:center;box-shadow:0 4px 12px rgba(0,0,0,0.2);max-width:1600px;margin-left:auto;margin-right:auto}
-.header h1{color:white;font-size:22px;font-weight:700;display:flex;align-items:center;gap:10px}
-.header-right{display:flex;gap:12px;align-items:center}
-.header-btn{background:rgba(255,255,255,0.15);color:white;border:1px solid rgba(255,255,255,0.3);padding:10px 20px;border-radius:8px;font-size:14px;font-weight:500;text-decoration:none;transition:all 0.3s;display:flex;align-items:center;gap:6px}
-.header-btn:hover{background:rgba(255,255,255,0.25)}
-.lang-toggle-header{display:flex;gap:4px;background:rgba(255,255,255,0.1);border-radius:20px;padding:3px;border:1px solid rgba(255,255,255,0.2);margin-right:8px}
-.lang-btn-h{padding:6px 14px;border-radius:18px;font-size:12px;font-weight:700;cursor:pointer;border:none;background:transparent;color:rgba(255,255,255,0.6);transition:all 0.25s}
-.lang-btn-h.active{background:rgba(255,255,255,0.9);color:#667eea}
-.container{max-width:1600px;margin:0 auto}
-.row{display:grid;grid-template-columns:1fr 1fr;gap:18px;margin-bottom:18px}
-.card{background:white;border-radius:14px;overflow:hidden;box-shadow:0 2px 12px rgba(0,0,0,0.08)}
-.card-full{grid-column:1/-1}
-.card-header{padding:16px 24px;font-weight:700;font-size:16px;display:flex;align-items:center;gap:8px;border-bottom:3px solid}
-.card-header.pink{background:linear-gradient(to bottom,#fce7f3,#fbcfe8);color:#be185d;border-bottom-color:#ec4899}
-.card-header.cyan{background:linear-gradient(to bottom,#cffafe,#a5f3fc);color:#0e7490;border-bottom-color:#06b6d4}
-.card-header.amber{background:linear-gradient(to bottom,#fef3c7,#fde68a);color:#b45309;border-bottom-color:#f59e0b}
-.card-header.blue{background:linear-gradient(to bottom,#dbeafe,#bfdbfe);color:#1e40af;border-bottom-color:#3b82f6}
-.card-header.emerald{background:linear-gradient(to bottom,#d1fae5,#a7f3d0);color:#047857;border-bottom-color:#10b981}
-.card-header.violet{background:linear-gradient(to bottom,#ede9fe,#ddd6fe);color:#6d28d9;border-bottom-color:#8b5cf6}
-.card-body{padding:24px}
-.form-group{margin-bottom:18px}
-.form-label{display:flex;align-items:center;gap:6px;font-size:14px;font-weight:600;color:#64748b;margin-bottom:10px}
-.toggle-group{display:grid;grid-template-columns:1fr 1fr;gap:12px}
-.toggle-btn{padding:14px;border:2px solid #cbd5e1;border-radius:10px;background:#f1f5f9;text-align:center;font-weight:600;font-size:15px;color:#64748b;cursor:pointer;transition:all 0.3s}
-.toggle-btn.active{background:#dbeafe;border-color:#3b82f6;color:#1e40af}
-.form-row{display:grid;grid-template-columns:1fr 1fr;gap:16px}
-input[type="text"],input[type="number"],input[type="month"],select,textarea{width:100%;padding:12px 16px;border:2px solid #cbd5e1;border-radius:10px;font-size:15px;font-family:'Noto Sans KR',sans-serif;background:#f1f5f9;transition:all 0.3s}
-input:focus,select:focus,textarea:focus{outline:none;border-color:#667eea;background:white;box-shadow:0 0 0 3px rgba(102,126,234,0.1)}
-textarea{resize:vertical;min-height:100px;line-height:1.6}
-input[readonly]{background:#f1f5f9;border:3px solid #8b5cf6;font-weight:700;color:#1e40af}
-.info-box{background:#dbeafe;border-left:4px solid #3b82f6;padding:14px 18px;border-radius:8px;margin-top:12px;margin-bottom:12px}
-.info-box-title{font-size:13px;font-weight:600;color:#1e40af;margin-bottom:4px}
-.info-box-text{font-size:12px;color:#3b82f6;line-height:1.6}
-.table-wrapper{overflow-x:auto}
-.reduce-table{width:100%;border-collapse:separate;border-spacing:0}
-.reduce-table th{background:#f3f4f6;color:#374151;font-size:12px;padding:12px 10px;text-align:center;font-weight:600;border:1px solid #e5e7eb;white-space:nowrap}
-.reduce-table th:nth-child(2){background:#dcfce7;color:#065f46;font-weight:700}
-.reduce-table td{padding:12px 10px;text-align:center;background:white;border:1px solid #e5e7eb}
-.reduce-table td:first-child{font-weight:600;color:#374151;background:#f9fafb}
-.reduce-table td:nth-child(2) input{background:#f1f5f9;font-weight:700;color:#065f46;font-size:15px;border:2px solid #cbd5e1}
-.reduce-table input{max-width:90px;text-align:center;background:#f1f5f9;padding:10px;border:2px solid #cbd5e1;border-radius:6px}
-.reduce-number{display:block;font-size:11px;color:#9ca3af;font-weight:700;margin-bottom:3px}
-.activity-section{margin-top:20px;padding:20px;background:#f9fafb;border-radius:10px;border:1px solid #e5e7eb}
-.activity-label{display:flex;align-items:center;gap:6px;font-size:14px;font-weight:600;color:#374151;margin-bottom:12px}
-.button-group{display:flex;justify-content:center;gap:16px;margin-top:28px;padding:26px;background:white;border-radius:14px}
-.btn-primary{background:linear-gradient(135deg,#10b981 0%,#059669 100%);color:white;border:none;padding:16px 48px;border-radius:10px;font-size:16px;font-weight:700;cursor:pointer;display:flex;align-items:center;gap:8px;box-shadow:0 4px 16px rgba(16,185,129,0.3);transition:all 0.3s}
-.btn-primary:hover{transform:translateY(-2px)}
-.btn-secondary{background:linear-gradient(135deg,#6366f1 0%,#4f46e5 100%);color:white;border:none;padding:16px 48px;border-radius:10px;font-size:16px;font-weight:700;cursor:pointer;text-decoration:none;display:flex;align-items:center;gap:8px;box-shadow:0 4px 16px rgba(99,102,241,0.3);transition:all 0.3s}
-.btn-secondary:hover{transform:translateY(-2px)}
-</style></head><body>
-<div class="header">
-  <h1>📋 <span class="i18n" data-ko="설비투자비 한계돌파 실적 관리 시스템" data-en="Facility Investment Breakthrough System">설비투자비 한계돌파 실적 관리 시스템</span></h1>
-  <div class="header-right">
-    <div class="lang-toggle-header">
-      <button class="lang-btn-h active" id="langKoI" onclick="setLang('ko')">🇰🇷 한글</button>
-      <button class="lang-btn-h" id="langEnI" onclick="setLang('en')">🇺🇸 ENG</button>
-    </div>
-    <a href="/dashboard" class="header-btn">🏠 <span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
-    <a href="/" class="header-btn">📄 Data <span class="i18n" data-ko="입력" data-en="Entry">입력</span></a>
-    <a href="/list" class="header-btn">📊 <span class="i18n" data-ko="투자실적 조회" data-en="Records">투자실적 조회</span></a>
-  </div>
-</div>
-<div class="container">
-  <form method="post" action="/save" id="mainForm">
-  {%- if row_id -%}<input type="hidden" name="row_id" value="{{ row_id }}">{%- endif -%}
-  <div class="row">
-    <div class="card"><div class="card-header pink">📌 <span class="i18n" data-ko="투자 분류" data-en="Investment Classification">투자 분류</span></div><div class="card-body">
-        <div class="form-group"><div class="form-label">💼 <span class="i18n" data-ko="투자 유형" data-en="Investment Type">투자 유형</span></div>
-          <div class="toggle-group">
-            <div class="toggle-btn {%- if not edit_data or edit_data[1]=='확장' %} active{%- endif -%}" onclick="selectType(this,'확장')"><span class="i18n" data-ko="확장" data-en="Expansion">확장</span></div>
-            <div class="toggle-btn {%- if edit_data and edit_data[1]=='경상' %} active{%- endif -%}" onclick="selectType(this,'경상')"><span class="i18n" data-ko="경상" data-en="Recurring">경상</span></div>
-          </div><input type="hidden" name="invest_type" id="invest_type" value="{%- if edit_data -%}{{ edit_data[1] or '확장' }}{%- else -%}확장{%- endif -%}"></div>
-        <div class="form-row">
-          <div class="form-group"><div class="form-label">📦 <span class="i18n" data-ko="제품" data-en="Product">제품</span></div>
-            <select name="product" id="product" onchange="updateCorporations()">{%- for p in products -%}<option value="{{ p }}" {%- if edit_data and edit_data[2]==p %} selected{%- endif -%}>{{ p }}</option>{%- endfor -%}</select></div>
-          <div class="form-group"><div class="form-label">🌍 <span class="i18n" data-ko="법인" data-en="Corporation">법인</span></div>
-            <select name="corporation" id="corporation"></select></div>
-        </div>
-        <div class="info-box"><div class="info-box-title">💡 TIP</div><div class="info-box-text"><span class="i18n" data-ko="• 5천만원 미만인 경상투자 건은 Base금액을 집행가로 기입
-• 해외 법인은 HQ 생산기술에서 검토/지원해주는 투자 건만 기입" data-en="• For recurring investments under 50M KRW, enter Base amount as execution price
-• For overseas subsidiaries, enter only investments reviewed/supported by HQ Prod. Tech.">• 5천만원 미만인 경상투자 건은 Base금액을 집행가로 기입<br>• 해외 법인은 HQ 생산기술에서 검토/지원해주는 투자 건만 기입</span></div></div>
-    </div></div>
-    <div class="card"><div class="card-header cyan">📋 <span class="i18n" data-ko="투자 항목 상세" data-en="Investment Details">투자 항목 상세</span></div><div class="card-body">
-        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></div>
-          <select name="purpose" id="purpose_select">{%- for p in all_purposes -%}<option value="{{ p }}" {%- if edit_data and edit_data[4]==p %} selected{%- endif -%}>{{ p }}</option>{%- endfor -%}</select></div>
-        <div class="form-group"><div class="form-label">📝 <span class="i18n" data-ko="투자항목" data-en="Item">투자항목</span></div>
-          <input type="text" name="invest_item" value="{%- if edit_data -%}{{ edit_data[5] or '' }}{%- endif -%}" placeholder="예: 창원 선진화 오븐라인" id="invest_item_input"></div>
-    </div></div>
-  </div>
-  <div class="card card-full"><div class="card-header amber">📅 <span class="i18n" data-ko="투자 주요 일정" data-en="Schedule">투자 주요 일정</span></div><div class="card-body">
-      <div class="form-row">
-        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="발주 목표" data-en="Order Target">발주 목표</span></div><input type="month" name="order_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[6] or '' }}{%- endif -%}"></div>
-        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="발주 실적" data-en="Order Actual">발주 실적</span></div><input type="month" name="order_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[7] or '' }}{%- endif -%}"></div></div>
-      <div class="form-row">
-        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="셋업 목표" data-en="Setup Target">셋업 목표</span></div><input type="month" name="setup_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[8] or '' }}{%- endif -%}"></div>
-        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="셋업 실적" data-en="Setup Actual">셋업 실적</span></div><input type="month" name="setup_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[9] or '' }}{%- endif -%}"></div></div>
-      <div class="form-row">
-        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="양산 목표" data-en="Mass Target">양산 목표</span></div><input type="month" name="mass_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[10] or '' }}{%- endif -%}"></div>
-        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="양산 실적" data-en="Mass Actual">양산 실적</span></div><input type="month" name="mass_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[11] or '' }}{%- endif -%}"></div></div>
-      <div class="form-group"><div class="form-label">❓ <span class="i18n" data-ko="연기사유" data-en="Delay Reason">연기사유</span></div><input type="text" name="delay_reason" value="{%- if edit_data -%}{{ edit_data[12] or '' }}{%- endif -%}" placeholder="예 : 제품개발 지연에 따른 양산 일정 지연" id="delay_reason_input" style="color:#999" onfocus="this.style.color='#333'" onblur="if(!this.value)this.style.color='#999'"></div>
-  </div></div>
-  <div class="row" style="margin-top:24px">
-    <div class="card"><div class="card-header blue">💰 <span class="i18n" data-ko="투자금액 (억원)" data-en="Amount (100M KRW)">투자금액 (억원)</span></div><div class="card-body">
-        <div class="form-group"><div class="form-label">💵 Base</div><input type="number" name="base_amount" step="0.01" value="{%- if edit_data -%}{{ edit_data[13] or '' }}{%- endif -%}" placeholder="0.00"></div>
-        <div class="form-row">
-          <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="발주가 목표" data-en="Order Price Tgt">발주가 목표</span></div><input type="number" name="order_price_target" step="0.01" value="{%- if edit_data -%}{{ edit_data[14] or '' }}{%- endif -%}" placeholder="0.00"></div>
-          <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="발주가 실적" data-en="Order Price Act">발주가 실적</span></div><input type="number" name="order_price_actual" step="0.01" value="{%- if edit_data -%}{{ edit_data[15] or '' }}{%- endif -%}" placeholder="0.00"></div></div>
-    </div></div>
-    <div class="card"><div class="card-header violet">📊 <span class="i18n" data-ko="절감 실적 (억원)" data-en="Savings (100M KRW)">절감 실적 (억원)</span></div><div class="card-body">
-        <div class="form-row">
-          <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="절감 목표" data-en="Savings Target">절감 목표</span></div><input type="number" name="saving_target" step="0.01" value="{%- if edit_data -%}{{ edit_data[16] or '' }}{%- endif -%}" placeholder="0.00"></div>
-          <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="절감 실적(자동)" data-en="Savings(auto)">절감 실적(자동)</span></div><input id="saving_actual" name="saving_actual" readonly value="{%- if edit_data -%}{{ edit_data[17] or '' }}{%- endif -%}" placeholder="0.00"></div></div>
-    </div></div>
-  </div>
-  <div class="card card-full"><div class="card-header emerald">📊 <span class="i18n" data-ko="절감 활동 실적 (억원)" data-en="Reduction Activities (100M KRW)">절감 활동 실적 (억원)</span></div><div class="card-body">
-      <div class="table-wrapper"><table class="reduce-table"><thead><tr>
-        <th style="width:110px"><span class="i18n" data-ko="항목" data-en="Item">항목</span></th><th style="width:100px"><span class="i18n" data-ko="합계" data-en="Total">합계</span></th>
-        <th><span class="reduce-number">①</span><span class="i18n" data-ko="신기술/신공법" data-en="New Tech/Method">신기술/신공법</span></th>
-            <th><span class="reduce-number">②</span><span class="i18n" data-ko="염가형 부품" data-en="Low-cost Parts">염가형 부품</span></th>
-            <th><span class="reduce-number">③</span><span class="i18n" data-ko="중국/Local 설비" data-en="China/Local Equip">중국/Local 설비</span></th>
-            <th><span class="reduce-number">④</span><span class="i18n" data-ko="중국/한국 Collabo" data-en="CN/KR Collabo">중국/한국 Collabo</span></th>
-            <th><span class="reduce-number">⑤</span><span class="i18n" data-ko="컨테이너(FR) 최소화" data-en="Container(FR) Min.">컨테이너(FR) 최소화</span></th>
-            <th><span class="reduce-number">⑥</span><span class="i18n" data-ko="출장인원 최소화" data-en="Travel Staff Min.">출장인원 최소화</span></th>
-            <th><span class="reduce-number">⑦</span><span class="i18n" data-ko="유휴설비" data-en="Idle Equip">유휴설비</span></th>
-            <th><span class="reduce-number">⑧</span><span class="i18n" data-ko="사양최적화" data-en="Spec Opt.">사양최적화</span></th>
-            <th><span class="reduce-number">⑨</span><span class="i18n" data-ko="기타" data-en="Others">기타</span></th>
-      </tr></thead><tbody><tr>
-        <td><span class="i18n" data-ko="절감 실적" data-en="Savings">절감 실적</span></td>
-        <td><input id="total_display" readonly value="{%- if edit_data -%}{{ edit_data[27] or '0.00' }}{%- else -%}0.00{%- endif -%}"></td>
-        {%- for i in range(18,27) -%}<td><input class="reduce" type="number" name="reduce_{{ i-17 }}" step="0.01" value="{%- if edit_data -%}{{ edit_data[i] or '' }}{%- endif -%}" oninput="calcTotal()"></td>{%- endfor -%}
-      </tr></tbody></table></div>
-      <div class="activity-section"><div class="activity-label">📝 <span class="i18n" data-ko="활동내용" data-en="Activity">활동내용</span></div>
-        <textarea name="activity" placeholder="예 : 1) cabinet 가공설비 신기술 적용, 3) 모터 중국설, 6) Local 인원 활용한 한국 출장자 축소(100 → 50명)" id="activity_input" style="color:#999" onfocus="this.style.color='#333'" onblur="if(!this.value)this.style.color='#999'">{%- if edit_data -%}{{ edit_data[28] or '' }}{%- endif -%}</textarea></div>
-  </div></div>
-  <input type="hidden" name="saving_total" id="saving_total" value="{%- if edit_data -%}{{ edit_data[27] or '' }}{%- endif -%}">
-  <div class="button-group">
-    <button type="submit" class="btn-primary">💾 <span class="i18n" data-ko="저장" data-en="Save">저장</span></button>
-    <a href="/list" class="btn-secondary">📊 <span class="i18n" data-ko="조회" data-en="View">조회</span></a>
-  </div></form>
-</div>
-<script>
-const CORPORATIONS={{ corporations_json | safe }};
-const EDIT_PRODUCT={%- if edit_data -%}"{{ edit_data[2] or '키친' }}"{%- else -%}"키친"{%- endif -%};
-const EDIT_CORPORATION={%- if edit_data -%}"{{ edit_data[3] or '' }}"{%- else -%}""{%- endif -%};
-function updateCorporations(){const p=document.getElementById('product').value,s=document.getElementById('corporation');s.innerHTML='';(CORPORATIONS[p]||[]).forEach(c=>{const o=document.createElement('option');o.value=c;o.textContent=c;s.appendChild(o)});}
-function selectType(btn,type){document.querySelectorAll('.toggle-btn').forEach(b=>b.classList.remove('active'));btn.classList.add('active');document.getElementById('invest_type').value=type;}
-function calcTotal(){let s=0;document.querySelectorAll(".reduce").forEach(e=>{s+=Number(e.value)||0;});const t=s.toFixed(2);document.getElementById("saving_actual").value=t;document.getElementById("saving_total").value=t;document.getElementById("total_display").value=t;}
-function setLang(l){localStorage.setItem('app_lang',l);applyLang();}
-function applyLang(){const l=localStorage.getItem('app_lang')||'ko';document.querySelectorAll('.lang-btn-h').forEach(b=>b.classList.remove('active'));if(l==='ko'&&document.getElementById('langKoI'))document.getElementById('langKoI').classList.add('active');if(l==='en'&&document.getElementById('langEnI'))document.getElementById('langEnI').classList.add('active');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});
-const PE={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
-const ps=document.getElementById('product');if(ps){[...ps.options].forEach(o=>{if(o.value)o.textContent=l==='en'?(PE[o.value]||o.value):o.value;});}
-const ii=document.getElementById('invest_item_input');if(ii&&!ii.value)ii.placeholder=l==='en'?'e.g. Changwon advanced oven line':'예: 창원 선진화 오븐라인';
-const dr=document.getElementById('delay_reason_input');if(dr&&!dr.value)dr.placeholder=l==='en'?'e.g. Mass production delayed due to product development delay':'예 : 제품개발 지연에 따른 양산 일정 지연';
-const ai=document.getElementById('activity_input');if(ai&&!ai.value)ai.placeholder=l==='en'?'e.g. 1) New tech for cabinet processing, 3) China motor equip, 6) Reduce travel staff (100→50)':'예 : 1) cabinet 가공설비 신기술 적용, 3) 모터 중국설, 6) Local 인원 활용한 한국 출장자 축소(100 → 50명)';
-const PU={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
-const pu=document.getElementById('purpose_select');if(pu){[...pu.options].forEach(o=>{if(o.value)o.textContent=l==='en'?(PU[o.value]||o.value):o.value;});}
-document.documentElement.lang=l==='en'?'en':'ko';
-document.querySelectorAll('.month-i').forEach(m=>{
-  if(!m.parentElement.classList.contains('month-wrap')){
-    const w=document.createElement('div');
-    w.className='month-wrap';
-    w.style.cssText='position:relative;width:100%';
-    m.parentElement.insertBefore(w,m);
-    w.appendChild(m);
-    const ov=document.createElement('span');
-    ov.className='month-overlay';
-    ov.style.cssText='position:absolute;left:16px;top:0;width:calc(100% - 32px);height:100%;display:none;pointer-events:none;font-size:15px;color:#999;z-index:1;display:flex;align-items:center';
-    w.appendChild(ov);
-    m.addEventListener('change',()=>{const cl=localStorage.getItem('app_lang')||'ko';ov.style.display=m.value?'none':(cl==='en'?'flex':'none');});
-  }
-  const ov=m.parentElement.querySelector('.month-overlay');
-  if(ov){
-    ov.textContent=l==='en'?'YYYY-MM':'';
-    if(l==='en'&&!m.value){
-      m.style.color='transparent';ov.style.display='flex';
-      m.onfocus=function(){this.style.color='';ov.style.display='none';};
-      m.onblur=function(){if(!this.value){this.style.color='transparent';ov.style.display='flex';}};
-    } else {
-      m.style.color='';ov.style.display='none';
-      m.onfocus=null;m.onblur=null;
-    }
-  }
-});
-}
-window.onload=function(){updateCorporations();if(EDIT_CORPORATION)document.getElementById('corporation').value=EDIT_CORPORATION;calcTotal();applyLang();}
-</script></body></html>"""
-
-# ===== DASHBOARD TEMPLATE =====
-DASHBOARD_TPL = r"""<!DOCTYPE html>
-<html lang="ko"><head><meta charset="utf-8"><title>대시보드</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;600;700&display=swap');
-*{margin:0;padding:0;box-sizing:border-box}
-body{font-family:'Noto Sans KR',sans-serif;background:#eef0f4;display:flex;min-height:100vh;font-size:14px}
-.sidebar{width:230px;min-height:100vh;background:linear-gradient(180deg,#1e2a45 0%,#0f1724 100%);display:flex;flex-direction:column;position:fixed;top:0;left:0;z-index:100;box-shadow:3px 0 15px rgba(0,0,0,0.3)}
-.logo-wrap{padding:22px 18px 18px;border-bottom:1px solid rgba(255,255,255,0.08);display:flex;align-items:center;gap:12px}
-.logo-svg{width:46px;height:46px;flex-shrink:0}
-.logo-text-group{display:flex;align-items:baseline;gap:2px}
-.logo-text-lg{font-size:26px;font-weight:900;color:#d1d5db;letter-spacing:1px;font-family:'Noto Sans KR',Arial,sans-serif;line-height:1}
-.logo-text-sub{font-size:24px;font-weight:700;color:#d1d5db;font-family:'Noto Sans KR',sans-serif;line-height:1}
-.menu-section{padding:16px 0;flex:1}
-.menu-label{font-size:11px;font-weight:700;color:#4a5568;text-transform:uppercase;letter-spacing:1px;padding:8px 20px}
-.menu-item{display:flex;align-items:center;gap:12px;padding:14px 20px;color:#a0aec0;text-decoration:none;font-size:14px;font-weight:500;transition:all 0.2s;border-left:3px solid transparent}
-.menu-item:hover{background:rgba(255,255,255,0.06);color:#fff}
-.menu-item.active{background:rgba(102,126,234,0.2);color:#fff;border-left-color:#667eea}
-.menu-icon{font-size:17px;width:22px;text-align:center}
-.main{margin-left:230px;flex:1;padding:24px;min-width:0}
-.topbar{background:white;border-radius:12px;padding:16px 24px;margin-bottom:20px;display:flex;justify-content:space-between;align-items:center;box-shadow:0 2px 8px rgba(0,0,0,0.06)}
-.topbar-title{font-size:21px;font-weight:700;color:#1a202c}
-.topbar-sub{font-size:14px;color:#718096;font-weight:500}
-.filter-bar{background:white;border-radius:12px;padding:16px 24px;margin-bottom:20px;display:flex;gap:20px;align-items:center;flex-wrap:wrap;box-shadow:0 2px 8px rgba(0,0,0,0.06)}
-.filter-group{display:flex;flex-direction:column;gap:5px}
-.filter-label{font-size:12px;font-weight:700;color:#718096}
-.filter-group select{padding:9px 16px;border:1.5px solid #e2e8f0;border-radius:8px;font-size:14px;font-family:'Noto Sans KR',sans-serif;min-width:140px;background:#f8fafc;cursor:pointer}
-.lang-toggle{margin-left:auto;display:flex;gap:8px;background:#f1f5f9;border-radius:24px;padding:4px;border:1.5px solid #e2e8f0}
-.lang-btn{padding:7px 16px;border-radius:20px;font-size:13px;font-weight:700;cursor:pointer;border:none;background:transparent;color:#718096;transition:all 0.25s}
-.lang-btn.active{background:#667eea;color:#fff;box-shadow:0 2px 8px rgba(102,126,234,0.3)}
-.kpi-grid{display:grid;grid-template-columns:repeat(6,1fr);gap:14px;margin-bottom:20px}
-.kpi-card{background:white;border-radius:12px;padding:18px;box-shadow:0 2px 8px rgba(0,0,0,0.06);border-top:4px solid transparent}
-.kpi-card.expand{border-top-color:#667eea}.kpi-card.normal{border-top-color:#10b981}
-.kpi-top{display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:10px}
-.kpi-label{font-size:12px;font-weight:600;color:#718096}
-.kpi-badge{font-size:11px;padding:3px 9px;border-radius:20px;font-weight:700}
-.kpi-badge.expand{background:#ede9fe;color:#6d28d9}.kpi-badge.normal{background:#d1fae5;color:#047857}
-.kpi-value{font-size:25px;font-weight:700;color:#1a202c}.kpi-unit{font-size:14px;color:#718096;font-weight:500;margin-left:3px}
-.chart-grid{display:grid;gap:20px}.chart-row-2{grid-template-columns:1fr 1fr}.chart-row-3{grid-template-columns:2fr 1fr}.chart-row-4{grid-template-columns:1fr}
-.chart-card{background:white;border-radius:12px;padding:24px;box-shadow:0 2px 8px rgba(0,0,0,0.06)}
-.chart-header{display:flex;align-items:center;justify-content:space-between;margin-bottom:20px}
-.chart-title{font-size:15px;font-weight:700;color:#2d3748;display:flex;align-items:center;gap:8px}
-.chart-wrap{position:relative;height:240px}.chart-wrap.tall{height:300px}.chart-wrap.pie{height:300px}.chart-wrap.monthly{height:300px}.chart-wrap.activity{height:360px}
-.invest-type-total-wrap{position:relative;border-right:2px dashed #e2e8f0;padding-right:8px;height:100%;background:linear-gradient(145deg,#f8fafc,#eef1f6);border-radius:12px;box-shadow:4px 4px 12px rgba(0,0,0,0.1),-2px -2px 8px rgba(255,255,255,0.8),inset 0 1px 0 rgba(255,255,255,0.6)}
-.invest-type-total-label{font-size:14px;font-weight:800;color:#1e293b;text-align:center;margin-bottom:6px;padding-top:4px;text-shadow:1px 1px 2px rgba(0,0,0,0.08);letter-spacing:1px}
-@keyframes pulse{0%,100%{opacity:1;transform:scale(1)}50%{opacity:0.6;transform:scale(1.3)}}
-.city-popup{position:absolute;z-index:20;background:rgba(10,22,40,0.95);border:1px solid #2a5a8c;border-radius:10px;padding:14px 18px;min-width:180px;box-shadow:0 4px 20px rgba(0,100,255,0.3);pointer-events:auto;display:none}
-.city-popup-title{font-size:14px;font-weight:700;color:#4af;margin-bottom:10px;border-bottom:1px solid #1a3a5c;padding-bottom:6px}
-.city-popup-row{display:flex;justify-content:space-between;padding:4px 0;font-size:13px}
-.city-popup-label{color:#8bc4ff}.city-popup-val{color:#fff;font-weight:600}
-.city-popup-close{position:absolute;top:6px;right:10px;color:#4af;cursor:pointer;font-size:16px}
-</style>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-</head><body>
-<div class="sidebar">
-  <div class="logo-wrap">
-    <img src="data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAUDBAQEAwUEBAQFBQUGBwwIBwcHBw8LCwkMEQ8SEhEPERETFhwXExQaFRERGCEYGh0dHx8fExciJCIeJBweHx7/2wBDAQUFBQcGBw4ICA4eFBEUHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh7/wAARCADxAPYDASIAAhEBAxEB/8QAHQABAAMAAwEBAQAAAAAAAAAAAAcICQQFBgEDAv/EAFAQAAEDAwEEBgMIDQwBBQEAAAEAAgMEBQYRBxIhMQgTQVFhcSKBkRQVMlKCkqGzFiQ2N0JWYnJ0dZWi0hgjM0NTVGOTlLHB0bIlNHOD8MP/xAAbAQEAAgMBAQAAAAAAAAAAAAAAAQIFBgcEA//EADsRAAIABAIHBgUBBwUBAAAAAAABAgMEEQUGEiExQVFxkRNhobHB0RQigeHwNBUWIzNCU5JSYnLC0vH/2gAMAwEAAhEDEQA/ALloiIAiIgCIiAIiIAiIgCIiAIhIAJJAA4kledvOdYXZ94XTK7LSubzZJWxh/wA3XU+xC8uVHMdoE2+49Eijyfbbsrh+HmNEfzI5X/7NK4zdveyVz9wZdHr40VSB7er0S561hla9kmL/ABfsSYij+n20bLpyAzM7eNeHph7P/JoXqLNlWMXnd96MitNwLuQpqyOQ+xpQ+UyjqJSvMltc00dwiIh5giIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiI4hoJJAA4knsQBfjW1VLQ0klXW1MNNTxDeklmeGMYO8k8AFC+1zpD45ipltmNCK/XdurXOa/7WhcDp6Th8M+DfaFVfPtoWXZzV9dkV4mqIgdY6ZnoQR/msHDXxOp8VDZs2GZWqqxKOZ8kPftfJe5a3NeklgNjL4LQarIKlp00pm7kOvjI7n5tDlCuV9JjaDdXPZaG0FjgI0b1MIllA8XP1Gvk0KEkUXN3o8s4fTa9DSfGLX4bPA7rI8sybI5TJfb/AHK46nXdqKhzmDybroPUF0qIoM7BLhlrRgVl3BEHE6BcllBXPbvMoqlwPaInEf7IWbS2nGREQk9RjG0LN8a3RZMoudJG3lD1xfF8x2rfoUr4h0o8uoZGx5Ja6C8QcN58Q9zzeJ1GrT5boUAIlzH1WFUdV/Nlpvjaz6rWXuwbb1s7yh8VObm6z1shDRBcG9WC49geCWH2g+ClFrmuaHNIc0jUEHUELMBSDs02wZtgj44LfcTWW1pGtBWEyRacODe1nySB4FTc1LEMmQ2cVJF9H6P36l/0UabJttGJZ+yOkim97LyR6VBUuALj/hu5P8hx8FJasaNU0s6lmOXOhcLXEIiIfAIiIAiIgCIiAIiIAiIgCIvM7Ss2smA4zNfL3KQwHcggZp1lRIRwY0d/eeQGpQ+kqVHOjUuBXb2I5+X5LZMTsU96v9fHR0cI4ucfSe7sa0c3OPcFTjbbt1vucyTWmzma0Y+fRMLXaTVI75HDs/IHDv1XjNqe0PINod/dcrxNuU7CRSUcZPVU7O4d573HifAaAeQVWzp2CZZlUaU2oWlM8F7vv6BF9AJIAGpPIKbdknR4yXKhFcskMtgtLtHNa9n2zM3TX0WH4I8XewqDYKyukUUvtJ8Vl58lvIXoqWqrquOkoqaapqJTuxxQsL3vPcAOJKmDCOjjn9+3J7rHT4/Su471W7elI8I28fU4tVsMB2e4jg1J1OO2eGnlI0kqX+nPJ+c88dPAaDwXDzratgmGOfDer9B7sZzpKf8Anpte4tb8H5RCmxpVTmypqY+yoJf1td9FqXiR9jHRfwe3lsl6uFzvMg5sLxBEfUz0v3lI1m2W7OrRumhwyyhzfgvmpmzPHyn6n6VBeWdKypdI+LFcYiYzTRs9xkLifHq2EafOKjC+bd9qV1e7eyeSjjdyjo4Y4g3ycBve0qbo+SwfHa7XPmaK74vSHUXtpaOjpWBlLSwQNA0AjjDQPYuFl33J3j9Bn+rcs8a7M8wrnufWZVfKhzuZkuErv93LgMvV5ZIZGXava883CoeD7dUufWXkqaolFFOV+X3OAiIqnQAiIgCIiA/qN745GyRvcx7SC1zToQRyIKsXsO6RVVa/c9gz2SSroR6EVz0LpoR2CQfht/K+EPFVyRDw1+HU9fL7OdDfg965GnFsrqO52+C4W+qhqqSoYJIZonhzHtPIgjmuQqJ7CNsV12c3BtDWCWvxyd+s9IDq+EnnJFrwDu9vAO8DxF3rBd7bfrNS3iz1kdZQVcYkgmj5OafA8QQdQQdCCCCAQrJnKcZwWdhky0WuB7H6PvOciIpMMEREAREQBERAERHENBJIAHEk9iA6jMcjtOJ45WX+9VAgo6Vm8483PPYxo7XE8AFQja5tAu+0TKpLvcHOipY9WUNIHasp49eQ73HgXO7T4AAew6Tm1F+c5MbPaajXH7ZIWwlvAVMo4OlPeOxvhqe1Q6qtnUss4GqOUqicv4kXgvd7+gXMstruF6utNarVRy1lbUvEcMMTdXPP/wC4k8gASV8s9tr7vdKa2Wyllq62pkEcMMY1c9x7ArzbBNkts2c2NtTUsiq8jqo/tyr01EYPHqYu5g7TzceJ4BobCVzI41jMrDJV3rjexer7jothuwW0Ya2nvmRiK6X/AHQ5rSN6Ckd+QD8Jw+MfUBzPvtpe0XF9n1sFXf63SeRpNPRxelPOR8VvYPE6DxXkdv22a3bPqJ9qtboa3JZmehATqylBHB8unbpxDeZ4HlzpZkl8u+R3ie73uvmrq2c6vlldqfADsAHYBwCtexqWH4PVY3M+LrYmoHs4vlwX53kl7UtveZZhPLS22pksNoOrRT0shEkjf8SQaE+Q0HgVEjiXOLnEkk6knmV8RVN+paORSQdnJhUK/NvEIiIekIiIAiIgCIiAIiIAiIgClvo77XqrZ7dxbLm6SoxuskBnjHF1M88OtYPZvDtA7xxiREPNV0kqrkuTNV0zTylnhqqWKqppWSwTMEkcjDq17SNQQe4hfoqudEDakWyR7PL5OS12rrTM93I8zAdfWW+sdytGrnG8Uw6Zh9Q5Mf0fFcQiIhjwiIgCIiAKEelptFOK4gMatk27d7zG5rnNJDoafk53DkXcWj5XcporqqnoaKetq5Ww09PG6WWR3JjGjUk+AAKzv2sZfUZzntzyKbebFNJuU0Z/q4W8GN89OJ8SVDZs2VsMVZVdpGvlg183uXqeVX0AkgAak8gvim7ol7OxlWYnJLlDv2myyNe1rgC2ao5sbx5hvwj8nvVTpldWS6KRFPmbF48F9SZui7spbhthGR3ylZ7/ANwjBa1w1dSQniGeDnc3eodh153SL2vwbPrSbVaHxzZLWR6wtIDm0jDw6145E/FaeZ4ngND7TarmtvwHDKvIK7R72Dq6WDXQzzH4LB/uT2AFZ+ZRfbnkuQVl9vFQZ62skMkr+Q8AB2ADQAdgCs9RoWD0EzG6qKtq9cCezi+HJfm84VbVVNbWTVlZUS1NTO90k00ry58jydS5xPEknjqV+KL9aOmqKyrhpKSCWoqZ5GxxRRMLnyPcdGta0cSSSAAOaqdH1QruPyRWLwjotXm4UEVZlN9jtD5G73uSCETSM8HO3g0HwG95rl5b0VK6no3z4xkzK2Zo1FNWQdVv+AeCRr5geaWMI8yYYpnZ9rr5O3W1vQrSi51+tFzsN3qbReKKahr6Z+5NBM3RzTpqPMEEEEcCCCNQVwUM1DEokooXdMIu3wu0x37MbLY5pnwx3G4QUj5GjUsEkjWEgd41Vk7v0XMet9prK/7KLpJ7mgfNudTGN7daTpr2cksY6uxeloY4YJ0VnFs1NlVUREMmEREAREQBERAEREB+1FU1FFWQ1lJK6GogkbLFI06FjmnUEeIIWgWxHPKfaDgdJeAWNr4v5iviBHoTNHE6djXcHDz07Fnupg6KWc/YltGjtlZPuWu97tNNvHRrJdf5p/dzJbr3OPcpTNbzNhiraRxwr54Na5b1+by8CIiscmCIiAIiICF+mFk5seyt1qgkLam9Ttphpz6pvpyHy4Nb8pUnU39MzIHXTapHZmSB0FnpGR7oPKSQb7j7CwepQgqs67lmj+Gw+C+2L5n9dnhY/ahpaiurYKKkidNUVEjYoo283vcdAB4kkLRDZPiFPg2BWzHYd10sMe/UyD+smdxe7y14DwAVTeiHi/v9tXiuc0e9S2WE1TteRkPoxjz1Jd8hWo23ZWcM2ZXi9xSBlWIuppNf7Z/otI8tS75KI1/NlTHU1Mugld1+b1LovMqh0ps+my/aFPa6abW0WV7qana12rZJBwkkPZzG6PBo7yoiX17nPcXvcXOcdSSdSSvig3ejpYKSRDJl7IV+P6hWS6EmI0Ndc7tl9bCyaWgLaaiDm69W9wJe8eO7ugH8pyrarQ9BrIqRjL9i00jWVMj2VtO0n+kGm4/TxGjPae5SjFZlimQ4bMcvuvyvr/OBZ9ERWOQFb+m3iVHJYLbmdPExlbBUNo6lwGhljcHFpPeWlug8HKp6t9028ipaTB7djTZAayvrG1BZrxbFGDxPm4tA8j3KoKq9p1nKkUx4bDp8Xbl/9ueo2RffXxD9e0X17FoJl33J3j9Bn+rcs+9kX318Q/XtF9exaCZd9yd4/QZ/q3KUYHOP6uRy9TNNERVOhBERAEREAREQBERAF9a5zXBzSWuB1BB0IK+IgNE9j2TDL9mtkvrnh881MGVPHU9cz0H6+bmk+sL1qrV0G8hdNar9i80hPueVlbTtPxXjdfp5FrPnKyqujiuM0nwdbMlLYnq5PWgiIhjAhIA1J0ARef2lXP3m2e5DdA7ddS2yokYfyhG7dHt0QvLgcyNQLa3Yz7z69OyPNr1fXEkV1bLMwdzC47o9TdB6l0aIqHd5cClwqCHYtRcjoUWL3Bs2rr3I3SS61x3DpzjiG6P3jIvJ9ObIXmqx/FYpQGNY+vnYDzJJZGfVpJ7VOWw+2e8+yLFqHd3He9sUz29zpB1jh7XlU/6UV2fdttt9O/vRUZjpIh8UMY3eHzy8+tWew57g6+Ox2ZPeyHSf/VeBGKIiqdFC5+P3e5WC9Ul5s9XJSV9JIJYJmc2uHgeBB4gg6ggkHUFcBEKxQqJOGJXTLb4T0pcfqaSKHLbPW0FWGgPnpGiWFx79CQ5vl6XmuXl3SixChgkZjlsuF3qdDuPlaIIdewknVx8t0eap6im5rjynhrmaei7cL6vfxO7zjKr3meR1F/v9V7orJ9B6Ld1kbBwaxjexo+niTqSSekRFBsUuXDLhUECslsR6jZF99fEP17RfXsWgmXfcneP0Gf6tyz72RffXxD9e0X17FoJl33J3j9Bn+rcrI0DOP6uRy9TNNERVOhBERAEREAREQBERAEREBK/RPvbrNtptcRcWw3KOWil4895u8399jFelZt4Bc/ebOrDdt7dFHcYJnH8lsjSfo1WkisjmudZGjVS5q/qVuj+4REUmmBR70kZep2IZQ/XTWlaz50jB/wAqQlGfSkDzsHyUM57lOfV7pi1+hD3YYr1slf7ofNFC0RftRFjayB0nFgkaXeWvFUO3M0zt1O2kt9PSsAa2GJsYA7AAAs59pdS+s2i5LVSO3nS3aqeT5yuWj6zWzQOGY3oO+ELhPr59Y5SznuSdc6dE+C82dQiIoOhhERAEREAREQHqNkX318Q/XtF9exaCZd9yd4/QZ/q3LPvZF99fEP17RfXsWgmXfcneP0Gf6tysjnucf1cjl6maaIiqdCOVbLdcLpU+5bZQVVdPul3VU8LpH6DmdGgnRdp9heY/infv2dL/AAqROh/JHDtlgklkZGwUM+rnHQDgO1XU98bf/f6X/Ob/ANqUrmp41mKbh1T2MEvSVk73M5/sLzH8U79+zpf4U+wvMfxTv37Ol/hWjHvjb/7/AEv+c3/tPfG3/wB/pf8AOb/2psYj99J/9ldX7Gc/2F5j+Kd+/Z0v8KfYXmP4p379nS/wrRj3xt/9/pf85v8A2nvjb/7/AEv+c3/tLD99J/8AZXV+xnP9heY/infv2dL/AAp9heY/infv2dL/AArRj3xt/wDf6X/Ob/2v7iraOaQRxVdPI88mtkBJ9SWH76z/AOyur9jOCpxHK6ankqanGL1DDEwvkkkoJWtY0DUkkt0AA46rpVoXt1kbHscyxzuRtkzfWW6D/dZ6KGrGzYFi8eKSopkUOjZ28AtOqCXr6Gnn116yJr/aAVmKtMMZDxjdsEnwxRxB3nuBEYDPC+WS/wDl6HYIiKxz4KP+kZCZ9iWUMA10pA/5r2u/4UgLpc7tnvzhF8tG7vGst08DR4ujcB9JQ9NHMUqolxvc0+jM2URFQ7oaa2WqbXWairWHebUU8crT3hzQf+VndtSpJKDaXk1HINHRXapHmOtdofWNCrz7Cbm277HsWrGvD923RwOd+VEOrd69WFVK6V1odattl2k3d2K4Rw1kXiHMDXH57HqzOd5TfYYhOp3wfgyKURFU6IEREAREQBERAeo2RffXxD9e0X17FoJl33J3j9Bn+rcs+9kX318Q/XtF9exaCZd9yd4/QZ/q3KyOe5x/VyOXqZpoiKp0IIiIAiIgCIiAKYOiBQ+69ttBPpr7ipKify1jMf8A/RQ+rH9Be0mXJMjvhbwpqOOla7xkfvH6oe1EYjH5vZYdOi7rddXqTV0maptJsNyWRztN+GOIeJfMxv8AyqDK5/TTubKPZPT0AeBJX3KJm52ljGueT5AhvtCpgpZicmytCgcT3xPySPoBcQACSeAAWnVHF1FJDD/Zxtb7Bos5tmNs9+No2OWst3m1Nzp2PH5HWDe+jVaPIjF54mJxyYOF31t7BERWNDCIiAzk2p2L7Gdo1/sYbux0tdI2Ef4RO9H+6WrzSnzpr46+37QqHIo2HqLrSBj3af1sXonj+YWewqA1RnbcKqviqOXN3tK/PY/EuB0I78K3A7pYJJGmW21vWxt14iKVuo4fnNf7V0/TkxuSWisWWQs1bA51DUkDkHenGfLUPHrCi3or5WMY2tUMU8ojors00M+8dAHOIMZ+eGjycVcPapi8eZ7P7xjrtwSVUB6hzhwZK30mH5wHq1VtqNIxF/srHYaj+mLX9Hqi9zOZF+tVBNS1UtLURuimheY5GO5tcDoQfIr8lU6MncIiISEREAREQHqNkX318Q/XtF9exaCZd9yd4/QZ/q3LPvZF99fEP17RfXsWgmXfcneP0Gf6tysjnucf1cjl6maaIiqdCCIiAIiIAiIgCvB0R8Z94dkdNXyxhtTeZnVjz29X8GMeW63e+Uqe7PsbqcuzS1Y5S6h1bUNje4D4DOb3epoJ9S0WiZQ2SysjbuU1BQUwaNfgxxRt/wBgApRpGc63RlQUsO2J3fJbOr8ip/TfvwrM2s+PRSbzLdRmaQA8BJK7kfHdY0/KVe13+0TIpcszi8ZFNrrXVTpGA/gx8mN9TQ0epdAoZs+FUnwdHLkvalr5vW/EmHohWI3fbHS1r2Ew2mmlq3d28R1bR56v1+Srvqu/Qgxx1Hid4yaaMB1xqG08BPPq4gdSPAucR8lWIVkc1zVVdviMSWyFJer8WERFJrgREQEUdKnFHZPslrZaeEyVtpeK6ENGpLW6iQfMLj8kKiy0/kYySN0cjWvY4EOa4agg9hWfe3fCn4JtIuFpjjc2gmPumgcRwMLydB8k6t+Sqs6DkzEE4YqSLata9V69Tw0b3xyNkje5j2kOa5p0II5EFaDbDc0jzrZzbrw6Vjq6NnuevaDxbMwaEkdm8NHDwcs91K3Ro2jHA84ZBcJ9yx3QthrN5x3YXfgS+onQ+BPcETM1mXC3XUl4F88Gtd/Ffm9Hoel/s+ksGX/ZfQRONtvLyZ9BwiqdPSB/PA3vPeUELSTNsbtOZ4pWWG6MEtHWR8Ht0JY7m17T3g6ELP7aNh91wbLKvHru0GWE70UrR6E8Z+DI3wP0HUdiNHlyti6qpHw8x/PB4r7bGecREUG2BERAEREB6jZF99fEP17RfXsWiNxpY6+31NDM57Y6iJ0Ty06EBwIOnjxWbGL3aSw5Nar5DCyaS3VsNWyNx0DzG8PAJ7jop6/lXZD+Kdr/ANRIpTNNzNhFXXzpcdPDey4pb+8kb+TFs3/t79/q2fwJ/Ji2b/29+/1bP4FHP8q7IfxTtf8AqJE/lXZD+Kdr/wBRIp1GN+BzJ/rf+S9z50idjOH4Bs/bfLG+5vq31sdP9s1Ae0NcHEkANHH0R9Kropd2t7c7ptExQY/XWGioo21LKgSwyucdWhw00PZ6RURKrNtwWVWSqbRrHeO7331BERDLhEUldH7ZpVbRMvY2oikZYqFzZLhOOAcOyJp+M76Bqe5D4VNTLpZUU6a7QomvoZ7PzbbNPnVzp92qr2mG3h44sg19J41+MRoPBviu56YebCwYEzGqOYNr72SyQA8WUzfhn5R0b5F3cpjuFXa8dsEtZVSQ0Ntt9PvOPBrIo2DgB6hoAs+Nq+ZVeeZzX5FU7zI5XdXSxE/0ULeDG+enE+JKs9Rz7CJUzGsTirJq+WF3/wDK+m1/c8qv1pKeerq4aSmidLPNI2ONjebnOOgA8yV+SnbodYR7/ZxLlNbFvUNkAMWo4PqXD0fmjV3nuqpvmIVkFFTRz49y6vcupavZ1j0WKYNZ8diA+0aVkchH4UnN7vW4uPrXfoiucRmTIpkbji2t36hERCgREQBRT0mdnQzrBn1VBBvXu1B09Jugb0rdPTi9YGo8QO8qVkQ9FJVTKSdDOlvXC/zqZgEEEgggjmCvin7pZ7LPsdu7s0sdOG2mvl+24o26CmnP4Xg159h1HaFAKodpoK6XXSIZ8vY/B70W16JW1dl0t8WCZDWf+o0zdLZLIf6eID+i17XNHLvb5KTdtmzO17SMadSTCOnu1M0uoKwjjG74rtOJY7tHZzHEKgNLPPS1MVTTTSQTwvEkUkbi1zHA6hwI4gg8dVdbo8baaLOqCGw36aOlyaCPTjo1lc0D4bOwP04uZ628NQ2UzSsfwidQz/2hR6td3bc+PJ7/AG2U2yOyXXHb3VWW9UUtFX0r9yWGQcQewg8iCNCCNQQQQSCuuV/9tGyyybSbMGVIbR3enYRR17WauZ27jx+Ewns7NdRpx1pHtBwnIcFvjrTkNEYJCC6GVvpRTt+Mx3aPpHaAjRseC47JxKDReqYtq9V3eR5xERQZ4IiIAiIgCIiAIiIAiKQdkGyjJNotxb7jidR2hjtKi4ysPVt05tYPw3eA9ZCHxqKiVTS3MmxWhR1Oy7A73tByeOy2ePdaNH1VU8fzdNHrxc7vPcOZPrIvrs9xG04PitLj1mjIggGr5H6b80h+E92nafoGg7F+ezvCbBgePR2Ww0vVxj0ppn8Zah/a97u0/QOQAUDdJbbnF1FVhmFVm+92sVxuMTuAHIxREcyeRcPIc9RbYc5raypzFVKnp1aWvy79EeY6Vu1gZNc3YbYKhr7NRSa1c0btRVTNPIHtY0+08ewKA0RVOgUFDKoZEMmVsXi+JzbFa6693mjtFtgdPWVkzYYYx2ucdPZ3nsC0M2XYdQ4JhNBjtFo4wt36iUf10zuL3+s8u4ADsUQdEnZWbJbmZ1fqZzLlWRkW+KQaGCFw/pCPjPHLub5qwyskc9zXjCqpvw0p/LDt739vcIiKTUAiIgCIiAIiIDiXq2UF5tNVarnSx1VFVRmKaJ41Dmn/APc+xUQ27bLrjs3yQsa2SosdW4mgqyNeHPq39zx9I4jtAv0uqyzHrPlNiqLJfaKOsoagaPY7mD2OaebXDsIUNGcwPGpmGTr7YHtXqu/zM1F+lNPPS1MdTTTSQzROD45I3FrmOB1BBHIhSRtw2RXnZxcjO3fr7BPJpS1obxbryjlA5P8AHk7TUacQIzVTrNNUyquUpsp3hZbPYd0iqS4spsfz2RlJW6COK6HhFMezrfiOPxvgnwU65RjmP5fZTbr7bqa5UUo3m741015OY4cWnxBWa6knZVtmzDAHMpaeo98rQD6VBVOJY0f4bubPVw8CpTNSxXKulH29C9GLbbZ0e7y5EhbUOjJdqB8twwWq98qXi73DUPDZ2czo13Brx56HzVf7vbLjZ7hLb7rQ1NDVxHR8M8ZY9vqKvTs0224Pm/V0sVd71XR/D3FWkMc49zHfBf5A6+C9pk+L47k9L7myCy0Nyj00HXxBzm/mu5t9RCmx4afM1bh8XY18tu2/Y/Z/mszXRXDyzouYfcJHzY/drhZXuHCJ4FRC0+AcQ794qML70X8+o5HG2VtnukQ+DuzOikPm1zdB84qLGy02ZsNnr+Zovv1fbxILRSRV7C9q1NI5j8QqH6dsVRC8H1h5XGGxnaiXbowy5a+O5p7d5QZFYlRtXU2H/Je54BFJtu2C7VqyXcGLPp29r56qFgH7+vsC9tjvRXyyqe119v1qtsR5iAPqJB6tGt/eKWPhOxvD5KvFOh+jv5XK+LusTxXIsrrxQ47Z6u4zfhdUz0WeLnH0WjxJCt9h/Rt2fWV7Z7m2sv07Tr9tSbkQP5jNNfIkqW7Zb7VYraKW3UVHbaKFpd1cMbYo2ADidBoBwHNTY12tznIgWjTQOJ8XqXu/Arxsq6MdJSmK5Z/VNq5QQ4W6leRGOP8AWP5u8m6DxKsFI+yYtj+891HabTQReEcULB9AUU7TukTh+MCaisThkNzbq3SB2lPG7j8KT8Lybr5hVU2i7Rcsz2u6/ILm+SBrtYaSL0IIvzWd/idT4qbpGNlYVimNxqbVxOGDv9IfV+JLG3bpC1N/hqscwky0lqkHVz17gWzVA7WsHNjD38yO7ka9Iiqb3QYfIoJXZSVZeL5hTv0ZNjT8trIssySnc2wU8mtNC8ae7pGn6sEcT2kadh0+9HfYXNl3U5NlkUtPYAQ6nptSySu8debY/EcT2ac1cOkp6ejpIaSkgip6eBjY4oomBrI2NGga0DgAAAAApSNWzHmNSU6WlfzbG+Hcu/y57P0a0NaGtADQNAAOAX1EVjnAREQBERAEREAREQBERAca62+hutunt1ypIaujqGFk0MzA5j2nsIKqjtu6OldaXT3zAo5a63/CltupdPD39Web2+Hwh4q26JYyeGYtUYdM0pT1b1uf5xMwZY3xSOilY5j2Etc1w0LSOYI71/KvxtX2NYjtAjfU1EHvbd9PRuFKwBx/+RvKQefHuIVU9pexLOMI6yqloffW1s4+7aIF7Wjve34TPMjTxVWjpWGZjpK5KFvRj4P0e/z7iM17/Ctse0PEwyK35BPU0rOApa3+fj07hvcWj80heARQZqfTyqiHQmwqJd6uWhxvpXt9FmR4kR8aagqNf3H/AMSkOy9IvZbcQ0T3Wstr3fg1dG/h5lgcB7VRtFNzX5+UsOm64U4eT97mh1PtU2bzsa9mb2EB3Eb9axh9jiCFyDtJ2eBu8c6xnTwukJP/AJLOlEuY95Jp901+BoVXbW9mlHEZZs2szmjshqBKfYzUrx186SuzSga73FNdLq4cvc1GWA+uUtVJkS595WTKKF3jiifRehZTJulbc5WyRY5i1NS6ghs1bOZT57jQ0D2lQvmu0fNcxe73/wAgrKiBxP2sx3Vwj5DdGn1gleTRRczlJg9FRu8mWk+O19WEX9RMfLI2KJjnveQ1rWjUuJ5ADvUzbMujtmOT9VW3xv2O2x2jtahmtRI3h8GP8Hh2u08ih6Kuup6ODTnxqFfmxbyIrRbbhd7jDbrXRT1tXM7djhhYXvcfABWq2HdHWktXue/55HHWVw9OK2cHQwnsMh5Pd+T8EeKl/Zzs7xXAbf7mx+3Njme0Nmq5fSnm/Od3eA0HgvWKyRz3GM1zalOVS/LDx3v28z4xrWMaxjQ1rRoABoAO5fURSaeEREAREQBERAEREAREQBERAEREAREQEfZrsZ2d5YXy12Pw0lU86mqof5iTXvO76Lj+cCoVyzop3KJz5cWyamqWaathuEZjcPDfZqD80K1aKLGXo8dr6TVLmO3B6147PoUAyPYvtNsT3e6cTrqqMcpKECpBHfpHqR6wF4i4264W6XqrhQVVHJ8SeF0Z9hC02X51EENREYaiGOaN3Nj2hwPqKWNhkZ2nL+bKT5Nr3Mw0Wks+IYnP/T4vZJfz6CI/7tXGbgGCNfvtwrGw74wtcGv/AIqLHtWd5O+U+qM412NosV7vDg202a43Ak6AUtM+U/ugrRenxbGKcg0+OWeEjiCyijbp7Au3a0NaGtAAA0AA4BLHxmZ3Vv4cnq/sUPxnYLtPvm64Y+bbCf6y4SiHTzZxf+6pYxDoqU0cjZssyV84GhNPb49wH/7H8dPkhWZRTYw9Vm3EJ2qBqBdy9Xc8nhezfCcPax1hx6jp52j/ANy9vWTn5btXD1EBesRFJrk2dMnRacyJt8XrCIiHzCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiID/2Q==" style="width:46px;height:46px;border-radius:8px;object-fit:contain;background:transparent" alt="LG">
-    <div class="logo-text-group"><span class="logo-text-lg">LG</span><span class="logo-text-sub">전자</span></div>
-  </div>
-  <div class="menu-section">
-    <div class="menu-label"><span class="i18n" data-ko="설비투자비 한계돌파" data-en="Investment Breakthrough">설비투자비 한계돌파</span></div>
-    <a href="/dashboard" class="menu-item active"><span class="menu-icon">🏠</span><span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
-    <a href="/list" class="menu-item"><span class="menu-icon">📋</span><span class="i18n" data-ko="투자실적 조회" data-en="Records">투자실적 조회</span></a>
-    <a href="/" class="menu-item"><span class="menu-icon">✏️</span><span class="i18n" data-ko="Data 입력" data-en="Data Entry">Data 입력</span></a>
-    </div>
-<div style="padding:10px 18px 18px">
-    <a href="#" onclick="event.preventDefault();confirmLogout()" style="display:flex;align-items:center;gap:7px;background:rgba(255,255,255,0.06);color:#8a94a6;padding:10px 16px;border-radius:8px;text-decoration:none;font-size:13px;font-weight:500;justify-content:center;transition:all 0.2s;border:1px solid rgba(255,255,255,0.08)"><span style="font-size:15px">🔓</span> <span class="i18n" data-ko="로그아웃" data-en="Logout">로그아웃</span></a>
-  </div>
-</div>
-<div class="main">
-  <div class="topbar"><div class="topbar-title">📊 <span class="i18n" data-ko="'26년 설비 투자비 한계돌파 현황" data-en="'26 Facility Investment Breakthrough">'26년 설비 투자비 한계돌파 현황</span></div><div class="topbar-sub" style="font-size:17px;font-weight:600"><span class="i18n" data-ko="창원생산기술실" data-en="Changwon Prod. Tech.">창원생산기술실</span></div></div>
-  <div class="filter-bar">
-    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="제품" data-en="Product">제품</span></div><select id="fProduct" onchange="onProductChange()"></select></div>
-    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="법인" data-en="Corp.">법인</span></div><select id="fCorp" onchange="applyFilter()"><option value="">전체</option></select></div>
-    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="투자유형" data-en="Type">투자유형</span></div><select id="fType" onchange="applyFilter()"></select></div>
-    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></div><select id="fPurpose" onchange="applyFilter()"><option value="">전체</option></select></div>
-    <div class="lang-toggle"><button class="lang-btn active" id="langKo" onclick="setLang('ko')">🇰🇷 한글</button><button class="lang-btn" id="langEn" onclick="setLang('en')">🇺🇸 ENG</button></div>
-  </div>
-  <div class="kpi-grid">
-    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="건수" data-en="Count">건수</span></div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpCnt">0</span><span class="kpi-unit"><span class="i18n" data-ko="건" data-en="cases">건</span></span></div></div>
-    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label">Base</div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpBase">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
-    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpSave">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
-    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="건수" data-en="Count">건수</span></div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorCnt">0</span><span class="kpi-unit"><span class="i18n" data-ko="건" data-en="cases">건</span></span></div></div>
-    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label">Base</div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorBase">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
-    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorSave">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
-  </div>
-  <div class="chart-grid chart-row-2" style="margin-bottom:20px">
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">💰 <span class="i18n" data-ko="전체 Base 대비 절감 실적" data-en="Total Base vs Savings">전체 Base 대비 절감 실적</span></div></div><div class="chart-wrap"><canvas id="cBaseTotal"></canvas></div></div>
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">📦 <span class="i18n" data-ko="제품별 Base 대비 절감 실적" data-en="Product Base vs Savings">제품별 Base 대비 절감 실적</span></div></div><div class="chart-wrap"><canvas id="cBaseProduct"></canvas></div></div>
-  </div>
-  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">📊 <span class="i18n" data-ko="투자유형별 절감 실적" data-en="Savings by Type">투자유형별 절감 실적</span></div></div>
-<div style="display:grid;grid-template-columns:240px 1fr;gap:0;height:320px;overflow:hidden">
-  <div class="invest-type-total-wrap"><div class="invest-type-total-label">Total</div><div style="position:relative;height:280px"><canvas id="cInvestTypeTotal"></canvas></div></div>
-  <div style="position:relative;padding-left:8px;height:320px"><div style="position:relative;height:300px"><canvas id="cInvestTypeProduct"></canvas></div></div>
-</div>
-  </div>
-  <div class="chart-grid chart-row-3" style="margin-bottom:20px">
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">🔧 <span class="i18n" data-ko="절감 활동별 실적" data-en="By Activity">절감 활동별 실적</span></div></div><div class="chart-wrap activity"><canvas id="cActivity"></canvas></div></div>
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">🥧 <span class="i18n" data-ko="제품별 절감 실적" data-en="By Product">제품별 절감 실적</span></div></div><div class="chart-wrap pie"><canvas id="cPie"></canvas></div></div>
-  </div>
-  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">🌍 <span class="i18n" data-ko="법인별 절감 목표 및 실적" data-en="Corp. Target vs Actual">법인별 절감 목표 및 실적</span></div></div><div class="chart-wrap tall"><canvas id="cCorp"></canvas></div></div>
-  </div>
-  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
-    <div class="chart-card"><div class="chart-header"><div class="chart-title">📅 <span class="i18n" data-ko="월별 절감 실적 (2026년)" data-en="Monthly Savings (2026)">월별 절감 실적 (2026년)</span></div></div><div class="chart-wrap monthly"><canvas id="cMonthly"></canvas></div></div>
-  </div>
-</div>
-<!-- World Map Modal -->
-<script>
-const ALL_DATA={{ processed_json | safe }};const CORPS_MAP={{ corporations_json | safe }};const MONTHLY_DATA={{ monthly_json | safe }};const ALL_PURPOSES={{ all_purposes_json | safe }};
-const PRODUCTS=['키친','빌트인쿠킹','리빙','부품','ES'];
-const PRODUCTS_EN={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
-function pn(k){return getLang()==='en'?(PRODUCTS_EN[k]||k):k;}function getLang(){return localStorage.getItem('app_lang')||'ko';}
-const _allCorps=[...new Set(Object.values(CORPS_MAP).flat())].sort();const ALL_CORPS_ORDERED=['KR',..._allCorps.filter(c=>c!=='KR')];
-let filtered=[...ALL_DATA];
-const charts={};
-function t(ko,en){return getLang()==='en'?en:ko;}
-function sum(a,i){return a.reduce((s,r)=>s+(parseFloat(r[i])||0),0);}
-function setLang(l){localStorage.setItem('app_lang',l);document.getElementById('langKo').classList.toggle('active',l==='ko');document.getElementById('langEn').classList.toggle('active',l==='en');applyLang();initProductFilter();initTypeFilter();initCorpFilter(document.getElementById('fProduct').value);initPurposeFilter();renderAll();}
-function applyLang(){const l=getLang();document.getElementById('langKo').classList.toggle('active',l==='ko');document.getElementById('langEn').classList.toggle('active',l==='en');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});}
-const _PU={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
-function initPurposeFilter(){const l=getLang(),s=document.getElementById('fPurpose');s.innerHTML='<option value="">'+t('전체','All')+'</option>';ALL_PURPOSES.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(_PU[p]||p):p;s.appendChild(o);});}
-function initProductFilter(){const s=document.getElementById('fProduct'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';PRODUCTS.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=pn(p);s.appendChild(o);});if(cur)s.value=cur;}
-function initTypeFilter(){const s=document.getElementById('fType'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';const o1=document.createElement('option');o1.value='확장';o1.textContent=t('확장','Expansion');s.appendChild(o1);const o2=document.createElement('option');o2.value='경상';o2.textContent=t('경상','Recurring');s.appendChild(o2);if(cur)s.value=cur;}
-function initCorpFilter(product){const s=document.getElementById('fCorp'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';const corps=product&&CORPS_MAP[product]?CORPS_MAP[product]:ALL_CORPS_ORDERED;corps.forEach(c=>{const o=document.createElement('option');o.value=c;o.textContent=c;s.appendChild(o);});if([...s.options].some(o=>o.value===cur))s.value=cur;}
-function onProductChange(){initCorpFilter(document.getElementById('fProduct').value);applyFilter();}
-function applyFilter(){const p=document.getElementById('fProduct').value,c=document.getElementById('fCorp').value,tp=document.getElementById('fType').value,pu=document.getElementById('fPurpose').value;filtered=ALL_DATA.filter(r=>(!p||r[2]===p)&&(!c||r[3]===c)&&(!tp||r[1]===tp)&&(!pu||r[4]===pu));renderAll();}
-function updateKPI(){const e=filtered.filter(r=>r[1]==='확장'),n=filtered.filter(r=>r[1]==='경상');document.getElementById('kExpCnt').textContent=e.length;document.getElementById('kExpBase').textContent=sum(e,13).toFixed(1);document.getElementById('kExpSave').textContent=sum(e,17).toFixed(1);document.getElementById('kNorCnt').textContent=n.length;document.getElementById('kNorBase').textContent=sum(n,13).toFixed(1);document.getElementById('kNorSave').textContent=sum(n,17).toFixed(1);}
-const P={gray:'rgba(180,180,180,0.85)',grayL:'rgba(180,180,180,0.4)',red:'rgba(180,30,30,0.85)',purple:'rgba(102,126,234,0.85)',green:'rgba(16,185,129,0.85)',amber:'rgba(245,158,11,0.85)',blue:'rgba(59,130,246,0.85)',blueL:'rgba(59,130,246,0.3)',teal:'rgba(20,184,166,0.85)',violet:'rgba(139,92,246,0.85)',pink:'rgba(236,72,153,0.85)',orange:'rgba(249,115,22,0.85)'};
-function mk(id,cfg){if(charts[id])charts[id].destroy();charts[id]=new Chart(document.getElementById(id),cfg);}
-const barLP={id:'barLabel',afterDatasetsDraw(ch){if(ch.config.type==='doughnut'||ch.config.type==='pie')return;const{ctx}=ch;ch.data.datasets.forEach((ds,di)=>{const m=ch.getDatasetMeta(di);if(m.hidden)return;m.data.forEach((bar,idx)=>{const v=ds.data[idx];if(!v||v<=0)return;ctx.save();ctx.font='600 11px "Noto Sans KR",sans-serif';ctx.fillStyle='#374151';ctx.textAlign='center';ctx.textBaseline='bottom';if(ch.config.options?.indexAxis==='y'){ctx.textAlign='left';ctx.textBaseline='middle';ctx.fillText(v.toFixed(1),bar.x+4,bar.y);}else{ctx.fillText(v.toFixed(1),bar.x,bar.y-4);}ctx.restore();});});}};
-Chart.register(barLP);
-function chart_BaseTotal(){mk('cBaseTotal',{type:'bar',data:{labels:[t('전체','Total')],datasets:[{label:t('Base 금액','Base'),data:[sum(filtered,13)],backgroundColor:P.purple,borderRadius:6,maxBarThickness:60},{label:t('절감 실적','Savings'),data:[sum(filtered,17)],backgroundColor:P.green,borderRadius:6,maxBarThickness:60}]},options:{responsive:true,maintainAspectRatio:false,layout:{padding:{top:20}},plugins:{legend:{position:'top',labels:{font:{size:12},padding:12}}},scales:{y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(sum(filtered,13),sum(filtered,17))*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
-function chart_BaseProduct(){const b=PRODUCTS.map(p=>sum(filtered.filter(r=>r[2]===p),13)),s=PRODUCTS.map(p=>sum(filtered.filter(r=>r[2]===p),17));mk('cBaseProduct',{type:'bar',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{label:t('Base 금액','Base'),data:b,backgroundColor:P.purple,borderRadius:5,maxBarThickness:40},{label:t('절감 실적','Savings'),data:s,backgroundColor:P.green,borderRadius:5,maxBarThickness:40}]},options:{responsive:true,maintainAspectRatio:false,layout:{padding:{top:20}},plugins:{legend:{position:'top',labels:{font:{size:12},padding:12}}},scales:{y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(...b,...s)*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
-function chart_InvestTypeTotal(){const eT=sum(filtered.filter(r=>r[1]==='확장'),16),eA=sum(filtered.filter(r=>r[1]==='확장'),17),nT=sum(filtered.filter(r=>r[1]==='경상'),16),nA=sum(filtered.filter(r=>r[1]==='경상'),17);mk('cInvestTypeTotal',{type:'bar',data:{labels:[t('확장','Exp.'),t('경상','Rec.')],datasets:[{label:t('목표','Target'),data:[eT,nT],backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:4},{label:t('실적','Actual'),data:[eA,nA],backgroundColor:P.red,borderRadius:4}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{display:false}},scales:{x:{ticks:{font:{size:13}}},y:{beginAtZero:true,max:Math.ceil(Math.max(eT,eA,nT,nA)*1.25)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
-function chart_InvestTypeProduct(){const eT=[],eA=[],nT=[],nA=[];PRODUCTS.forEach(p=>{eT.push(sum(filtered.filter(r=>r[2]===p&&r[1]==='확장'),16));eA.push(sum(filtered.filter(r=>r[2]===p&&r[1]==='확장'),17));nT.push(sum(filtered.filter(r=>r[2]===p&&r[1]==='경상'),16));nA.push(sum(filtered.filter(r=>r[2]===p&&r[1]==='경상'),17));});mk('cInvestTypeProduct',{type:'bar',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{label:t('확장목표','Exp.Tgt'),data:eT,backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:3},{label:t('확장실적','Exp.Act'),data:eA,backgroundColor:P.red,borderRadius:3},{label:t('경상목표','Rec.Tgt'),data:nT,backgroundColor:'rgba(160,160,160,0.25)',borderColor:'rgba(160,160,160,0.7)',borderWidth:2,borderRadius:3},{label:t('경상실적','Rec.Act'),data:nA,backgroundColor:'rgba(180,30,30,0.5)',borderRadius:3}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:11},boxWidth:12,padding:8}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,max:Math.ceil(Math.max(...eT,...eA,...nT,...nA)*1.25)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
-function chart_Activity(){const aL=[t('합계','Total'),t('①신기술 신공법','①New Tech'),t('②염가형 부품','②Low-cost Parts'),t('③중국/Local 설비','③China/Local'),t('④중국/한국 Collabo','④CN/KR Collabo'),t('⑤컨테이너(FR) 최소화','⑤Container Min.'),t('⑥출장인원 최소화','⑥Travel Min.'),t('⑦유휴설비','⑦Idle Equip'),t('⑧사양 최적화','⑧Spec Opt.'),t('⑨기타','⑨Others')];const tS=sum(filtered,17),aD=[18,19,20,21,22,23,24,25,26].map(i=>sum(filtered,i));const cols=[P.orange,P.amber,P.green,P.teal,P.blue,P.violet,P.pink,P.purple,P.red];mk('cActivity',{type:'bar',data:{labels:aL,datasets:[{label:t('절감(억원)','Savings'),data:[tS,...aD],backgroundColor:[P.purple,...cols],borderRadius:5}]},options:{responsive:true,maintainAspectRatio:false,indexAxis:'y',plugins:{legend:{display:false}},scales:{x:{beginAtZero:true,title:{display:true,text:t('억원','100M'),font:{size:12}}},y:{ticks:{font:{size:12},padding:6}}}}});}
-function chart_Pie(){const pd=PRODUCTS.map(p=>sum(filtered.filter(r=>r[2]===p),17)),total=pd.reduce((a,b)=>a+b,0);const pc=[P.purple,P.amber,P.green,P.blue,P.red];const centerPlugin={id:'ctr',afterDraw(ch){const{ctx,chartArea:{left,right,top,bottom}}=ch;const cx=(left+right)/2,cy=(top+bottom)/2;ctx.save();ctx.font='700 22px "Noto Sans KR",sans-serif';ctx.fillStyle='#1a202c';ctx.textAlign='center';ctx.textBaseline='middle';ctx.fillText(total.toFixed(1),cx,cy-8);ctx.font='500 12px "Noto Sans KR",sans-serif';ctx.fillStyle='#718096';ctx.fillText(t('억원','100M'),cx,cy+14);ctx.restore();}};const lblPlugin={id:'plbl',afterDatasetsDraw(ch){const{ctx}=ch;ch.getDatasetMeta(0).data.forEach((arc,i)=>{const v=ch.data.datasets[0].data[i];if(!v||v<=0)return;const{x,y}=arc.tooltipPosition();ctx.save();ctx.font='600 12px "Noto Sans KR",sans-serif';ctx.fillStyle='#fff';ctx.textAlign='center';ctx.textBaseline='middle';ctx.fillText(v.toFixed(1),x,y);ctx.restore();});}};mk('cPie',{type:'doughnut',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{data:pd,backgroundColor:pc,borderWidth:2,borderColor:'#fff'}]},options:{responsive:true,maintainAspectRatio:false,cutout:'55%',plugins:{legend:{position:'bottom',labels:{boxWidth:13,padding:12,font:{size:13}}}}},plugins:[centerPlugin,lblPlugin]});}
-function chart_Corp(){const cT={},cA={};ALL_CORPS_ORDERED.forEach(c=>{cT[c]=0;cA[c]=0;});filtered.forEach(r=>{const c=r[3];if(c&&cT[c]!==undefined){cT[c]+=parseFloat(r[16])||0;cA[c]+=parseFloat(r[17])||0;}});mk('cCorp',{type:'bar',data:{labels:ALL_CORPS_ORDERED,datasets:[{label:t('절감 목표','Target'),data:ALL_CORPS_ORDERED.map(c=>cT[c]),backgroundColor:P.blueL,borderColor:P.blue,borderWidth:2,borderRadius:4},{label:t('절감 실적','Actual'),data:ALL_CORPS_ORDERED.map(c=>cA[c]),backgroundColor:P.green,borderRadius:4}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:13}}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(...ALL_CORPS_ORDERED.map(c=>cT[c]),...ALL_CORPS_ORDERED.map(c=>cA[c]))*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:13}}}}}});}
-function chart_Monthly(){const labels=getLang()==='en'?['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']:MONTHLY_DATA.labels;const tgt=MONTHLY_DATA.target,act=MONTHLY_DATA.actual;const cT=[],cA=[];let st=0,sa=0;for(let i=0;i<12;i++){st+=tgt[i];cT.push(+st.toFixed(2));sa+=act[i];cA.push(+sa.toFixed(2));}const mB=Math.max(...tgt,...act,1),mC=Math.max(...cT,...cA,1);mk('cMonthly',{type:'bar',data:{labels,datasets:[{type:'bar',label:t('절감목표','Target'),data:tgt,order:1,backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:4,yAxisID:'y'},{type:'bar',label:t('절감실적','Actual'),data:act,order:2,backgroundColor:P.red,borderRadius:4,yAxisID:'y'},{type:'line',label:t('누적목표','Cum.Tgt'),data:cT,order:3,borderColor:'rgba(130,130,130,0.95)',backgroundColor:'transparent',borderDash:[6,3],borderWidth:2,pointRadius:5,pointBackgroundColor:'white',pointBorderColor:'rgba(130,130,130,0.95)',pointBorderWidth:2,tension:0.1,yAxisID:'y2'},{type:'line',label:t('누적실적','Cum.Act'),data:cA,order:4,borderColor:P.red,backgroundColor:'transparent',borderWidth:2.5,pointRadius:5,pointBackgroundColor:'white',pointBorderColor:P.red,pointBorderWidth:2,tension:0.1,yAxisID:'y2'}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:12},boxWidth:14,padding:20}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,position:'left',max:Math.ceil(mB*3),title:{display:true,text:t('월별(억원)','Monthly'),font:{size:12}}},y2:{beginAtZero:true,position:'right',max:Math.ceil(mC*1.3),title:{display:true,text:t('누적(억원)','Cumulative'),font:{size:12}},grid:{drawOnChartArea:false}}}}});}
-function renderAll(){updateKPI();chart_BaseTotal();chart_BaseProduct();chart_InvestTypeTotal();chart_InvestTypeProduct();chart_Activity();chart_Pie();chart_Corp();chart_Monthly();}
-window.onload=function(){initProductFilter();initTypeFilter();initCorpFilter('');initPurposeFilter();applyLang();renderAll();};
-</script><script>
-function confirmLogout(){if(confirm('로그아웃 하시겠습니까?'))window.location.href='/logout';}
-</script></body></html>"""
-
-# ===== LIST TEMPLATE =====
-LIST_TPL = r"""<!DOCTYPE html>
-<html lang="ko"><head><meta charset="utf-8"><title>실적 조회</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;700&display=swap');
-*{box-sizing:border-box;margin:0;padding:0}
-body{font-family:'Noto Sans KR',sans-serif;font-size:13px;background:linear-gradient(135deg,#667eea,#764ba2);color:#333;padding:16px}
-.top-header{background:linear-gradient(135deg,#4a5f9d,#5a4a8a);padding:18px 28px;border-radius:16px;box-shadow:0 8px 32px rgba(0,0,0,0.15);margin-bottom:20px;display:flex;align-items:center;justify-content:space-between}
-.top-header h2{font-size:22px;font-weight:700;color:#fff;display:flex;align-items:center;gap:10px}
-.top-header-right{display:flex;gap:12px;align-items:center}
-.top-header a,.excel-btn{background:rgba(255,255,255,0.2);color:#fff;padding:10px 20px;border-radius:10px;text-decoration:none;font-weight:600;font-size:14px;transition:all 0.3s;border:1px solid rgba(255,255,255,0.3);cursor:pointer;display:flex;align-items:center;gap:6px}
-.lang-toggle-list{display:flex;gap:4px;background:rgba(255,255,255,0.15);border-radius:20px;padding:3px;border:1px solid rgba(255,255,255,0.2)}
-.lang-btn-list{padding:6px 14px;border-radius:18px;font-size:12px;font-weight:700;cursor:pointer;border:none;background:transparent;color:rgba(255,255,255,0.6);transition:all 0.25s}
-.lang-btn-list.active{background:rgba(255,255,255,0.9);color:#667eea}
-.filter-bar{background:rgba(255,255,255,0.98);border-radius:12px;padding:16px 24px;display:flex;gap:20px;align-items:center;flex-wrap:wrap;margin-bottom:16px;box-shadow:0 4px 16px rgba(0,0,0,0.08)}
-.filter-bar label{font-weight:600;color:#667eea;font-size:14px}
-.filter-bar select{padding:8px 32px 8px 12px;border:2px solid #e2e8f0;border-radius:8px;font-size:14px;background:#f8fafc;cursor:pointer}
-.legend{margin-left:auto;display:flex;gap:16px;align-items:center;font-size:13px}
-.legend-item{display:flex;align-items:center;gap:6px;color:#64748b;font-weight:500}
-.sig{width:16px;height:16px;border-radius:50%;display:inline-block}
-.s-g{background:radial-gradient(circle at 40% 35%,#34d399,#059669);box-shadow:0 0 6px rgba(16,185,129,0.5)}
-.s-y{background:radial-gradient(circle at 40% 35%,#fcd34d,#f59e0b);box-shadow:0 0 6px rgba(245,158,11,0.5)}
-.s-x{background:radial-gradient(circle at 40% 35%,#d1d5db,#94a3b8)}
-.table-container{background:rgba(255,255,255,0.98);border-radius:16px;box-shadow:0 8px 32px rgba(0,0,0,0.12);overflow:hidden}
-.table-wrap{overflow-x:auto;overflow-y:auto;max-height:calc(100vh - 220px)}
-table{border-collapse:collapse;white-space:nowrap;min-width:100%;background:#fff}
-thead th{position:sticky;z-index:10;background:#667eea;color:#fff;font-weight:600;font-size:12px;padding:11px 9px;border:1px solid #94a3b8;text-align:center}
-tr.gh th{top:0;z-index:12}
-tr.gh+tr th{top:37px}
-thead tr.gh th{background:#5a67d8;font-size:13px;padding:9px}
-td.sc,th.sc{position:sticky;z-index:5;background:#f1f5f9}
-th.sc{background:#667eea !important;z-index:15}
-.c0{left:0;min-width:54px}.c1{left:54px;min-width:46px}.c2{left:100px;min-width:58px}.c3{left:158px;min-width:70px}.c4{left:228px;min-width:120px}.c5{left:348px;min-width:100px}
-th.c0,th.c1,th.c2,th.c3,th.c4,th.c5{background:#667eea !important;z-index:15 !important}
-tbody tr:nth-child(even) td.sc{background:#f1f5f9}
-tbody tr:nth-child(odd) td.sc{background:#e2e8f0}
-tbody tr:hover td.sc{background:#ddd6fe !important}
-tbody td{padding:9px 11px;border:1px solid #94a3b8;font-size:13px;text-align:center;vertical-align:middle}
-td.left{text-align:left}
-td.act-cell{text-align:left;max-width:300px;white-space:normal;word-break:break-all;line-height:1.5}
-tbody tr:nth-child(even) td{background:#f8fafc}
-tbody tr:nth-child(odd) td{background:#fff}
-tbody tr:hover td{background:#e0e7ff !important}
-tfoot td{padding:10px 11px;border:1px solid #94a3b8;font-size:13px;text-align:center;font-weight:700;background:#fef3c7;color:#78350f}
-th.reduce-col{min-width:100px!important;width:100px!important;max-width:100px!important;word-wrap:break-word;white-space:normal!important;font-size:10px}
-th.gs{background:#3b82f6}th.gv{background:#10b981}th.gr{background:#fbbf24;color:#78350f}th.ge{background:#8b5cf6}
-tr.gh .g-s{background:#2563eb}tr.gh .g-v{background:#059669}tr.gh .g-r{background:#f59e0b}tr.gh .g-e{background:#7c3aed}tr.gh .g-c{background:#5a67d8}
-tr.gh th.sc{z-index:21 !important}
-.footer-info{padding:12px 24px;font-size:14px;color:#64748b;background:rgba(255,255,255,0.95);border-top:2px solid #e2e8f0;font-weight:600}
-.row-actions{display:flex;gap:6px;align-items:center;justify-content:center}
-.icon-btn{display:inline-flex;align-items:center;justify-content:center;width:28px;height:28px;border-radius:6px;cursor:pointer;border:none;background:#fff;font-size:14px;text-decoration:none;box-shadow:0 2px 4px rgba(0,0,0,0.1)}
-.icon-edit{color:#3b82f6}.icon-del{color:#ef4444}
-</style>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/xlsx/0.18.5/xlsx.full.min.js"></script>
-</head><body>
-<div class="top-header">
-  <h2>📊 <span class="i18n" data-ko="설비 투자비 활동 실적 조회" data-en="Investment Performance">설비 투자비 활동 실적 조회</span></h2>
-  <div class="top-header-right">
-    <div class="lang-toggle-list"><button class="lang-btn-list active" id="langKo2" onclick="setLang('ko')">🇰🇷 한글</button><button class="lang-btn-list" id="langEn2" onclick="setLang('en')">🇺🇸 ENG</button></div>
-    <button class="excel-btn" onclick="downloadExcel()">📥 Excel</button>
-    <a href="/dashboard">🏠 <span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
-    <a href="/">◀ <span class="i18n" data-ko="입력" data-en="Entry">입력</span></a>
-  </div>
-</div>
-<div class="filter-bar">
-  <label><span class="i18n" data-ko="제품" data-en="Product">제품</span></label>
-  <select id="fp" onchange="applyFilter();updateFilterCorps()"></select>
-  <label><span class="i18n" data-ko="법인" data-en="Corp.">법인</span></label>
-  <select id="fc" onchange="applyFilter()"></select>
-  <label><span class="i18n" data-ko="투자유형" data-en="Type">투자유형</span></label>
-  <select id="ft" onchange="applyFilter()"></select>
-  <label><span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></label>
-  <select id="fpu" onchange="applyFilter()"></select>
-  <div class="legend">
-    <div class="legend-item"><span class="sig s-g"></span><span class="i18n" data-ko="목표초과" data-en="Above">목표초과</span></div>
-    <div class="legend-item"><span class="sig s-y"></span><span class="i18n" data-ko="미달" data-en="Below">미달</span></div>
-    <div class="legend-item"><span class="sig s-x"></span><span class="i18n" data-ko="미입력" data-en="N/A">미입력</span></div>
-  </div>
-</div>
-<div class="table-container"><div class="table-wrap">
-  <table id="mainTable"><thead>
-<tr class="gh">
-  <th class="g-c" colspan="6" style="position:sticky;left:0;z-index:21;text-align:center"><span class="i18n" data-ko="투자 분류" data-en="Classification">투자 분류</span></th>
-      <th class="g-s" colspan="7">📅 <span class="i18n" data-ko="일정" data-en="Schedule">일정</span></th>
-      <th class="g-v" colspan="4">💰 <span class="i18n" data-ko="투자절감" data-en="Savings">투자절감</span></th>
-      <th class="g-r" colspan="11">📊 <span class="i18n" data-ko="절감활동" data-en="Activities">절감활동</span></th>
-      <th class="g-e" colspan="3">🎯 <span class="i18n" data-ko="목표" data-en="Target">목표</span></th>
-    </tr>
-    <tr>
-      <th class="sc c0"><span class="i18n" data-ko="수정" data-en="Edit">수정</span></th><th class="sc c1"><span class="i18n" data-ko="제품" data-en="Product">제품</span></th><th class="sc c2"><span class="i18n" data-ko="법인" data-en="Corp">법인</span></th><th class="sc c3"><span class="i18n" data-ko="유형" data-en="Type">유형</span></th><th class="sc c4"><span class="i18n" data-ko="투자항목" data-en="Item">투자항목</span></th><th class="sc c5"><span class="i18n" data-ko="목적" data-en="Purpose">목적</span></th>
-      <th class="gs"><span class="i18n" data-ko="발주목표" data-en="Order Tgt">발주목표</span></th><th class="gs"><span class="i18n" data-ko="발주실적" data-en="Order Act">발주실적</span></th><th class="gs"><span class="i18n" data-ko="셋업목표" data-en="Setup Tgt">셋업목표</span></th><th class="gs"><span class="i18n" data-ko="셋업실적" data-en="Setup Act">셋업실적</span></th><th class="gs"><span class="i18n" data-ko="양산목표" data-en="Mass Tgt">양산목표</span></th><th class="gs"><span class="i18n" data-ko="양산실적" data-en="Mass Act">양산실적</span></th><th class="gs"><span class="i18n" data-ko="연기사유" data-en="Delay">연기사유</span></th>
-      <th class="gv">Base</th><th class="gv"><span class="i18n" data-ko="발주가목표" data-en="Ord.Price Tgt">발주가목표</span></th><th class="gv"><span class="i18n" data-ko="발주가실적" data-en="Ord.Price Act">발주가실적</span></th><th class="gv"><span class="i18n" data-ko="절감목표" data-en="Save Tgt">절감목표</span></th>
-      <th class="gr"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></th><th class="gr reduce-col"><span class="i18n" data-ko="①신기술/신공법" data-en="①NewTech">①신기술/신공법</span></th><th class="gr reduce-col"><span class="i18n" data-ko="②염가형 부품" data-en="②LowCost">②염가형 부품</span></th><th class="gr reduce-col"><span class="i18n" data-ko="③중국/Local 설비" data-en="③China/Local">③중국/Local 설비</span></th><th class="gr reduce-col"><span class="i18n" data-ko="④중국/한국 Collabo" data-en="④CN/KR Collabo">④중국/한국 Collabo</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑤컨테이너(FR) 최소화" data-en="⑤Container Min">⑤컨테이너(FR) 최소화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑥출장인원 최소화" data-en="⑥Travel Min">⑥출장인원 최소화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑦유휴설비" data-en="⑦Idle">⑦유휴설비</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑧사양최적화" data-en="⑧Spec Opt">⑧사양최적화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑨기타" data-en="⑨Others">⑨기타</span></th><th class="gr"><span class="i18n" data-ko="활동" data-en="Activity">활동</span></th>
-      <th class="ge"><span class="i18n" data-ko="목표%" data-en="Tgt%">목표%</span></th><th class="ge"><span class="i18n" data-ko="실적%" data-en="Act%">실적%</span></th><th class="ge">Signal</th>
-    </tr>
-  </thead><tbody id="tableBody"></tbody><tfoot id="tableFoot"></tfoot></table>
-</div><div class="footer-info" id="footerInfo">총 0건</div></div>
-<script>
-const DATA={{ processed_json | safe }};const MONTHS={{ months_json | safe }};const CORPORATIONS={{ corporations_json | safe }};const ALL_PURPOSES={{ all_purposes_json | safe }};
-function f(v){return(v!=null&&v!=="")? v:"-";}
-function deleteRow(id){if(!confirm("삭제?"))return;fetch("/delete/"+id,{method:"POST"}).then(r=>r.json()).then(d=>{if(d.success)location.reload();});}
-function updateFilterCorps(){const p=document.getElementById('fp').value,s=document.getElementById('fc');let corps=[];if(p&&CORPORATIONS[p])corps=CORPORATIONS[p];else{const a=new Set();Object.values(CORPORATIONS).forEach(x=>x.forEach(c=>a.add(c)));corps=[...a].sort();}const cur=s.value;s.innerHTML='<option value="">'+tl('전체','All')+'</option>';corps.forEach(c=>{const o=document.createElement('option');o.value=o.textContent=c;s.appendChild(o);});if(corps.includes(cur))s.value=cur;}
-function renderTable(data){
-  const tb=document.getElementById("tableBody"),tf=document.getElementById("tableFoot");
-  let out="",tot={base:0,opt:0,opa:0,sgt:0,sga:0,r:[0,0,0,0,0,0,0,0,0]};
-  const _LP={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
-  const _TP={'확장':'Expansion','경상':'Recurring'};
-  const _PP={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
-  const _en=localStorage.getItem('app_lang')==='en';
-  function _t(v,map){return _en?(map[v]||v):(v||'-');}
-  data.forEach(r=>{
-    const rid=r[0],prod=r[2]||"";let h="<tr>";
-    h+="<td class='sc c0'><div class='row-actions'><a href='/edit/"+rid+"' class='icon-btn icon-edit'>✏️</a><button class='icon-btn icon-del' onclick='deleteRow("+rid+")'>🗑️</button></div></td>";
-    h+="<td class='sc c1'>"+_t(r[2],_LP)+"</td><td class='sc c2'>"+f(r[3])+"</td><td class='sc c3'>"+_t(r[1],_TP)+"</td><td class='sc c4 left'>"+f(r[5])+"</td><td class='sc c5'>"+_t(r[4],_PP)+"</td>";
-    h+="<td>"+f(r[6])+"</td><td>"+f(r[7])+"</td><td>"+f(r[8])+"</td><td>"+f(r[9])+"</td><td>"+f(r[10])+"</td><td>"+f(r[11])+"</td><td class='left'>"+f(r[12])+"</td>";
-    const base=parseFloat(r[13])||0,opt=parseFloat(r[14])||0,opa=parseFloat(r[15])||0,sgt=parseFloat(r[16])||0,sga=parseFloat(r[17])||0;
-    tot.base+=base;tot.opt+=opt;tot.opa+=opa;tot.sgt+=sgt;tot.sga+=sga;
-    h+="<td>"+f(r[13])+"</td><td>"+f(r[14])+"</td><td>"+f(r[15])+"</td><td>"+f(r[16])+"</td><td>"+f(r[17])+"</td>";
-    for(let i=18;i<=26;i++){tot.r[i-18]+=(parseFloat(r[i])||0);h+="<td>"+f(r[i])+"</td>";}
-    h+="<td class='act-cell'>"+f(r[28])+"</td>";
-    const rTgt=(prod==="ES")?50:30;let rAct="-",rActNum=null;
-    if(base>0&&sga>0){rActNum=(sga/base)*100;rAct=rActNum.toFixed(1);}else if(base>0){rActNum=0;rAct="0";}
-    let sig="s-x";if(rActNum!==null)sig=rActNum>=rTgt?"s-g":"s-y";
-    h+="<td>"+rTgt+"%</td><td>"+(rAct!=="-"?rAct+"%":"-")+"</td><td style='text-align:center'><span class='sig "+sig+"' style='display:inline-block'></span></td></tr>";
-    out+=h;
-  });
-  tb.innerHTML=out;
-  const _tl=localStorage.getItem('app_lang')==='en'?'Total':'합계';let foot="<tr><td colspan='6' style='text-align:center;background:#fef9c3;font-weight:700'>"+_tl+"</td><td colspan='7' style='background:#fef9c3'></td>";
-  foot+="<td>"+tot.base.toFixed(2)+"</td><td>"+tot.opt.toFixed(2)+"</td><td>"+tot.opa.toFixed(2)+"</td><td>"+tot.sgt.toFixed(2)+"</td><td>"+tot.sga.toFixed(2)+"</td>";
-  tot.r.forEach(v=>{foot+="<td>"+v.toFixed(2)+"</td>";});foot+="<td colspan='4' style='background:#fef9c3'></td></tr>";
-  tf.innerHTML=foot;document.getElementById("footerInfo").textContent=(localStorage.getItem("app_lang")==="en"?"Total "+data.length+" items":"총 "+data.length+"건");
-}
-function applyFilter(){const fp=document.getElementById("fp").value,fc=document.getElementById("fc").value,ft=document.getElementById("ft").value,fpu=document.getElementById("fpu").value;renderTable(DATA.filter(r=>(!fp||r[2]===fp)&&(!fc||r[3]===fc)&&(!ft||r[1]===ft)&&(!fpu||r[4]===fpu)));}
-function downloadExcel(){const wb=XLSX.utils.book_new();const h=[["제품","법인","유형","항목","목적","발주목표","발주실적","셋업목표","셋업실적","양산목표","양산실적","연기사유","Base","발주가목표","발주가실적","절감목표","절감실적","①","②","③","④","⑤","⑥","⑦","⑧","⑨","활동","목표%","실적%"]];const rows=DATA.map(r=>{const b=parseFloat(r[13])||0,s=parseFloat(r[17])||0,rt=(r[2]==="ES")?50:30;let ra="-";if(b>0&&s>0)ra=((s/b)*100).toFixed(1);else if(b>0)ra="0";return[r[2],r[3],r[1],r[5],r[4],r[6],r[7],r[8],r[9],r[10],r[11],r[12],r[13],r[14],r[15],r[16],r[17],r[18],r[19],r[20],r[21],r[22],r[23],r[24],r[25],r[26],r[28],rt,ra];});const ws=XLSX.utils.aoa_to_sheet([...h,...rows]);XLSX.utils.book_append_sheet(wb,ws,"투자실적");XLSX.writeFile(wb,"설비투자비_"+new Date().toISOString().slice(0,10)+".xlsx");}
-function setLang(l){localStorage.setItem('app_lang',l);document.getElementById('langKo2').classList.toggle('active',l==='ko');document.getElementById('langEn2').classList.toggle('active',l==='en');applyLang();initListFilters();applyFilter();}
-function applyLang(){const l=localStorage.getItem('app_lang')||'ko';document.getElementById('langKo2').classList.toggle('active',l==='ko');document.getElementById('langEn2').classList.toggle('active',l==='en');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});}
-const LP={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
-function tl(ko,en){return(localStorage.getItem('app_lang')==='en')?en:ko;}
-function initListFilters(){const l=localStorage.getItem('app_lang')||'ko';const fp=document.getElementById('fp'),cfp=fp.value;fp.innerHTML='<option value="">'+tl('전체','All')+'</option>';['키친','빌트인쿠킹','리빙','부품','ES'].forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(LP[p]||p):p;fp.appendChild(o);});if(cfp)fp.value=cfp;const ft=document.getElementById('ft'),cft=ft.value;ft.innerHTML='<option value="">'+tl('전체','All')+'</option>';const o1=document.createElement('option');o1.value='확장';o1.textContent=tl('확장','Expansion');ft.appendChild(o1);const o2=document.createElement('option');o2.value='경상';o2.textContent=tl('경상','Recurring');ft.appendChild(o2);if(cft)ft.value=cft;updateFilterCorps();const _PP2={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};const fpu=document.getElementById('fpu'),cfpu=fpu.value;fpu.innerHTML='<option value="">'+tl('전체','All')+'</option>';ALL_PURPOSES.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(_PP2[p]||p):p;fpu.appendChild(o);});if(cfpu)fpu.value=cfpu;}
-window.onload=function(){applyLang();initListFilters();renderTable(DATA);}
-</script></body></html>"""
-
-# ===== LOGIN TEMPLATE =====
-LOGIN_TPL = r"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>로그인 | 설비투자 한계돌파 시스템</title>
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
-
-* { margin: 0; padding: 0; box-sizing: border-box; }
-
-body {
-    font-family: 'Noto Sans KR', sans-serif;
-    /* 트렌디하고 은은한 배경 그라데이션 (하얀 카드와 대비를 줌) */
-    background: linear-gradient(135deg, #fdfbfb 0%, #ebedee 100%);
-    height: 100vh;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-}
-
-.login-card {
-    background: #ffffff;
-    border-radius: 30px;
-    padding: 55px 45px;
-    /* 요즘 유행하는 부드럽고 깊은 그림자 효과 */
-    box-shadow: 0 15px 35px rgba(50, 50, 93, 0.1), 0 5px 15px rgba(0, 0, 0, 0.07);
-    text-align: center;
-    width: 100%;
-    max-width: 440px;
-}
-
-.logo-area {
-    margin-bottom: 25px;
-}
-
-.logo-area img {
-    height: 85px;
-    width: auto;
-}
-
-.system-title {
-    font-size: 25px;
-    font-weight: 700;
-    color: #1a202c; /* 기존보다 조금 더 세련된 진회색 */
-    margin-bottom: 8px;
-    letter-spacing: -1px;
-}
-
-.system-subtitle {
-    font-size: 13px;
-    color: #718096;
-    font-weight: 500;
-    text-transform: uppercase;
-    letter-spacing: 1px;
-    margin-bottom: 40px;
-}
-
-.form-group {
-    margin-bottom: 24px;
-    text-align: left;
-}
-
-.form-label {
-    display: block;
-    font-size: 13px;
-    font-weight: 700;
-    color: #4a5568;
-    margin-bottom: 8px;
-    margin-left: 4px;
-}
-
-.input-field {
-    width: 100%;
-    padding: 16px 20px;
-    border-radius: 12px;
-    border: 1px solid #e2e8f0;
-    font-size: 15px;
-    background: #f7fafc; /* 깔끔하고 연한 배경 */
-    color: #2d3748;
-    transition: all 0.3s ease;
-}
-
-.input-field:focus {
-    outline: none;
-    background: #ffffff;
-    border-color: #a50034; /* LG 브랜드 컬러로 포커스 포인트 */
-    box-shadow: 0 0 0 3px rgba(165, 0, 52, 0.15);
-}
-
-.login-btn {
-    width: 100%;
-    padding: 18px;
-    border: none;
-    border-radius: 12px;
-    /* 버튼에 고급스러운 LG Red 그라데이션 적용 */
-    background: linear-gradient(135deg, #c0003c 0%, #8a002b 100%);
-    color: white;
-    font-size: 17px;
-    font-weight: 700;
-    letter-spacing: 1px;
-    cursor: pointer;
-    transition: all 0.3s ease;
-    margin-top: 10px;
-    box-shadow: 0 4px 12px rgba(165, 0, 52, 0.3);
-}
-
-.login-btn:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 6px 16px rgba(165, 0, 52, 0.4);
-}
-
-.footer-text {
-    margin-top: 45px;
-    font-size: 12px;
-    color: #a0aec0;
-}
-
-/* 에러 메시지도 조금 더 시스템 알림창처럼 예쁘게 수정 */
-.error-msg {
-    background: #fff5f5;
-    color: #c53030;
-    padding: 12px;
-    border-radius: 8px;
-    font-size: 13px;
-    font-weight: 500;
-    margin-bottom: 20px;
-    border: 1px solid #fed7d7;
-}
-</style>
-</head>
-<body>
-
-<div class="login-card">
-    <div class="logo-area">
-        <img src="data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAUDBAQEAwUEBAQFBQUGBwwIBwcHBw8LCwkMEQ8SEhEPERETFhwXExQaFRERGCEYGh0dHx8fExciJCIeJBweHx7/2wBDAQUFBQcGBw4ICA4eFBEUHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh7/wAARCADnAQMDASIAAhEBAxEB/8QAHQABAQACAwEBAQAAAAAAAAAAAAgGBwQFCQMBAv/EAFEQAAEDAwEEBQQLDQUHBQAAAAEAAgMEBQYRBwghMRJBUWFxExQigRUyNkJikZKhsbLRFiNDU1VydHWClLPBwhckM1KiJTRWY3OTtMPS4fDx/8QAHAEBAAEFAQEAAAAAAAAAAAAAAAIBAwUGBwQI/8QAOxEAAgECAwQIAwUIAwEAAAAAAAECAwQFBhEhMUFREmFxgZGhscEiMjUTFSPR8BQWQlJUgqLiYsLhsv/aAAwDAQACEQMRAD8AstERAEREAREQBERAEREAREQBERAEREAREQBERAEREAREQBERAEREAREQBERAEREAREQBERAEREAREQBEXBvt4tditstyvFfT0NJENXyzPDQO7vPcOJQlGMpyUYrVs5y+NZVUtFTPqayohp4GDV0krw1rfEngp12j7yscfTocHoBI7ka+sb6P7Ef83fEtBZbl+S5XVCoyC8VVcWnVjHv+9s/NYOA9QU1Bs3HDck3tylOu/s49e1+HDvfcWBle3TZ1YA5guz7pUN/A0EflD8o6M+da1vW9HIXObZsUaG+9fV1Op+Jo/mptRTUEbla5LwygvjTm+t+y0NzXHeR2g1BIporRRt6uhTFx+NziPmXTy7e9qb3EtyOOMdjaCn/mwrWKKvRRl4YDhsFoqEe9J+ptCDb7tSjdq/IIZh2PoIB9DAu6t28rnkBAq6SzVjRzJgcxx9Ydp8y0qidFFKmAYZUWjoR7kl6FM2Peipy5rb5isrB759HUBxH7LgPpWzsV2zbO8hDG09+jop3fgK5phcD2an0T6iVDCKLgjDXeScNrL8NOD6nr5PX2PSeGSOaJssUjJI3DVrmnUEdoK/pefuFZ/l2HyD2BvVTTwdLpOpnO6cLj3sPD1jiqE2b7yFouIjocypBa6k8PPIAXQO73N4uZ848FFwaNMxPJl9aJzo/iR6t/h+Wpv5F8KCspK+jirKGphqqaVodHLE8PY8HrBHAr7qBqLTT0YREQoEREAREQBERAEREAREQBERAEREARFofeB22sx4zYziU7JbvxZVVQGraX4Le1/wBHiqpanvw7Da+I11RoLV+SXNmV7YtsViwGJ1FCG3K9uHo0jHejF2GQ9Q7uZ7uakXOs1yPNbo6vv9wfP6RMcDfRihHYxvV48T2kroKmeapqJKiolfLNI4ue97tXOJ5kk8yv4V1RSOx4Ll21wqOsV0p8ZP25L9MIs72ZbKsrzyRs1vpRS23pdF9fUAtjGnPo9byOweshU/s82H4VifkqmWk9mbizQ+c1jQ5rXdrY/aju11I7UckiOLZnssNbhJ9KfJe73L16iUcR2b5tlRYbLj9XLC78PIBFEB29J2gPq1W2cf3X7vK1r77klHS6+2jpInSket3RHzLfOZbQsNw4GK93ulp52t1FLGenNp1eg3iB46LUOVbz9vhc6LGccnquYE9bKI29xDG6kjxIUelJ7jWFjmP4ptsqXQjz095bPBHdWrdnwenDXV1xvVc8cx5VkbD6g3X51kNPsF2WRMDX42+Yj3z6+o1+Z4C0Lc94zaHVOJpnWyib2RU3S+dxK6ObbftQlcT91MrB2MpoQPqJ0ZEngeZK+2dz0f7mv/lHdb0WG43hmS2mkxq2iggqKN0krfLSSdJweRrq9xI4di1Au8zDLsiy6rgqsjub6+aCPycT3sY3ot1109EDrXRqa3G8YXb17e0hSuJdKa3vVvXbze0IiKp7wiIgMy2abSsnwOvbLaqsy0RdrNQzEuhkHXw96e8fPyVf7KdpuPbQbd06CTza4xj+8UMpHlGd4/zN7x69FBy5dmudfZrnBc7XVS0tZTvD4pYzoWn/AO9SjKKZrOOZZtsUi5r4anPn28+3eejyLUuwbbBR51SstF2dHS5DE3VzBwZUtHv2d/a34uHLbStNaHHr6xr2NZ0a8dJL9arqCIioeQIiIAiIgCIiAIiIAiIgCIsK2y53SYBhs9zeWvr5tYqGA/hJD1n4LeZ+LrRbS/bW9S5qxo0lrKT0Rg28ptZ+5Wifi9gnIvdTHrNOw/7pGf6yOXYOPYpFke+R7nvc5z3ElznHUk9pXIutfWXS5VFxuFRJUVVTIZJZXnVznE6krjAEnQcSr6Wh3LBMHpYVbqlDbJ/M+b/LkfrWue4Na0ucToABqSVRuw3YH5yynyLOYHNicA+C2O1Bd2Ol6wPg/H2LuN2/Y2y2w0+YZXSB1e8dOhpJBwgB5SOH+c9QPLnz5Zzts2sWvZ9bjTQeTrb7MzWCk6XCMH38mnIdg5n51Fy12I1bG8w3F5X+78L2t7HJeej4JcX4GSZhlmL4BYG1F1qYKGmjZ0KemiaOm/Tk1jB/+Dr0Uv7Tdv2UZK99HYXOsVsOo+9O1nlHwn+98G6eJWscryK85TeprvfK6WrqpTzcfRYOprRya0dgXVIoJGTwbKNtZJVLj46nXuXYuPa/I/qaWSaV8s0j5JHnpOe92pce0k81/KIpm3bgiIhUIiIAiIgCIiAIiID726tq7dXQ11DUSU1TA8Piljdo5jhyIKtTYFtQp8/sJpa0tivtEwCqj5CYcvKtHYesdR9SiRdvh2RXLFcko77apjHU0r+kBrwe33zHdoI4FRlHUwGYMDp4rb9HdNfK/Z9T/wDT0SRdDgOU27MsVo7/AGx+sVQz04z7aKQe2Ye8H7V3ysnEKtKdKbpzWjWxoIiIWwiIgCIiAIiIAiIgPx7msYXuIa1o1JPUFDO3zOpc4zuonik1tdETT0LByLQeL/Fx1PhoOpUjvQ5c/GNm01JSzeTrru40kRB0cI9PvhH7PD9pRYrkFxOl5FwpKMr6a2vZH3ft4hb13WtmLchuf3XXyl6dqopOjSRSDhPMND0tOtrfiJ4dRC1NgWN1mXZbb8foj0ZKuUNdJpqI2Di558BqVd8UdkwTCA0FtLarRSakn/K0c+9xPxkqs3psMpm/GZ2tFWlB/iVOW9Ld4vcu8x3bdtHotnuMmZpZNd6oFlDTnt04vd8EfOeCiK93S4Xq61F0ulVJVVlQ8vlledS4/Z3LudpmYXHOMuq77XuIa93Qp4eqGIe1aPpPaSSsaVYx0MhlzAoYVbrpL8SXzP2XUvNhF3eDYzcswyejsFqj6VRUu4vI9GNg4ue7uA+xWDg2w/AsbomCptMN6rS3SSor2CQE/BYfRaPVr3o5JFzGcxWuE6RqauT4L1fIiNFbucbEMCySie2mtMNmrQ3SOooGCMA/CYPRcPVr3qPs7xe54dk9XYLtGGz07vRe32srD7V7e4j7OpFJMYNmK1xbWNPVSXB+q5nRoio/dCxrHr7Yb9LerHbbk+KqibG6qpmSlgLTqB0gdFVvRHtxbEo4bayuZx1S02LrehOCLd293Y7NYsrssNltNDbYpKFznspYGxBx8oRqQ0DUrSKJ6ouYdexv7WFxFaKXAIiKp7giIgCIiAIiIDc26rnkmOZiMcrZv9l3dwY0OPCKo5McO4+1PiOxWGvNeN745GyRucx7SC1zToQR1hXtsXyz7s9nVtvEkgfVhnkKvT8czg4nx4O9atzXE5fnrClTqRvaa2S2S7eD71s7jMkRFbOehERAEREAREQBEXGu1bDbbXV3GoOkNLC+Z/5rWkn6EKxi5PREdb1uSPve1Ga3slLqW0RCmY0HgHn0nnx1IH7IWpFy71cKi7XisulW7pVFZO+eU9rnOJP0rjQxvmmZDE0vke4Na0cyTwAV9LRH0Jh9pGytKdBfwpL8/Mp7c1xGOG2XDMqqLWaocaSkJHtYxxeR4nQfsntXH3yMy6ENFhFHN6UgFXXBp6tfvbD6wXadzVvLAbHTYngtqsrC1jKGkaJX8gX6avd63FxUK7R8gflOc3e+ucXNqqlzoteqMcGD5IChHbLU0HA4/fOOVb2e2MN3pHyTfaY+iIrh0soTcnp6d2R5BVODTUR0kbGdoa55Lvna34lUqgvYvnU2AZtDdyx0tFK0wVsTeboiQdR3ggEeBHWrgxrILLklsjuVjuNPXUzwD0onalvc4c2nuPFWprachztY16d+7hrWEktHy0Wmnudopb316enbkOP1LQBUSUsjH9paHDT6SqRyS/2bHLbJcb3caehpmDUulfpr3Acye4KINtWdyZ/ms12bG6GhhaIKOJ3MRg8z3kkn4h1JBbRkmxr1L9XCWkIp6vnqtNPcwhVJuS+53I/0uL6hUtqpNyX3O5H+lxfUKnPcbrnL6RU7Y+qMZ31vdjYf1e7+IVoFb+31vdjYf1e7+IVoFI7j1ZX+k0ex+rCIikZ8IiIAiIgCIiAKgdzHJH02R3TF5ZT5GthFTCwngJGcHaeLSPkhT8sn2UX1+N7RrFeGv6LIaxjZv+k89B/+lxVGtUYrG7L9tsKtHi1s7VtXmegSIOI1CKwcCCIiAIiIAiIgCwTeAuBtux/Iqhrui59N5EHve4M/ms7Wn97uqNPsgfEDp5zXwRHv06T/AOhVW8yeC0vtcQowfGS9SNll2xi1i87VMct7m9Jj61kjx8Fmr3fM0rEVt7dGom1W2CKcjU0dDPMO4kCP/wBQq89x23F67oWFaot6i/HTYUpt4uzrNskyGqjeWSSUhp2EHQgyeh9DioNVib4NWafZMyEHTzq5QxHv0a9/9CjtRhuNbyJRUMPlU4yk/JL/ANCIimbsFyLdX19uqW1Nvramjnb7WSCV0bh4EHVcdEKOKktGcm43CvuNS6puFbU1k7vbSTyukcfEk6rjIiFIxUVogqk3Jfc7kf6XF9QqW1Um5L7ncj/S4vqFRnuNYzl9IqdsfVGM763uxsP6vd/EK0Ct/b63uxsP6vd/EK0Ckdx6sr/SaPY/VhERSM+EREAREQBERAF+scWPa9p0LTqF+IhQ9EsKrvZPD7PcddfOaGGXXt1YCu3WC7v9UazY3jMpOpbSeS+Q9zP6VnS87Pni+pfY3NSnyk14MIiIeUIiIAiIgC0jvna/2W2/Tl7NRa/9mZbuWnd76mM+yIyga+b3GCU92ocz+tVjvMzl2SjilBv+ZEcLeG5jp/abcT1+xEmn/diWj1uHdCrG0214Qk6Grt88IHaQWv8AoYVeluOv5ii5YXXS/lZtLfT6X9nloHvfZZuvj5GT/wCVJisLfEpTPsohmA182ucMh7gWvZ/Uo9UYbjF5JknhaS4SYREUzbgiIgCIiAKpNyX3O5H+lxfUKltVJuS+53I/0uL6hUZ7jVs5fSKnbH1RjO+t7sbD+r3fxCtArf2+t7sbD+r3fxCtApHcerK/0mj2P1ZkezBjJNouPMkY17HXGEFrhqCOmFfHsPaPyXQ/u7fsXnICQdQSCOtfTzif8dJ8opKOp5sfy7LFqkJxq9DorTdr7o9F/Ye0fkuh/d2/YnsPaPyXQ/u7fsXnR5xP+Ok+UU84n/HSfKKj0OswH7hVP6n/AB/2PRf2HtH5Lof3dv2J7D2j8l0P7u37F50ecT/jpPlFPOJ/x0nyinQ6x+4VT+p/x/2PRf2HtH5Lof3dv2J7D2j8l0P7u37F50ecT/jpPlFXPu9U76bY1jjJCS59O6XUnj6cjnfzVJR0MHj2XJ4RQjVdfpavTTTTg3zfIlneTihh215BFTxMijaYAGMaGgf3ePqC10s329Vja7bFk87XahtaYde+MBh+qsIVxbjqeFRcbGinvUI+iLg3Y9f7Dsd17Kj/AMmVbJWB7vdMaTYzjURGhdSmX5cjn/1LPFZe84bi8lK/rtcZy9WERFQx4REQBERAFgG8NbzcdjmQwtb0nRwNnA/Me138ln64d8t8V1stba5/8Orp3wO7g5pH81VHpsq/7PcU6v8AK0/B6nnEsz2HXQWfa1jlc53RYKwRPPY2QGM/M5Ypc6Oot1xqbfVsMdRTTPhlafeuaSCPjC+dLPJTVMVTC7oyxPD2HsIOoKv7z6BuKUbmhKnwkmvFF07wNqN32QZBAxvSfDTectH/AEyHn5gVCS9DsTulHleF2+6ta2SmuVG1z2HiPSbo9h8DqD4KC87sUuM5hdbFKHa0dS+NpdzczX0T6xoVbhyNFyJcOCrWc9kovX2fhojpURFcOhBERAEREAVSbkvudyP9Li+oVLaqTcl9zuR/pcX1Coz3GrZy+kVO2PqjGd9b3Y2H9Xu/iFaBW/t9b3Y2H9Xu/iFaBSO49WV/pNHsfqwiIpGfCIiAIiID9Y1z3tY0EucdAB1leh+L0TMewu3UMujG0FCxsnd0GDpfQVF275jv3SbVrPTSR9OnpJfPJxpqOjH6QB7i7oj1qr9vuQsxvZTeqzp9Geoh80pxrxL5PR4eA6TvUrc9r0OcZ0qO7u7ewhve3xei9yH8irnXPILjcnnV1XVyzuPe95d/NcFoLnBoGpJ0CLItmlkkyPP7HZo2lwqayMSadUYPSefU0OPqVw6DOcLei5PYorySLtwOh9jMJslu0082oIY9PBgC7pGgNAaBoBwARec+dqs3Um5vi9QiIhAIiIAiIgCIiAirekx11i2r1lS2Mtp7qxtZGdOBceDx49IE+tarVk712JOyHZ0btTRdOssrnVA0HHyJAEg9QAd+yo2V6L1R2/KuIK9w6GvzQ+F927xWhVe5vlkdbjddiVRMPObfJ5xTNJ4uhefS0/Ndz/PC6HfIw3yVZQ5tRxaNmApK7QcOkP8ADefEat9TVpbZlldRhea2/IIGueyCTSeNp0MkR4Pb46cu/RXPdaKyZ3hEtLIWVdru1KCx4GvAjVrh2EHQjsIUX8L1NWxiM8CxqN/Bfhz3/wDZf9l1nnoi7vOsYuWIZRWWG6RFk1O/0XaejKw8Wvb2gj+Y6l0iuHSKVWFWCqQeqe1MIiIXAiIgCqTcl9zuR/pcX1CpbVL7m12tVux/IGXC50VG59VEWCedsZcOgeWp4qM9xrGcIuWE1FFa7Y+qODvk2y5V2XWN9Fb6uqa2gcHOhhc8A+UPA6BaJ+56/wD5Duf7o/7Ff/3T4z/xDaP32P7U+6fGf+IbR++x/aoKTSNPwzNdzYWsLZW+vR46vn2Hn7NYr3DE6Waz3GONg1c51M8ADtJ0XXq7tqORY9Ps5yCGC+2uWV9vmaxjKuMuceieAAPFQipxepu+AYzUxWnOdSn0Oi9P1sQREUjYAiLNtjGC1We5pT21sbxb4CJq+YcAyIHlr2u5D1nqKPYWLm4p21KVaq9IxWrKA3QsN9iMRqMpq4iKu7ENg6Q4tp2nhp+c7U+AasM3yssjrL5b8RpJem2hb5zVgHgJXj0WnvDeP7YVC5ffbTgmE1F0njZDRW6nDIII9G9IgdFkbR1a8B3KBchu1Zfb5W3ivf06qsmdNIe8nXQdw5K3Ha9TnuWqNTFsTqYpVWxbu3cl3Lz0OCt87muOurcwuORyxnyNup/IxuI4eUk7O8NB+PvWhhxOgV3bB8Sdh2zW3W2eLyVbODVVYI0IleBwPeAGt9SlN6IzucsQVrhzpr5qmzu4+WzvM7REVk4yEREAREQBERAEREB/M0Uc0L4ZWNfHI0te1w1DgeBBUH7bMInwXO6u2+TPmE5M9DJ1OiceXi06tPhr1q8lr7bts+hz7DpKeFrW3aj1moZO12nFh7ncu46FSi9GbNlbGfuy70qP8Oex9XJ93oQuqI3UNpjaGobgt8qmtppnF1tlkOgY884tew8x36jrCnyrp56SrmpKqJ8M8L3RyxvGjmOB0II6iCvnG90b2yMcWvaQWuB0IPaFda1R1rFMOo4nayoVNz3Pk+DX63Fs7f8AZjDn2PipoWtjvtC0mlk5eWb1xOPYeo9R7iVFddSVNDWTUdbTyU9TC8slikaWuY4cwQeSrfd12wQ5VRQ41kVSyO+wt6MMrjoKxoH1x1jr59q5+3nY5R5xTvvNmEVJkMTPbHgyqA96/sd2O9R4coJ9HYzRcFxetgVw8OxDZDg+X+r8n3kZouZe7XcLLdai13WklpKynd0ZYpG6OafsI4g9YXDVw6VGSklKL1TCIiEgiIgCIiAIiIAiLucNxe9Zde47PYqJ9TUv4u04Njb1ucepo15oW6lSFKDnN6Jb2z4YzY7nkl8prNZ6V9TWVLw1jGjl2uJ6gOZJ5K5dkuCW3Z7icdsp3Nkqn/fa2qPAyv8A5NHIDsHaSuBsa2X2jZ5afQ6NXeKhg87rCP8AQzsaD6z19Wmrt5bbEwRVGF4pVh7nax3GsiPIcjEw9v8AmPq7Vbb6T0RzPE8Qr5lulY2WykntfPrfVyXH0wneZ2l/dhkIsVoqA+x22QgOYfRqZuRfr1tHIes9YWnkXYY5ZrhkF8pLNa4HT1lXII4mDt6yewAaknqAKmlojoVlaUMNtVShsjFb/Vs2VuxYI/K85ZdauHpWm0ObNKXD0ZJebGd/EdI9w7wrPWM7McOoMGxCksVD6bmDp1ExGhmlPtnH6AOoALJlak9WcZzFi7xS8dSPyLZHs594REUTAhERAEREAREQBERAEREBP+89smdeIpc0xynLq+JmtfTRt1M7R+Ebp74DmOseHGViCDoeBXpSpy3hNiDqqSoyvDKXWdxMlbb4x7btfGO3tb8XYrkZcGdFypmhU0rK7ez+GT9H7PuJnpp5qaojqKeV8M0Tg9kjHaOaRyIPUVUmw3bzTXNlPj2bVDKevHoQ3F5DY5uwSdTXd/I9xUsPa5jyx7S1zToQRoQV+KbSZu+LYPbYpR+zrLbwa3r9ci+NpGzzGNoFsEV2pgKlrNKeuh0EsXZoffN7jqFKe0zYrl+GOfVR0zrvawTpVUrCSwfDZzb48R3r7bKttuT4SyO31JN4s7Twpp3npxD/AJb+JA7jqPBVFgO1DDc2jYy1XNkdY8caKp0jmB7ANdHfskqG2Joq++csvRL7Sj5fnH07SCyCDoRoQiuvOdkOC5c91RXWhlJWnnVUX3l5/OA9F3iQStP5Ruv18fSkxrI6eca8Ia6MxnT89muvyQqqaNisc6YdcJKq3B9e7xXvoToi2VdNhe0ygLv9gCqaDwdTVDH6+A11+ZdLLsu2hxnR+IXb1Q6/Qpaoz1PFbGotY1ov+5fmYeizKHZZtElOjMQuvri0+ld/aNge0u4PaH2iChYeb6qpa0DxA1PzJqilTFrGktZ1or+5Grl/UUcksjY4mOe9x0a1o1JPcFSuLbr7GhkuTZJ0ne+goIuHh038T8kLcmD7NsNw2MewtlgbUe+qph5WY/tu4jwGg7lFzRr19nbD7dNUdaj6ti8X7Jkz7MNgOT5N5Kvv4fYrY46/fG/3iRvwWe98XfEVUmJ4zjGB2B1LaqaC30cbenPPI7i/Qe2e88/oCxraLtmwzDo5oHVoulyZqBR0bg4h3Y93Jvf19xUtbUdq+U57L5GtqPMrY06soadxEfi883nx5dQCpo5GBVtjGZZKVb8Oj4LuW+T63sNl7ddvLq9k+OYRO+OmJLKi5N4OlHItj7G/C5nqU7kkkknUlF9qGlqa6sio6OCSoqJnhkcUbek57jyACmkkb9huGW2GUPs6K0XF8X1tn8QQy1E7III3yyyODWMYNXOJ5ADrKsjd02Vtwi0+zN4ja6/VsY6TSP8AdYzx8mPhHrPq6uPA3fdjEWJshyTJImS31zdYYCQ5lID9L+/q6u1btVuUtdiOeZrzOrrW0tX8H8T59S6vXs3kRFA0IIiIAiIgCIiAIiIAiIgCIiAIiIDT22jYfacx8rd7F5K13w6ueQ3SGpPwwOTvhD1g8xJuV43e8Wu8lrvtvmoqqM8nj0Xj/M1w4OHeF6Jrp8txew5Xa322/wBtgrYHDh0xo5h7WuHFp7wVOM9DccDzdXsEqNf46fmuzmup+KPO5frHOY8PY4tc06gg6EFUDtG3bbpQiStwytFxgGp8zqHBkwHwXe1d69PWtF3yzXax1porxbqmgqB+DnjLCe8a8x4K4mmdPw/FrPEI6280+rj4bzOcQ22bQsbDI47v7JU7PwNwaZRp2dLUO+dbax7egtksbGX7Gqmmk5OkpJhI09+jtCPDUqXkVHFM8l5lvDbx61KST5rZ6e5a1s2/7MqwDyt4qKFx6qijk+locF31PtZ2bztDmZjagD+Ml6B/1AKC0VOgjB1MhWEnrCcl4P2LxqtrmzambrJmFtcP+W4yfVBWP3TeE2aUgPm9xra9w5CCjeNfW8NUXInQRWnkOwi9Zzk+9L2KYyXehiEb48cxlzpD7Waum0aP2GcT8oLUOY7Ws9ylkkNwvksFLJqHU9J95jI7DpxI8SVgqKSikZ6yy9h1k9aVJa83tfnu7gi7fGcZv+TVfmthtNXXya6HyUZLW+LuQ9ZW/dnG7UfvVdnFcOpxt9I/5nyf+340bSLuI41ZYdHWvPbyW1+H57DR2BYTkWbXZtvsNA+bT/Fnd6MUI7XO5Dw5nqCr3Y9sisWAUzKt4bcb45v3ytezhHrzbGPejq15n5lndis9rsVujt1noKehpIxo2KFgaPE9p7zxXOVqUtTluOZruMS1pU/gp8uL7X7eoREUTVAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAuBfbLaL7QmhvNtpbhTE6+TqIg8A9o15HvC56ISjOUGpRejRpvJ93TA7p05Laa6zTH2vkJOnGD3tfrw8CFrS97sWT07nG032217PeiVroXn1ekPnVXopKTRsFrmrFLZaKr0l/y2+e/wAyJK/YNtOpSQyxR1QHXDVxn6XBdRNsj2kxHR2H3M/mtDvoKvJFXpsy0M+36+aEX4/mQfBsg2lzO0Zh9xB+GGs+khdzb9gO0yqIElnp6QHrnq4+HySVa6J02J59v38sIruf5kr2Hdgvs72uvWR0NGzrbTxOmd85aB862fi+79s9s5ZJV0lVeJm83Vkvok/mt0GnjqtsoqOTZh7vNGKXWyVVpco7PTb5nGttBQ2yijordR09HTRjRkMEYYxvgBwXJRFEwDk5PV7wiIhQIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiID//Z" alt="LG Logo" style="height:85px">
-    </div>
-
-    <h1 class="system-title">설비투자 한계돌파 시스템</h1>
-    <p class="system-subtitle">Facility Investment Management</p>
-
-    {% if error %}
-    <div class="error-msg">⚠️ {{ error }}</div>
-    {% endif %}
-
-    <form method="post">
-        <div class="form-group">
-            <label class="form-label">ID (사번)</label>
-            <input type="text" name="username" class="input-field" placeholder="admin" required>
-        </div>
-        <div class="form-group">
-            <label class="form-label">Password</label>
-            <input type="password" name="password" class="input-field" placeholder="••••" required>
-        </div>
-        <button type="submit" class="login-btn">로그인</button>
-    </form>
-
-    <div class="footer-text">
-        © 2024 LG Electronics. Production Tech. Group.
-    </div>
-</div>
-
-</body>
-</html>"""
-
-if __name__ == "__main__":
-    print("🚀 서버 시작: http://127.0.0.1:5000")
+from flask.json.provider import DefaultJSONProvider
+from flask import Flask, Response, request, redirect, render_template, jsonify, session, g, has_request_context, make_response
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+import click
+from datetime import datetime, timedelta
+import os
+import re
+import math
+import json
+import base64
+import hashlib
+import threading
+import queue
+import select
+import time
+import sys
+import cProfile
+import pstats
+import itertools
+from collections import OrderedDict, deque
+from functools import wraps
+from typing import NamedTuple, Optional
+import csv
+import io
+import zipfile
+import gzip
+from urllib.parse import quote
+from xml.sax.saxutils import escape as xml_escape
+import xml.etree.ElementTree as ET
+
+app = Flask(__name__, static_folder=None)   # 정적 파일은 아래 static_file()에서 해시 URL로 제공
+app.secret_key = "super_secret_key_123"   # 추가
+
+# ===== Supabase PostgreSQL 연결 설정 =====
+# Render 환경변수에 DATABASE_URL을 설정하세요
+# Supabase 대시보드 → Settings → Database → Connection string (URI) 복사
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+
+# ===== 메트릭 (Prometheus 텍스트 형식, /metrics) =====
+# 연결 풀 사용량/대기, 라우트별 응답 시간, SQL 문장별 실행 시간
+# METRICS_DIR을 설정하면 (gunicorn.conf.py가 설정) 워커마다 METRICS_FLUSH초마다 METRICS_DIR/<pid>-<시작>.json에 값을 쓰고
+# 스크랩을 받은 워커가 파일을 모두 합쳐서 응답 — 카운터/히스토그램은 종료된 워커 것까지 합산, 게이지는 살아 있는 워커별(worker 라벨)
+METRICS_DIR = os.environ.get("METRICS_DIR", "")
+METRICS_FLUSH = float(os.environ.get("METRICS_FLUSH", "5"))
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+def _labels(names, values):
+    """('route', 'method'), ('/list', 'GET') → {route="/list",method="GET"}"""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in zip(names, values)) + "}" if names else ""
+
+class Histogram:
+    """라벨 값 조합별 누적 버킷 히스토그램"""
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self.series = {}; self.lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self.lock:
+            s = self.series.get(label_values)
+            if s is None: s = self.series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for i, b in enumerate(self.buckets):
+                if value <= b: s[0][i] += 1
+            s[1] += value; s[2] += 1
+
+    def snapshot(self):
+        """[[라벨 값, 버킷별 개수, 합, 개수], ...] (JSON으로 옮길 수 있는 형태)"""
+        with self.lock:
+            return [[list(lv), list(counts), total, n] for lv, (counts, total, n) in self.series.items()]
+
+    def render(self, series):
+        """series: {라벨 값 튜플: [버킷별 개수, 합, 개수]} (여러 워커의 snapshot()을 합친 것)"""
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for lv, (counts, total, n) in sorted(series.items()):
+            le = (*self.labels, "le")
+            out += [f"{self.name}_bucket{_labels(le, (*lv, b))} {c}" for b, c in zip(self.buckets, counts)]
+            out += [f"{self.name}_bucket{_labels(le, (*lv, '+Inf'))} {n}",
+                    f"{self.name}_sum{_labels(self.labels, lv)} {total:.6f}", f"{self.name}_count{_labels(self.labels, lv)} {n}"]
+        return out
+
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "요청 처리 시간", ("route", "method", "status"))
+QUERY_LATENCY = Histogram("db_query_duration_seconds", "SQL 실행 시간 (호출 함수, 첫 키워드별)", ("function", "statement"))
+POOL_CHECKOUT = Histogram("db_pool_checkout_seconds", "풀에서 연결을 받기까지 걸린 시간")
+POOL_EXHAUSTED = [0]   # 풀이 비어 연결을 받지 못한 횟수
+HISTOGRAMS = (POOL_CHECKOUT, REQUEST_LATENCY, QUERY_LATENCY)
+METRIC_INFO = {   # 이름: (종류, 설명) — 게이지는 워커별, 카운터는 전체 워커 합
+    "db_pool_connections": ("gauge", "풀 연결 수 (state: in_use=사용 중, idle=대기, max=최대)"),
+    "db_pool_waiting": ("gauge", "연결을 기다리는 요청 수"),
+    "db_pool_exhausted_total": ("counter", "대기 시간(DB_POOL_TIMEOUT) 안에 연결을 받지 못한 횟수"),
+    "db_pool_discarded_total": ("counter", "끊김/수명 초과/유휴 검사 실패로 버린 연결 수"),
+    "query_cache_version": ("gauge", "조회 캐시가 마지막으로 본 데이터 버전"),
+    "query_cache_size": ("gauge", "조회 캐시 항목 수"),
+    "query_cache_maxsize": ("gauge", "조회 캐시 최대 항목 수 (QUERY_CACHE_SIZE)"),
+    "query_cache_hits_total": ("counter", "조회 캐시 적중"),
+    "query_cache_misses_total": ("counter", "조회 캐시 없음 (DB 조회)"),
+    "query_cache_evictions_total": ("counter", "가득 차서 밀려난 캐시 항목"),
+    "query_cache_invalidations_total": ("counter", "데이터 버전이 바뀌어 캐시를 비운 횟수"),
+}
+
+class TimedCursor(psycopg2.extensions.cursor):
+    """execute 시간을 (호출한 함수, SQL 첫 키워드)별로 QUERY_LATENCY에 기록"""
+    def execute(self, query, vars=None):
+        t0 = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            words = str(query).split(None, 2); dt = time.perf_counter() - t0
+            frame = sys._getframe(1)
+            while frame.f_code.co_name == "execute_prepared": frame = frame.f_back
+            statement = words[0].upper() if words else ""
+            if statement in ("PREPARE", "EXECUTE") and len(words) > 1:   # 이름 앞부분 = 원래 문장 종류 (insert_…)
+                statement += ":" + words[1].split("_", 1)[0].upper()
+            QUERY_LATENCY.observe(dt, frame.f_code.co_name, statement)
+            add_phase("sql", dt)
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    ensure_metrics_flusher()   # gunicorn 워커는 fork 뒤 첫 요청에서 시작
+
+@app.after_request
+def remember_status(resp):
+    g.response_status = resp.status_code
+    return resp
+
+@app.teardown_request
+def record_request_latency(exc):
+    start = g.get("request_start")
+    if start is None: return
+    route = request.url_rule.rule if request.url_rule else "(없음)"
+    REQUEST_LATENCY.observe(time.perf_counter() - start, route, request.method, g.get("response_status", 500))
+
+def metrics_snapshot():
+    """이 프로세스의 메트릭 → JSON dict (gauges/counters: [이름, 라벨, 값], histograms: 이름별 Histogram.snapshot())"""
+    ps, cs = _pool.stats(), query_cache.stats()
+    gauges = [*(["db_pool_connections", {"state": k}, ps[k]] for k in ("in_use", "idle", "max")), ["db_pool_waiting", {}, ps["waiting"]],
+              *([f"query_cache_{k}", {}, cs[k]] for k in ("version", "size", "maxsize"))]
+    counters = [["db_pool_exhausted_total", {}, POOL_EXHAUSTED[0]], ["db_pool_discarded_total", {}, ps["discarded"]],
+                *([f"query_cache_{k}_total", {}, cs[k]] for k in ("hits", "misses", "evictions", "invalidations"))]
+    return {"pid": os.getpid(), "started": _metrics_proc["started"], "gauges": gauges, "counters": counters,
+            "histograms": {h.name: h.snapshot() for h in HISTOGRAMS}}
+
+_metrics_proc = {"pid": None, "started": 0}   # 스냅샷 파일을 쓰는 프로세스 (fork 뒤에는 pid가 달라짐)
+_metrics_proc_lock = threading.Lock()
+
+def ensure_metrics_flusher():
+    """METRICS_DIR이 있으면 이 프로세스의 스냅샷을 METRICS_FLUSH초마다 쓰는 스레드를 프로세스마다 한 번 시작"""
+    if not METRICS_DIR or _metrics_proc["pid"] == os.getpid(): return
+    with _metrics_proc_lock:
+        if _metrics_proc["pid"] == os.getpid(): return
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        _metrics_proc.update(pid=os.getpid(), started=time.time_ns())   # pid가 재사용돼도 이전 프로세스 파일을 덮어쓰지 않게
+        threading.Thread(target=_flush_metrics_loop, name="metrics-flush", daemon=True).start()
+
+def _flush_metrics_loop():
+    while True:
+        time.sleep(METRICS_FLUSH)
+        try:
+            write_metrics_snapshot()
+        except OSError as e:
+            app.logger.warning("메트릭 스냅샷 저장 실패: %s", e)
+
+def write_metrics_snapshot():
+    """METRICS_DIR/<pid>-<시작>.json을 임시 파일 + os.replace로 교체 (읽는 쪽이 쓰다 만 파일을 보지 않음)"""
+    ensure_metrics_flusher()
+    path = os.path.join(METRICS_DIR, f"{os.getpid()}-{_metrics_proc['started']}.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(metrics_snapshot(), f)
+    os.replace(path + ".tmp", path)
+
+def read_metrics_snapshots():
+    """모든 워커의 스냅샷 (자기 것은 방금 값으로 다시 씀)"""
+    write_metrics_snapshot()
+    snaps = []
+    for name in os.listdir(METRICS_DIR):
+        if not name.endswith(".json"): continue
+        try:
+            with open(os.path.join(METRICS_DIR, name), encoding="utf-8") as f:
+                snaps.append(json.load(f))
+        except (OSError, ValueError):
+            continue   # 그 사이 지워진 파일
+    return snaps
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0); return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+def render_metrics():
+    snaps = read_metrics_snapshots() if METRICS_DIR else [metrics_snapshot()]
+    live = {}   # pid → 가장 최근에 시작한 프로세스의 스냅샷 (같은 pid의 이전 파일은 종료된 워커)
+    for s in snaps:
+        if _pid_alive(s["pid"]) and s["started"] >= live.get(s["pid"], {"started": -1})["started"]: live[s["pid"]] = s
+    values = {}   # (이름, 라벨 튜플) → 값
+    for s in snaps:
+        for name, labels, v in s["counters"]:
+            key = (name, tuple(labels.items())); values[key] = values.get(key, 0) + v
+    for s in live.values():
+        for name, labels, v in s["gauges"]:
+            values[(name, (*labels.items(), ("worker", str(s["pid"]))))] = v
+    out = []
+    for metric, (kind, help) in METRIC_INFO.items():
+        out += [f"# HELP {metric} {help}", f"# TYPE {metric} {kind}"]
+        out += [f"{metric}{_labels([k for k, _ in labels], [v for _, v in labels])} {v}"
+                for (name, labels), v in sorted(values.items()) if name == metric]
+    for h in HISTOGRAMS:
+        series = {}
+        for s in snaps:
+            for lv, counts, total, n in s["histograms"].get(h.name, []):
+                cur = series.setdefault(tuple(lv), [[0] * len(h.buckets), 0.0, 0])
+                cur[0] = [a + b for a, b in zip(cur[0], counts)]; cur[1] += total; cur[2] += n
+        out += h.render(series)
+    return "\n".join(out) + "\n"
+
+# ===== 요청 프로파일링 / 느린 요청 로그 =====
+# 관리자가 ?_profile=1 또는 X-Profile: 1 헤더로 요청하면 그 요청만 cProfile + 단계별 시간 기록
+# → /admin/profiles 에서 확인 (PROFILE_DIR을 설정하면 .prof/.txt 파일로도 저장), 응답에 Server-Timing 헤더
+# 모든 요청: SLOW_REQUEST_MS(기본 1000, 0이면 끔)를 넘으면 단계별 시간과 함께 경고 로그
+PROFILE_ADMINS = set(filter(None, os.environ.get("PROFILE_ADMINS", "admin").split(",")))
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "")
+PROFILE_KEEP = 20
+SLOW_REQUEST_MS = float(os.environ.get("SLOW_REQUEST_MS", "1000"))
+PHASES = ("pool", "sql", "template", "json")   # 나머지는 python
+_profiles = OrderedDict(); _profiles_lock = threading.Lock(); _profile_seq = itertools.count(1)
+
+def add_phase(name, seconds):
+    """현재 요청의 단계별 누적 (시간, 횟수) — 요청 밖(CLI, 시작 시)에서는 무시"""
+    if has_request_context():
+        phases = g.setdefault("phases", {})
+        t, n = phases.get(name, (0.0, 0)); phases[name] = (t + seconds, n + 1)
+
+def phase_summary(total):
+    """[(단계, 초, 횟수)] — python = 전체 - 나머지 단계"""
+    phases = g.get("phases", {})
+    parts = [(name, *phases.get(name, (0.0, 0))) for name in PHASES]
+    return parts + [("python", max(total - sum(t for _, t, _ in parts), 0.0), 0)]
+
+def is_profile_admin():
+    return session.get("user") in PROFILE_ADMINS
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """jsonify의 직렬화 시간을 json 단계로 기록"""
+    def dumps(self, obj, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            add_phase("json", time.perf_counter() - t0)
+
+app.json = TimedJSONProvider(app)
+
+@app.before_request
+def start_profiler():
+    if (request.args.get("_profile") == "1" or request.headers.get("X-Profile") == "1") and is_profile_admin():
+        g.profiler = cProfile.Profile(); g.profiler.enable()
+
+@app.after_request
+def finish_profiler(resp):
+    prof = g.pop("profiler", None)
+    if prof is None: return resp
+    prof.disable()
+    total = time.perf_counter() - g.request_start; phases = phase_summary(total)
+    text = io.StringIO()
+    text.write(f"{request.method} {request.full_path} → {resp.status_code}  {total * 1000:.1f}ms\n")
+    for name, t, n in phases: text.write(f"  {name:<9}{t * 1000:9.1f}ms" + (f"  ({n}회)" if n else "") + "\n")
+    text.write("\n"); pstats.Stats(prof, stream=text).sort_stats("cumulative").print_stats(40)
+    pid = next(_profile_seq)
+    with _profiles_lock:
+        _profiles[pid] = {"id": pid, "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "method": request.method,
+                          "path": request.full_path, "status": resp.status_code, "ms": round(total * 1000, 1), "text": text.getvalue()}
+        while len(_profiles) > PROFILE_KEEP: _profiles.popitem(last=False)
+    if PROFILE_DIR:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}-{pid}")
+        prof.dump_stats(base + ".prof")   # snakeviz / python -m pstats 로 열람
+        with open(base + ".txt", "w", encoding="utf-8") as f: f.write(text.getvalue())
+    resp.headers["Server-Timing"] = ", ".join(f"{name};dur={t * 1000:.1f}" for name, t, _ in phases)
+    resp.headers["X-Profile-Id"] = str(pid)
+    return resp
+
+@app.teardown_request
+def log_slow_request(exc):
+    prof = g.pop("profiler", None)
+    if prof is not None: prof.disable()   # 예외로 after_request를 건너뛴 경우
+    start = g.get("request_start")
+    if start is None or not SLOW_REQUEST_MS: return
+    total = time.perf_counter() - start
+    if total * 1000 < SLOW_REQUEST_MS: return
+    detail = ", ".join(f"{name} {t * 1000:.0f}ms" + (f"×{n}" if n else "") for name, t, n in phase_summary(total))
+    app.logger.warning("느린 요청 %.0fms %s %s (%s)", total * 1000, request.method, request.full_path, detail)
+
+# ===== Connection Pool 설정 (속도 최적화) =====
+# 기존: 매 요청마다 psycopg2.connect() → conn.close() (200~500ms 소요)
+# 변경: 풀에서 가져와 재사용 → put_conn()으로 반환 (거의 0ms)
+# ThreadedConnectionPool은 maxconn을 넘으면 바로 PoolError, 끊긴 연결도 그대로 돌려줌 →
+# BlockingPool: 먼저 온 순서(FIFO)로 DB_POOL_TIMEOUT까지 대기, 수명/유휴 시간 기준으로 교체, 끊긴 연결은 버림
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "2"))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "10"))        # 연결 대기 최대 (초)
+DB_POOL_MAX_AGE = float(os.environ.get("DB_POOL_MAX_AGE", "1800"))      # 이보다 오래된 연결은 새로 연결
+DB_POOL_MAX_IDLE = float(os.environ.get("DB_POOL_MAX_IDLE", "300"))     # DB_POOL_MIN 초과분은 이만큼 쉬면 닫음
+DB_POOL_CHECK_IDLE = float(os.environ.get("DB_POOL_CHECK_IDLE", "30"))  # 이만큼 쉰 연결은 내주기 전에 SELECT 1
+
+class PoolTimeout(psycopg2.pool.PoolError):
+    pass
+
+class BlockingPool:
+    """대기열(FIFO) + 타임아웃 + 연결 상태 확인이 있는 스레드 안전 연결 풀"""
+    def __init__(self, minconn, maxconn, dsn, timeout, max_age, max_idle, check_idle, **connect_kwargs):
+        self.minconn, self.maxconn, self.dsn, self.connect_kwargs = minconn, maxconn, dsn, connect_kwargs
+        self.timeout, self.max_age, self.max_idle, self.check_idle = timeout, max_age, max_idle, check_idle
+        self.cond = threading.Condition(); self.waiters = deque()
+        self.idle = deque()   # (conn, 반환 시각) — 오른쪽이 가장 최근
+        self.born = {}        # conn → 연결 시각 (사용 중 + 유휴 전부)
+        self.opening = 0; self.discarded = 0
+        for _ in range(minconn):
+            conn = self._connect(); self.idle.append((conn, time.monotonic()))
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn, **self.connect_kwargs)
+        self.born[conn] = time.monotonic()
+        return conn
+
+    def _discard(self, conn):
+        """cond를 잡은 상태에서 호출"""
+        self.born.pop(conn, None); self.discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _alive(self, conn):
+        try:
+            c = conn.cursor(cursor_factory=psycopg2.extensions.cursor)   # 메트릭에 잡히지 않게 기본 커서로
+            c.execute("SELECT 1"); conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        deadline = time.monotonic() + self.timeout; me = object()
+        with self.cond:
+            self.waiters.append(me)
+            try:
+                while not (self.waiters[0] is me and (self.idle or len(self.born) + self.opening < self.maxconn)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(f"{self.timeout:g}초 동안 연결을 받지 못함 (최대 {self.maxconn}개 사용 중)")
+                    self.cond.wait(remaining)
+            finally:
+                self.waiters.remove(me); self.cond.notify_all()
+            conn, returned = self.idle.pop() if self.idle else (None, None)
+            if conn is None: self.opening += 1
+        now = time.monotonic()
+        if conn is not None:
+            stale = now - self.born.get(conn, now) > self.max_age
+            if conn.closed or stale or (now - returned > self.check_idle and not self._alive(conn)):
+                with self.cond:
+                    self._discard(conn); self.opening += 1
+                conn = None
+        if conn is None:
+            try:
+                conn = self._connect()
+            finally:
+                with self.cond:
+                    self.opening -= 1; self.cond.notify_all()
+        return conn
+
+    def putconn(self, conn, close=False):
+        with self.cond:
+            now = time.monotonic()
+            if close or conn.closed or now - self.born.get(conn, now) > self.max_age:
+                self._discard(conn)
+            else:
+                self.idle.append((conn, now))
+            # DB_POOL_MIN을 넘는 오래 쉰 연결 정리 (가장 오래 쉰 것부터)
+            while self.idle and len(self.born) > self.minconn and now - self.idle[0][1] > self.max_idle:
+                self._discard(self.idle.popleft()[0])
+            self.cond.notify_all()
+
+    def stats(self):
+        with self.cond:
+            return {"in_use": len(self.born) - len(self.idle), "idle": len(self.idle), "max": self.maxconn,
+                    "waiting": len(self.waiters), "discarded": self.discarded}
+
+class AppConnection(psycopg2.extensions.connection):
+    """이 연결에서 PREPARE한 문장 이름을 기억 (새로 연결하면 빈 집합 → 다시 PREPARE)"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+_pool = BlockingPool(DB_POOL_MIN, DB_POOL_MAX, DATABASE_URL, DB_POOL_TIMEOUT, DB_POOL_MAX_AGE, DB_POOL_MAX_IDLE,
+                     DB_POOL_CHECK_IDLE, connection_factory=AppConnection, cursor_factory=TimedCursor,
+                     keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3)   # 장애 조치 후 죽은 TCP 연결 감지
+
+def get_conn_tuple():
+    """튜플 형태 결과를 위한 연결 (풀에서 가져오기)"""
+    t0 = time.perf_counter()
+    try:
+        conn = _pool.getconn()
+    except psycopg2.pool.PoolError:
+        POOL_EXHAUSTED[0] += 1
+        raise
+    finally:
+        dt = time.perf_counter() - t0; POOL_CHECKOUT.observe(dt); add_phase("pool", dt)
+    conn.autocommit = False
+    return conn
+
+def put_conn(conn):
+    """연결을 풀에 반환 (기존 conn.close() 대체) — 롤백이 실패한 끊긴 연결은 버림"""
+    try:
+        conn.rollback(); broken = False
+    except Exception:
+        broken = True
+    _pool.putconn(conn, close=broken)
+
+def get_conn():
+    """PostgreSQL 연결 생성 (풀에서 가져오기)"""
+    return get_conn_tuple()
+
+# ===== Prepared statement =====
+# 저장/수정 화면/목록/삭제처럼 자주 실행하는 SQL은 연결마다 한 번 PREPARE, 이후 EXECUTE (파싱/플랜 생략)
+# PgBouncer 트랜잭션 모드처럼 세션이 유지되지 않는 풀러 뒤에서는 DB_PREPARE=0
+DB_PREPARE = os.environ.get("DB_PREPARE", "1") != "0"
+PREPARE_MAX = 200   # 연결당 prepared statement 수 한도 (넘으면 DEALLOCATE ALL)
+
+def execute_prepared(c, sql, params=()):
+    """%s 자리표시자 SQL을 이 연결에서 처음이면 PREPARE, 그다음부터는 EXECUTE 이름(값, ...)"""
+    conn = c.connection
+    if not DB_PREPARE or not isinstance(conn, AppConnection):
+        return c.execute(sql, params)
+    name = f"{sql.split(None, 1)[0].lower()}_{hashlib.sha1(sql.encode()).hexdigest()[:16]}"
+    if name not in conn.prepared:
+        if len(conn.prepared) >= PREPARE_MAX:
+            c.execute("DEALLOCATE ALL"); conn.prepared.clear()
+        parts = sql.split("%s")
+        body = "".join(p + (f"${i}" if i < len(parts) else "") for i, p in enumerate(parts, 1)).replace("%%", "%")
+        c.execute(f"PREPARE {name} AS {body}")   # 세션 단위 — 트랜잭션이 롤백돼도 남음
+        conn.prepared.add(name)
+    try:
+        c.execute(f"EXECUTE {name}" + (f"({', '.join(['%s'] * len(params))})" if params else ""), params)
+    except psycopg2.errors.InvalidSqlStatementName:
+        conn.prepared.clear()   # 서버 쪽에서 DISCARD/DEALLOCATE된 경우 — 다음 트랜잭션에서 다시 PREPARE
+        raise
+
+# ===== 스키마 마이그레이션 =====
+# 기존: init_db()에서 CREATE TABLE IF NOT EXISTS만 실행 (컬럼 타입 변경/인덱스 추가 불가)
+# 변경: 적용한 버전을 schema_migrations에 기록하고 아직 적용하지 않은 MIGRATIONS만 순서대로 실행
+# 새 변경은 항상 목록 끝에 새 버전으로 추가 (이미 배포된 항목은 수정하지 않음)
+MIGRATION_LOCK_ID = 724001   # pg_advisory_xact_lock 키 — 여러 워커가 동시에 시작해도 한 곳에서만 실행
+
+MONTH_TEXT_PATTERN = "^[0-9]{4}-(0[1-9]|1[0-2])"
+TIMESTAMP_TEXT_PATTERN = "^[0-9]{4}-[0-9]{2}-[0-9]{2}"
+MONTH_TEXT_COLUMNS = ("order_target", "order_actual", "setup_target", "setup_actual", "mass_target", "mass_actual")
+TIMESTAMP_TEXT_COLUMNS = ("created_at", "updated_at")
+# '2026-13-45 10:00'처럼 앞부분 형식만 맞는 값은 ::timestamptz가 예외를 내서 ALTER 전체가 실패함 → 실패하면 NULL
+# 세션 임시 함수 (pg_temp) — 마이그레이션 연결이 닫히면 사라짐
+TRY_TIMESTAMPTZ_SQL = """CREATE OR REPLACE FUNCTION pg_temp.try_timestamptz(v TEXT) RETURNS TIMESTAMPTZ LANGUAGE plpgsql AS $$
+    BEGIN RETURN v::timestamptz; EXCEPTION WHEN others THEN RETURN NULL; END $$"""
+
+def _month_using(col):
+    """TEXT 'YYYY-MM' → 그 달 1일 DATE (형식이 다른 값은 NULL — 원래 값은 _backup_unconverted가 보관)"""
+    return f"CASE WHEN {col} ~ '{MONTH_TEXT_PATTERN}' THEN to_date(left({col}, 7), 'YYYY-MM') END"
+
+def _timestamp_using(col):
+    """TEXT 시각 → TIMESTAMPTZ (형식이 다르거나 날짜/시각 값이 범위 밖이면 NULL — 원래 값은 _backup_unconverted가 보관)"""
+    return f"CASE WHEN {col} ~ '{TIMESTAMP_TEXT_PATTERN}' THEN pg_temp.try_timestamptz({col}) END"
+
+def _backup_unconverted(c):
+    """타입 변경으로 NULL이 될 값(빈 문자열이 아니면서 변환 결과가 NULL인 월/시각 텍스트)을 investment_migration_backup에 복사하고 경고
+    (판정에 ALTER와 같은 USING 식을 써서 백업 대상과 실제로 NULL이 되는 값이 어긋나지 않게 함)"""
+    c.execute("""CREATE TABLE IF NOT EXISTS investment_migration_backup (
+        id INTEGER NOT NULL, col TEXT NOT NULL, value TEXT NOT NULL, backed_up_at TIMESTAMPTZ NOT NULL DEFAULT now())""")
+    for col, using in [(col, _month_using(col)) for col in MONTH_TEXT_COLUMNS] + [(col, _timestamp_using(col)) for col in TIMESTAMP_TEXT_COLUMNS]:
+        c.execute(f"""INSERT INTO investment_migration_backup (id, col, value)
+            SELECT id, %s, {col} FROM investment WHERE {col} <> '' AND ({using}) IS NULL""", (col,))
+        if c.rowcount:
+            app.logger.warning("investment.%s: 변환할 수 없는 값 %s개는 NULL로 바뀜 (원래 값은 investment_migration_backup)", col, c.rowcount)
+
+def _rebuild_monthly_and_rollup(c):
+    """월 컬럼 변환 뒤 월별 원장/롤업을 변환된 값으로 다시 만듦 (NULL이 된 월은 원장에서 빠지고 롤업 그룹이 바뀜)"""
+    c.execute("DELETE FROM investment_monthly")
+    c.execute(ledger_insert_sql("investment"), (LEDGER_FROM, LEDGER_TO))
+    c.execute("DELETE FROM investment_rollup")
+    c.execute(rollup_upsert_sql("investment"))
+
+def _search_trgm_index(c):
+    """pg_trgm을 쓸 수 있으면 확장 + search_text 트라이그램 인덱스 (없거나 권한이 없으면 건너뜀 → 단어 검색만)"""
+    c.execute("SAVEPOINT search_trgm")
+    try:
+        c.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        c.execute("CREATE INDEX IF NOT EXISTS investment_search_trgm_idx ON investment USING gin (search_text gin_trgm_ops)")
+        c.execute("RELEASE SAVEPOINT search_trgm")
+    except psycopg2.Error as e:
+        c.execute("ROLLBACK TO SAVEPOINT search_trgm")
+        app.logger.warning("pg_trgm 사용 불가, 부분 문자열/오타 검색 없이 진행: %s", str(e).strip().splitlines()[0])
+
+def _fill_rollup(c):
+    """롤업 테이블이 비어 있고 investment에 행이 있으면 채움 (롤업 도입 전 데이터)"""
+    c.execute("SELECT EXISTS(SELECT 1 FROM investment) AND NOT EXISTS(SELECT 1 FROM investment_rollup)")
+    if c.fetchone()[0]:
+        c.execute(rollup_upsert_sql("investment"))
+
+# investment 컬럼 + 계산 컬럼 (목표율, 실적율, 표시용 시각) — investment.*는 뷰를 만들 때의 컬럼으로 고정되므로
+# investment에 컬럼을 추가하는 마이그레이션은 이 정의로 뷰를 다시 만듦
+# 실적율: 예전 process_row처럼 Base와 절감실적이 0이 아니면 계산 (음수 포함), Base가 0/NULL이면 NULL
+INVESTMENT_ROWS_VIEW = """SELECT investment.*,
+            CASE WHEN product = 'ES' THEN 50 ELSE 30 END AS rate_target,
+            CASE WHEN base_amount <> 0 AND saving_actual <> 0
+                 THEN round((saving_actual::float8 / base_amount * 100)::numeric, 1)::float8
+                 WHEN base_amount <> 0 THEN 0::float8 END AS rate_actual,
+            COALESCE(updated_at, created_at) AS shown_at
+        FROM investment"""
+
+MIGRATIONS = [
+    (1, "기본 테이블", [
+        """CREATE TABLE IF NOT EXISTS investment (
+            id SERIAL PRIMARY KEY,
+            invest_type TEXT, product TEXT, corporation TEXT, purpose TEXT,
+            invest_item TEXT, order_target TEXT, order_actual TEXT,
+            setup_target TEXT, setup_actual TEXT, mass_target TEXT, mass_actual TEXT,
+            delay_reason TEXT, base_amount REAL, order_price_target REAL,
+            order_price_actual REAL, saving_target REAL, saving_actual REAL,
+            reduce_1 REAL, reduce_2 REAL, reduce_3 REAL, reduce_4 REAL,
+            reduce_5 REAL, reduce_6 REAL, reduce_7 REAL, reduce_8 REAL,
+            reduce_9 REAL, saving_total REAL, activity TEXT,
+            created_at TEXT, updated_at TEXT
+        )""",
+        """CREATE TABLE IF NOT EXISTS investment_monthly (
+            id INTEGER, year_month TEXT,
+            monthly_target REAL DEFAULT 0, monthly_actual REAL DEFAULT 0,
+            PRIMARY KEY (id, year_month),
+            FOREIGN KEY (id) REFERENCES investment(id) ON DELETE CASCADE
+        )""",
+        """CREATE TABLE IF NOT EXISTS investment_rollup (
+            product TEXT NOT NULL, corporation TEXT NOT NULL, invest_type TEXT NOT NULL,
+            purpose TEXT NOT NULL, order_month TEXT NOT NULL,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            base_amount DOUBLE PRECISION DEFAULT 0, order_price_target DOUBLE PRECISION DEFAULT 0,
+            order_price_actual DOUBLE PRECISION DEFAULT 0, saving_target DOUBLE PRECISION DEFAULT 0,
+            saving_actual DOUBLE PRECISION DEFAULT 0,
+            reduce_1 DOUBLE PRECISION DEFAULT 0, reduce_2 DOUBLE PRECISION DEFAULT 0, reduce_3 DOUBLE PRECISION DEFAULT 0,
+            reduce_4 DOUBLE PRECISION DEFAULT 0, reduce_5 DOUBLE PRECISION DEFAULT 0, reduce_6 DOUBLE PRECISION DEFAULT 0,
+            reduce_7 DOUBLE PRECISION DEFAULT 0, reduce_8 DOUBLE PRECISION DEFAULT 0, reduce_9 DOUBLE PRECISION DEFAULT 0,
+            PRIMARY KEY (product, corporation, invest_type, purpose, order_month)
+        )""",
+        """CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1), version BIGINT NOT NULL DEFAULT 0
+        )""",
+        "INSERT INTO data_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+    ]),
+    (2, "월 컬럼 DATE(그 달 1일), 생성/수정 시각 TIMESTAMPTZ", [
+        TRY_TIMESTAMPTZ_SQL,
+        _backup_unconverted,
+        "ALTER TABLE investment " + ", ".join(
+            [f"ALTER COLUMN {col} TYPE DATE USING {_month_using(col)}" for col in MONTH_TEXT_COLUMNS] +
+            [f"ALTER COLUMN {col} TYPE TIMESTAMPTZ USING {_timestamp_using(col)}, ALTER COLUMN {col} SET DEFAULT now()"
+             for col in TIMESTAMP_TEXT_COLUMNS]),
+        "ALTER TABLE investment_monthly ALTER COLUMN year_month TYPE DATE USING to_date(year_month, 'YYYY-MM')",
+        _rebuild_monthly_and_rollup,
+    ]),
+    (3, "필터/그룹/월 컬럼 인덱스", [
+        # 필터(=) + 기본 정렬(id) 키셋을 한 인덱스로
+        *(f"CREATE INDEX IF NOT EXISTS investment_{col}_id_idx ON investment ({col}, id)"
+          for col in ("product", "corporation", "invest_type", "purpose")),
+        # 월 범위 조회 (BETWEEN)
+        "CREATE INDEX IF NOT EXISTS investment_order_target_idx ON investment (order_target)",
+        "CREATE INDEX IF NOT EXISTS investment_order_actual_idx ON investment (order_actual)",
+        "CREATE INDEX IF NOT EXISTS investment_monthly_year_month_idx ON investment_monthly (year_month)",
+    ]),
+    (4, "롤업 초기 채우기", [_fill_rollup]),
+    (5, "계산 컬럼 뷰 investment_rows", [
+        "CREATE OR REPLACE VIEW investment_rows AS " + INVESTMENT_ROWS_VIEW,
+    ]),
+    # row_version = 행을 마지막으로 쓴 트랜잭션 ID(xid8, 단조 증가) — 조회 스냅샷의 xmin을 다음 since로 쓰면
+    # 커밋 순서가 뒤바뀐 동시 트랜잭션도 놓치지 않음 (get_row_changes)
+    (6, "행 버전(row_version) + 삭제 기록(investment_tombstone)", [
+        "ALTER TABLE data_version ADD COLUMN IF NOT EXISTS sync_floor BIGINT NOT NULL DEFAULT 0",
+        "ALTER TABLE investment ADD COLUMN IF NOT EXISTS row_version BIGINT NOT NULL DEFAULT pg_current_xact_id()::text::bigint",
+        "CREATE INDEX IF NOT EXISTS investment_row_version_idx ON investment (row_version)",
+        """CREATE TABLE IF NOT EXISTS investment_tombstone (
+            id INTEGER PRIMARY KEY, row_version BIGINT NOT NULL, deleted_at TIMESTAMPTZ NOT NULL DEFAULT now())""",
+        "CREATE INDEX IF NOT EXISTS investment_tombstone_row_version_idx ON investment_tombstone (row_version)",
+        """CREATE OR REPLACE FUNCTION investment_touch() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN NEW.row_version := pg_current_xact_id()::text::bigint; RETURN NEW; END $$""",
+        "CREATE TRIGGER investment_touch BEFORE INSERT OR UPDATE ON investment FOR EACH ROW EXECUTE FUNCTION investment_touch()",
+        """CREATE OR REPLACE FUNCTION investment_tombstone() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO investment_tombstone (id, row_version) SELECT id, pg_current_xact_id()::text::bigint FROM gone
+            ON CONFLICT (id) DO UPDATE SET row_version = EXCLUDED.row_version, deleted_at = now();
+            RETURN NULL;
+        END $$""",
+        """CREATE TRIGGER investment_tombstone AFTER DELETE ON investment REFERENCING OLD TABLE AS gone
+            FOR EACH STATEMENT EXECUTE FUNCTION investment_tombstone()""",
+        # TRUNCATE는 행 단위 기록이 없으므로 그 이전 버전을 가진 클라이언트는 전체를 다시 받게 함
+        """CREATE OR REPLACE FUNCTION investment_truncated() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM investment_tombstone;
+            UPDATE data_version SET sync_floor = pg_current_xact_id()::text::bigint WHERE id = 1;
+            RETURN NULL;
+        END $$""",
+        "CREATE TRIGGER investment_truncated AFTER TRUNCATE ON investment FOR EACH STATEMENT EXECUTE FUNCTION investment_truncated()",
+        # investment.* 뷰는 만들 때의 컬럼으로 고정 → row_version 포함해서 다시 만듦
+        "DROP VIEW investment_rows",
+        "CREATE VIEW investment_rows AS " + INVESTMENT_ROWS_VIEW,
+    ]),
+    # 검색: 항목/절감활동/연기사유 — 단어(접두) 검색은 tsvector, 부분 문자열/오타는 pg_trgm (search_filter)
+    # 한국어 형태소 사전이 없으므로 'simple' 설정 (소문자화만), 가중치 항목 A > 절감활동 B > 연기사유 C
+    (7, "검색 컬럼(search_doc, search_text) + 인덱스", [
+        """ALTER TABLE investment
+            ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (
+                COALESCE(invest_item, '') || ' ' || COALESCE(activity, '') || ' ' || COALESCE(delay_reason, '')) STORED,
+            ADD COLUMN IF NOT EXISTS search_doc TSVECTOR GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', COALESCE(invest_item, '')), 'A') ||
+                setweight(to_tsvector('simple', COALESCE(activity, '')), 'B') ||
+                setweight(to_tsvector('simple', COALESCE(delay_reason, '')), 'C')) STORED""",
+        "CREATE INDEX IF NOT EXISTS investment_search_doc_idx ON investment USING gin (search_doc)",
+        _search_trgm_index,
+        # 목록 검색이 뷰에서 검색 컬럼을 쓰므로 다시 만듦
+        "DROP VIEW investment_rows",
+        "CREATE VIEW investment_rows AS " + INVESTMENT_ROWS_VIEW,
+    ]),
+]
+
+def migrate():
+    """아직 적용하지 않은 마이그레이션을 한 트랜잭션으로 적용 → 적용한 (버전, 이름) 목록"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+        c.execute("""CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())""")
+        c.execute("SELECT version FROM schema_migrations"); done = {v for v, in c.fetchall()}
+        applied = []
+        for version, name, steps in MIGRATIONS:
+            if version in done: continue
+            for step in steps:
+                step(c) if callable(step) else c.execute(step)
+            c.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+            applied.append((version, name))
+        conn.commit()
+    finally:
+        put_conn(conn)
+    for version, name in applied:
+        app.logger.info("마이그레이션 %s 적용: %s", version, name)
+    return applied
+
+@app.cli.command("migrate")
+def migrate_command():
+    """스키마 마이그레이션 적용 후 적용 이력 출력 (flask --app app migrate) — 앱 시작 시에도 자동 실행"""
+    applied = migrate()
+    print(f"이번에 적용: {len(applied)}개")
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("SELECT version, name, applied_at FROM schema_migrations ORDER BY version")
+        for version, name, at in c.fetchall():
+            print(f"{version:>3}  {name}  ({at:%Y-%m-%d %H:%M})")
+    finally:
+        put_conn(conn)
+
+# ===== 로그인 데코레이터 =====
+
+def login_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if "user" not in session:
+            return redirect("/login")
+        return f(*args, **kwargs)
+    return decorated_function
+
+PRODUCTS = ["키친", "빌트인쿠킹", "리빙", "부품", "ES"]
+CORPORATIONS = {
+    "키친": ["KR","TR","MN","IN_T","IL_N","IL_P","VH","RA"],
+    "빌트인쿠킹": ["KR","MN","IL_N","MZ","VH"],
+    "리빙": ["KR","PN","TH","VH","IL_N","IL_P","TN","MX","EG","RA"],
+    "ES": ["KR","TA","IL_N","IL_P","TH","SR","AZ","AT","AL"],
+    "부품": ["KR","TA","PN","TR","TH","IL_N","VH","MN"]
+}
+INVEST_COLUMNS = ("invest_type", "product", "corporation", "purpose", "invest_item",
+    "order_target", "order_actual", "setup_target", "setup_actual", "mass_target", "mass_actual", "delay_reason",
+    "base_amount", "order_price_target", "order_price_actual", "saving_target", "saving_actual",
+    *(f"reduce_{i}" for i in range(1, 10)), "saving_total", "activity")
+MONTH_COLUMNS = ("order_target", "order_actual", "setup_target", "setup_actual", "mass_target", "mass_actual")
+# 화면/내보내기용 investment 행: DATE/TIMESTAMPTZ를 기존과 같은 'YYYY-MM' / 'YYYY-MM-DD HH:MI' 문자열로 (SELECT * 대신)
+ROW_COLUMNS = ", ".join(["id", *(f"COALESCE(to_char({col}, 'YYYY-MM'), '') AS {col}" if col in MONTH_COLUMNS else col
+                                 for col in INVEST_COLUMNS),
+                         *(f"to_char({col}, 'YYYY-MM-DD HH24:MI') AS {col}" for col in ("created_at", "updated_at"))])
+
+# 화면/내보내기/수정 화면이 같이 쓰는 행 모양: investment 컬럼 + investment_rows 뷰의 계산 컬럼
+# (목표율: ES 50 / 그 외 30, 실적율: 절감실적/Base %, 소수 1자리 — Base가 0 이하면 None, 표시 시각: 수정 또는 생성)
+ROW_FIELD_TYPES = {"id": int, **{col: float for col in INVEST_COLUMNS[12:27]}, "rate_target": int, "rate_actual": Optional[float]}
+InvestmentRow = NamedTuple("InvestmentRow", [(f, ROW_FIELD_TYPES.get(f, Optional[str])) for f in
+                           ("id", *INVEST_COLUMNS, "created_at", "updated_at", "rate_target", "rate_actual", "shown_at")])
+ROW_SELECT = ROW_COLUMNS + ", rate_target, rate_actual, to_char(shown_at, 'YYYY-MM-DD HH24:MI') AS shown_at"   # FROM investment_rows
+
+def month_date(v):
+    """'YYYY-MM' → 그 달 1일 date (빈 값은 None)"""
+    return datetime.strptime(v, "%Y-%m").date() if v else None
+
+ALL_PURPOSES = ["신규라인","자동화","라인 개조","Overhaul","신모델 대응","T/Time 향상","고장 수리","안전","설비 이설","노후 교체","설비 개선","기타"]
+# 월별 원장(investment_monthly) 기간 — 환경변수 LEDGER_FROM/LEDGER_TO (YYYY-MM)로 조정
+LEDGER_FROM = os.environ.get("LEDGER_FROM", "2026-01")
+LEDGER_TO = os.environ.get("LEDGER_TO", "2030-12")
+
+def month_range(start, end):
+    y, m = map(int, start.split("-")); ey, em = map(int, end.split("-"))
+    out = []
+    while (y, m) <= (ey, em):
+        out.append(f"{y}-{m:02d}"); y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return out
+
+MONTHS = month_range(LEDGER_FROM, LEDGER_TO)
+
+def nz(v, default=0.0):
+    if v is None or v == "": return default
+    try: return float(v) if isinstance(default, float) else str(v)
+    except: return default
+
+# ===== 조회 결과 캐시 (데이터 버전 기반) =====
+# 저장/삭제/가져오기 트랜잭션에서 data_version을 1 올림 → 모든 워커가 다음 요청에서 새 버전을 보고 이전 결과를 버림
+# 요청당 버전 조회는 한 번 (PK 한 행), 캐시는 워커별 LRU
+QUERY_CACHE_SIZE = int(os.environ.get("QUERY_CACHE_SIZE", "256"))
+
+class QueryCache:
+    """데이터 버전별 조회 결과 LRU 캐시 (더 새 버전을 보면 이전 항목 전부 폐기)"""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize; self.version = -1
+        self.entries = OrderedDict(); self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, version, key):
+        with self.lock:
+            if version > self.version:
+                if self.entries: self.invalidations += 1
+                self.entries.clear(); self.version = version
+            if version == self.version and key in self.entries:
+                self.entries.move_to_end(key); self.hits += 1
+                return True, self.entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, version, key, value):
+        with self.lock:
+            if version != self.version: return   # 그 사이 데이터가 바뀐 경우 저장하지 않음
+            self.entries[key] = value; self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False); self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {"version": self.version, "size": len(self.entries), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions, "invalidations": self.invalidations}
+
+query_cache = QueryCache(QUERY_CACHE_SIZE)
+
+def bump_data_version(c, op="bulk", ids=()):
+    """데이터 변경 트랜잭션 안에서 호출 (커밋과 함께 모든 워커 캐시 무효화 + 열린 화면에 변경 알림)
+    op: upsert/delete(ids 행만 바뀜) 또는 bulk(가져오기/재생성 등 — 화면이 전체를 다시 받음)"""
+    execute_prepared(c, "UPDATE data_version SET version = version + 1 WHERE id = 1 RETURNING version"); version = c.fetchone()[0]
+    ids = list(ids)
+    if op == "bulk" or len(ids) > NOTIFY_MAX_IDS: op, ids = "bulk", []
+    execute_prepared(c, "SELECT pg_notify(%s, %s)", (NOTIFY_CHANNEL, json.dumps({"op": op, "ids": ids, "version": version})))
+
+def current_data_version():
+    """현재 데이터 버전 (요청 중에는 한 번만 조회)"""
+    if has_request_context() and "data_version" in g:
+        return g.data_version
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, "SELECT version FROM data_version WHERE id = 1"); version = c.fetchone()[0]
+    finally:
+        put_conn(conn)
+    if has_request_context(): g.data_version = version
+    return version
+
+def _freeze(v):
+    if hasattr(v, "items"):
+        items = v.items(multi=True) if hasattr(v, "getlist") else v.items()
+        return tuple(sorted((k, _freeze(x)) for k, x in items))
+    if isinstance(v, (list, tuple)): return tuple(_freeze(x) for x in v)
+    return v
+
+def cached(fn):
+    """인자(요청 파라미터 포함) + 데이터 버전을 키로 결과를 캐시 — 반환값은 호출한 쪽에서 수정하지 않을 것"""
+    @wraps(fn)
+    def wrapper(*args):
+        version = current_data_version(); key = (fn.__name__, _freeze(args))
+        hit, value = query_cache.get(version, key)
+        if not hit:
+            value = fn(*args); query_cache.put(version, key, value)
+        return value
+    return wrapper
+
+# ===== 정적 파일 (내용 해시 URL + 미리 압축) =====
+# 기존: 페이지마다 CSS/JS/로고(base64)를 인라인으로 매번 전송
+# 변경: static/ 파일을 시작 시 한 번 읽어 해시 파일명 + gzip/brotli 본문을 만들어 두고 immutable로 1년 캐시
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_TYPES = {".css": "text/css; charset=utf-8", ".js": "application/javascript; charset=utf-8", ".jpg": "image/jpeg"}
+COMPRESSIBLE = (".css", ".js")
+try:
+    import brotli
+except ImportError:   # brotli 미설치 시 gzip만
+    brotli = None
+
+def build_assets():
+    """static/ → ({원래 이름: 해시 URL}, {해시 파일명: (content-type, {인코딩: 본문})})"""
+    urls, files = {}, {}
+    for name in sorted(os.listdir(STATIC_DIR)):
+        stem, ext = os.path.splitext(name)
+        if ext not in STATIC_TYPES: continue
+        with open(os.path.join(STATIC_DIR, name), "rb") as f: data = f.read()
+        hashed = f"{stem}.{hashlib.sha1(data).hexdigest()[:10]}{ext}"
+        bodies = {"identity": data}
+        if ext in COMPRESSIBLE:
+            bodies["gzip"] = gzip.compress(data, 9, mtime=0)
+            if brotli: bodies["br"] = brotli.compress(data, quality=11)
+        urls[name] = f"/static/{hashed}"; files[hashed] = (STATIC_TYPES[ext], bodies)
+    return urls, files
+
+ASSET_URLS, ASSET_FILES = build_assets()
+
+@app.template_global()
+def asset(name):
+    """템플릿에서 {{ asset('list.js') }} → /static/list.<해시>.js"""
+    return ASSET_URLS[name]
+
+# ===== 조건부 GET (ETag) =====
+# ETag = 데이터 버전 + 요청 경로/쿼리 + 코드 빌드 → If-None-Match가 같으면 조회/렌더링 없이 304
+BUILD_ID = hashlib.sha1(open(__file__, "rb").read() + "".join(sorted(ASSET_URLS.values())).encode()).hexdigest()[:12]   # 배포(템플릿/정적 파일 변경) 시 ETag도 바뀜
+
+def conditional(fn):
+    """데이터가 바뀌지 않았으면 304 — 200 응답에만 ETag를 붙이고 매번 재검증(no-cache)하게 함
+    gzip으로 보낸 본문의 ETag는 GZIP_ETAG_SUFFIX가 붙은 값(gzip_response) → 두 값 모두 같은 데이터로 보고, 304에는 일치한 값을 돌려줌"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        raw = f"{BUILD_ID}|{current_data_version()}|{request.full_path}"
+        etag = hashlib.sha1(raw.encode()).hexdigest()[:20]
+        matched = next((t for t in (etag, etag + GZIP_ETAG_SUFFIX) if request.if_none_match.contains(t)), None)
+        if matched:
+            resp = Response(status=304); etag = matched
+        else:
+            resp = make_response(fn(*args, **kwargs))
+            if resp.status_code != 200: return resp
+        resp.set_etag(etag); resp.headers["Cache-Control"] = "private, no-cache"
+        resp.vary.add("Accept-Encoding")
+        return resp
+    return wrapper
+
+# ===== 실시간 변경 알림 (LISTEN/NOTIFY → Server-Sent Events) =====
+# bump_data_version()이 커밋과 함께 NOTIFY → 워커마다 LISTEN 연결/스레드 하나가 받아서 /api/events 구독자 큐로 나눠 줌
+# (SSE 연결은 풀 연결을 잡지 않음, gunicorn은 gthread/gevent 워커로 실행)
+NOTIFY_CHANNEL = "investment_changes"
+NOTIFY_MAX_IDS = 500            # 이보다 많이 바뀌면 bulk (NOTIFY 본문 8000바이트 제한)
+SSE_PING = 15                   # 초, 프록시 유휴 타임아웃 방지용 주석 줄
+SSE_QUEUE_SIZE = 100
+RESYNC = json.dumps({"op": "bulk", "ids": [], "version": None})
+
+class ChangeListener:
+    """LISTEN 전용 연결(풀 밖) 하나로 받은 알림을 구독자 큐마다 복사 — 첫 구독 때 스레드 시작, 끊기면 다시 연결"""
+    def __init__(self, dsn):
+        self.dsn = dsn; self.lock = threading.Lock(); self.subscribers = set(); self.thread = None
+
+    def subscribe(self):
+        q = queue.Queue(SSE_QUEUE_SIZE)
+        with self.lock:
+            self.subscribers.add(q)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="change-listener", daemon=True); self.thread.start()
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock: self.subscribers.discard(q)
+
+    def publish(self, payload):
+        with self.lock: subscribers = list(self.subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(payload)
+            except queue.Full:   # 못 따라오는 구독자는 밀린 알림을 버리고 전체 다시 받기
+                with q.mutex: q.queue.clear()
+                q.put_nowait(RESYNC)
+
+    def run(self):
+        delay, connected_before = 1, False
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn, keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                conn.cursor().execute(f"LISTEN {NOTIFY_CHANNEL}")
+                if connected_before: self.publish(RESYNC)   # 끊긴 동안 놓친 알림
+                connected_before, delay = True, 1
+                while True:
+                    if select.select([conn], [], [], SSE_PING) == ([], [], []): continue
+                    conn.poll()
+                    while conn.notifies: self.publish(conn.notifies.pop(0).payload)
+            except (psycopg2.Error, OSError) as e:
+                app.logger.warning("변경 알림 LISTEN 연결 끊김 (%ss 후 재연결): %s", delay, e)
+            finally:
+                if conn is not None: conn.close()
+            time.sleep(delay); delay = min(delay * 2, 30)
+
+change_listener = ChangeListener(DATABASE_URL)
+
+# ===== 월별 원장 (investment_monthly) =====
+# 기존: MONTHS 24개월 전부를 행마다 개별 INSERT ... ON CONFLICT (대부분 0)
+# 변경: 목표/실적이 0이 아닌 월만 한 번의 INSERT ... SELECT로 기록
+def ledger_insert_sql(src):
+    """src(investment 컬럼을 가진 테이블/CTE 이름)의 발주목표월·발주실적월 절감액을 원장에 넣는 SQL (파라미터: 기간 시작, 끝)"""
+    return f"""INSERT INTO investment_monthly (id, year_month, monthly_target, monthly_actual)
+        SELECT id, ym, SUM(t), SUM(a) FROM (
+            SELECT id, order_target AS ym, COALESCE(saving_target,0) AS t, 0 AS a FROM {src}
+            UNION ALL SELECT id, order_actual, 0, COALESCE(saving_actual,0) FROM {src}) x
+        WHERE ym BETWEEN to_date(%s, 'YYYY-MM') AND to_date(%s, 'YYYY-MM')
+        GROUP BY id, ym HAVING SUM(t) <> 0 OR SUM(a) <> 0"""
+
+def warn_outside_ledger(row_id, *months):
+    for ym in months:
+        if ym and not (LEDGER_FROM <= ym <= LEDGER_TO):
+            app.logger.warning("investment %s: %s 은(는) 원장 기간(%s~%s) 밖이라 월별 원장에 기록되지 않음", row_id, ym, LEDGER_FROM, LEDGER_TO)
+
+@app.cli.command("rebuild-monthly")
+def rebuild_monthly_command():
+    """investment 전체로 investment_monthly를 다시 만든다 (flask --app app rebuild-monthly)"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("DELETE FROM investment_monthly"); deleted = c.rowcount
+        c.execute(ledger_insert_sql("investment"), (LEDGER_FROM, LEDGER_TO)); inserted = c.rowcount
+        bump_data_version(c)
+        conn.commit()
+    finally:
+        put_conn(conn)
+    print(f"investment_monthly 재생성: {deleted}행 삭제, {inserted}행 기록 ({LEDGER_FROM}~{LEDGER_TO})")
+
+# ===== 집계 롤업 (investment_rollup) =====
+# (제품, 법인, 유형, 목적, 발주목표월)별 건수/금액 합계를 저장/삭제와 같은 트랜잭션에서 증감
+# → 대시보드/합계 조회는 investment 전체가 아닌 그룹 수에 비례
+ROLLUP_KEYS = ("product", "corporation", "invest_type", "purpose", "order_month")
+ROLLUP_SUMS = ("base_amount", "order_price_target", "order_price_actual", "saving_target", "saving_actual",
+               *(f"reduce_{i}" for i in range(1, 10)))
+
+ROLLUP_COLUMNS = ", ".join((*ROLLUP_KEYS, "row_count", *ROLLUP_SUMS))
+ROLLUP_CHECK_TOLERANCE = 1e-9   # rebuild-rollup --check 금액 비교 상대 오차
+
+def rollup_select_sql(src, sign=1):
+    """src(investment 컬럼을 가진 테이블/CTE 이름)의 행을 롤업 키별로 묶은 SELECT (sign: +1/-1)"""
+    sums = ", ".join(f"{sign}*SUM(COALESCE({col},0)::float8) AS {col}" for col in ROLLUP_SUMS)   # REAL 합은 float4로 더해짐 → float8로
+    return f"""SELECT COALESCE(product,'') AS product, COALESCE(corporation,'') AS corporation,
+            COALESCE(invest_type,'') AS invest_type, COALESCE(purpose,'') AS purpose,
+            COALESCE(to_char(order_target, 'YYYY-MM'),'') AS order_month, {sign}*COUNT(*) AS row_count, {sums}
+        FROM {src} GROUP BY 1, 2, 3, 4, 5"""
+
+def rollup_upsert_sql(src, sign=1):
+    """src의 행들을 롤업에 sign만큼 반영하는 SQL"""
+    updates = ", ".join(f"{col} = investment_rollup.{col} + EXCLUDED.{col}" for col in ("row_count", *ROLLUP_SUMS))
+    return f"""INSERT INTO investment_rollup ({ROLLUP_COLUMNS}) {rollup_select_sql(src, sign)}
+        ON CONFLICT ({", ".join(ROLLUP_KEYS)}) DO UPDATE SET {updates}"""
+
+def rollup_apply(c, sign, row_ids):
+    """row_ids 행의 현재 값을 롤업에 더하거나(+1) 뺀다(-1) — 호출한 쪽 트랜잭션 안에서
+    행을 FOR UPDATE로 잠그고 읽음 → 같은 행을 동시에 수정/삭제하면 뒤 트랜잭션은 앞이 커밋한 값(삭제됐으면 없음)을 뺌"""
+    execute_prepared(c, "WITH src AS (SELECT * FROM investment WHERE id = ANY(%s) ORDER BY id FOR UPDATE) " + rollup_upsert_sql("src", sign),
+                     (list(row_ids),))
+    if sign < 0:
+        execute_prepared(c, "DELETE FROM investment_rollup WHERE row_count <= 0")
+
+@app.cli.command("prune-tombstones")
+@click.option("--days", default=30, show_default=True, help="이보다 오래된 삭제 기록을 지움")
+def prune_tombstones_command(days):
+    """오래된 investment_tombstone 정리 — 그 이전 버전을 가진 클라이언트는 다음 동기화에서 전체를 다시 받음"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("DELETE FROM investment_tombstone WHERE deleted_at < now() - make_interval(days => %s) RETURNING row_version", (days,))
+        pruned = [v for v, in c.fetchall()]
+        if pruned: c.execute("UPDATE data_version SET sync_floor = GREATEST(sync_floor, %s) WHERE id = 1", (max(pruned),))
+        conn.commit()
+    finally:
+        put_conn(conn)
+    print(f"investment_tombstone 정리: {len(pruned)}행 ({days}일 이전)")
+
+@app.cli.command("rebuild-rollup")
+@click.option("--check", is_flag=True, help="비교만 하고 다시 만들지 않음")
+def rebuild_rollup_command(check):
+    """investment_rollup을 investment와 비교하고 다시 만든다 (flask --app app rebuild-rollup [--check])"""
+    keys = ", ".join(ROLLUP_KEYS)
+    diff = " OR ".join(["e.row_count IS DISTINCT FROM r.row_count"] +   # 금액은 상대 오차 (증감을 반복한 float8 합의 반올림 차이 허용)
+                       [f"abs(COALESCE(e.{col},0) - COALESCE(r.{col},0)) > {ROLLUP_CHECK_TOLERANCE} * greatest(abs(e.{col}), abs(r.{col}), 1)"
+                        for col in ROLLUP_SUMS])
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("LOCK TABLE investment_rollup IN EXCLUSIVE MODE")
+        c.execute("CREATE TEMP TABLE rollup_expected ON COMMIT DROP AS " + rollup_select_sql("investment"))
+        c.execute(f"""SELECT {keys}, e.row_count, r.row_count FROM rollup_expected e
+            FULL JOIN investment_rollup r USING ({keys}) WHERE {diff}""")
+        mismatches = c.fetchall()
+        for m in mismatches[:20]:
+            print("불일치:", m)
+        print(f"investment_rollup 불일치 그룹: {len(mismatches)}")
+        if not check:
+            c.execute("DELETE FROM investment_rollup")
+            c.execute(f"INSERT INTO investment_rollup ({ROLLUP_COLUMNS}) SELECT {ROLLUP_COLUMNS} FROM rollup_expected"); print(f"investment_rollup 재생성: {c.rowcount}개 그룹")
+            bump_data_version(c)
+        conn.commit()
+    finally:
+        put_conn(conn)
+
+# ===== 대시보드 집계 (SQL GROUPING SETS) =====
+# 기존: 전체 행을 processed_json으로 내려보내고 브라우저에서 합산
+# 변경: KPI/차트에 필요한 합계만 SQL로 계산해서 JSON으로 전달
+FILTER_COLUMNS = (("product", "product"), ("corp", "corporation"), ("type", "invest_type"), ("purpose", "purpose"))
+
+def build_filter(args):
+    """product/corp/type/purpose 요청 파라미터 → (조건 목록, 파라미터)"""
+    conds, params = [], []
+    for key, col in FILTER_COLUMNS:
+        v = args.get(key)
+        if v:
+            conds.append(f"{col} = %s"); params.append(v)
+    return conds, params
+
+def where_sql(conds):
+    return " WHERE " + " AND ".join(conds) if conds else ""
+
+REDUCE_SUMS = ", ".join(f"COALESCE(SUM(reduce_{i}),0)" for i in range(1, 10))
+AGG_SQL = """SELECT GROUPING(invest_type), GROUPING(product), GROUPING(corporation),
+    invest_type, product, corporation, COALESCE(SUM(row_count),0),
+    COALESCE(SUM(base_amount),0), COALESCE(SUM(saving_target),0), COALESCE(SUM(saving_actual),0), """ + REDUCE_SUMS + """
+    FROM investment_rollup{where}
+    GROUP BY GROUPING SETS ((), (invest_type), (product), (product, invest_type), (corporation))"""
+
+@cached
+def get_aggregates(args):
+    """필터 조건에 맞는 전체/유형별/제품별/제품×유형별/법인별 합계"""
+    conds, params = build_filter(args)
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute(AGG_SQL.format(where=where_sql(conds)), params); rows = c.fetchall()
+    finally:
+        put_conn(conn)
+    out = {"total": None, "by_type": {}, "by_product": {}, "product_type": {}, "by_corp": {}}
+    for g_type, g_prod, g_corp, itype, product, corp, cnt, base, st, sa, *reduce in rows:
+        cell = {"count": cnt, "base": round(base, 4), "target": round(st, 4), "actual": round(sa, 4),
+                "reduce": [round(v, 4) for v in reduce]}
+        itype = itype or ""; product = product or ""; corp = corp or ""
+        if g_type and g_prod and g_corp: out["total"] = cell
+        elif g_prod and g_corp: out["by_type"][itype] = cell
+        elif g_type and g_corp: out["by_product"][product] = cell
+        elif g_corp: out["product_type"].setdefault(product, {})[itype] = cell
+        else: out["by_corp"][corp] = cell
+    return out
+
+# 차트 필터용 큐브: 제품×법인×유형×목적 셀 (롤업 그룹 수에 비례, 수백 행)
+# 대시보드는 이 큐브를 Web Worker(static/cube.js)로 한 번 받아 두고 필터가 바뀔 때마다 셀을 한 번 훑어 get_aggregates와 같은 모양을 만든다
+CUBE_DIMS = ("product", "corporation", "invest_type", "purpose")
+CUBE_SQL = f"""SELECT {", ".join(CUBE_DIMS)}, SUM(row_count), SUM(base_amount), SUM(saving_target), SUM(saving_actual), {REDUCE_SUMS}
+    FROM investment_rollup GROUP BY {", ".join(CUBE_DIMS)} HAVING SUM(row_count) > 0"""
+
+@cached
+def get_cube():
+    """{"dims": 차원 이름, "cells": [[제품, 법인, 유형, 목적, 건수, Base, 절감목표, 절감실적, ①..⑨], ...]}"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, CUBE_SQL); rows = c.fetchall()
+    finally:
+        put_conn(conn)
+    return {"dims": CUBE_DIMS, "cells": [[*r[:5], *(round(v, 4) for v in r[5:])] for r in rows]}
+
+# 월별 추이: investment_monthly(원장)를 SQL로 월별 합산 + 창 함수로 누적 (대시보드 필터 적용, 원장 기간 안의 연도 범위)
+TREND_YEARS = list(range(int(LEDGER_FROM[:4]), int(LEDGER_TO[:4]) + 1))
+TREND_SQL = """SELECT to_char(m, 'YYYY-MM'), COALESCE(SUM(x.monthly_target),0), COALESCE(SUM(x.monthly_actual),0),
+        SUM(COALESCE(SUM(x.monthly_target),0)) OVER w, SUM(COALESCE(SUM(x.monthly_actual),0)) OVER w
+    FROM (SELECT generate_series(to_date(%s, 'YYYY-MM'), to_date(%s, 'YYYY-MM'), interval '1 month')::date AS m) months
+    LEFT JOIN (SELECT im.* FROM investment_monthly im JOIN investment USING (id){where}) x ON x.year_month = m
+    GROUP BY m WINDOW w AS (ORDER BY m) ORDER BY m"""
+
+def trend_years(args):
+    """from/to(또는 year) 요청 파라미터 → 원장 기간으로 자른 (시작 연도, 끝 연도), 기본은 올해"""
+    clamp = lambda y: min(max(y, TREND_YEARS[0]), TREND_YEARS[-1])
+    y_from = clamp(int(args.get("from") or args.get("year") or datetime.now().year))
+    return y_from, max(y_from, clamp(int(args.get("to") or y_from)))
+
+@cached
+def get_monthly_trend(args):
+    """연도 범위·필터의 월별 절감 목표(발주목표월)/실적(발주실적월)과 범위 시작부터의 누적"""
+    y_from, y_to = trend_years(args)
+    conds, params = build_filter(args)
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, TREND_SQL.format(where=where_sql(conds)),
+                         [max(f"{y_from}-01", LEDGER_FROM), min(f"{y_to}-12", LEDGER_TO), *params])
+        rows = c.fetchall()
+    finally:
+        put_conn(conn)
+    out = {"from": y_from, "to": y_to, "years": TREND_YEARS}
+    for key, col in (("labels", 0), ("target", 1), ("actual", 2), ("cum_target", 3), ("cum_actual", 4)):
+        out[key] = [r[col] if col == 0 else round(r[col], 4) for r in rows]
+    return out
+
+# ===== 검색 (전문 검색 tsvector + pg_trgm) =====
+# 항목/절감활동/연기사유 검색: 단어마다 접두 일치(search_doc), pg_trgm 인덱스가 있으면 부분 문자열(ILIKE)/오타(<%)도 (search_text)
+# 점수 = ts_rank_cd(가중치 A/B/C) [+ word_similarity] → /api/search 순위, /api/list?q=&sort=rank
+SEARCH_WORD_RE = re.compile(r"\w+")
+SEARCH_TRGM = False   # migrate() 뒤에 investment_search_trgm_idx 유무로 설정
+
+def search_filter(q):
+    """검색어 → (조건, 조건 파라미터, 점수식, 점수식 파라미터), 단어가 없으면 None"""
+    words = SEARCH_WORD_RE.findall(q or "")
+    if not words: return None
+    tsquery = " & ".join(w + ":*" for w in words)   # \w만 남기므로 tsquery 연산자 주입 없음
+    if not SEARCH_TRGM:
+        return ("search_doc @@ to_tsquery('simple', %s)", [tsquery],
+                "ts_rank_cd(search_doc, to_tsquery('simple', %s))", [tsquery])
+    q = " ".join(q.split()); like = "%" + re.sub(r"([\\%_])", r"\\\1", q) + "%"
+    return ("(search_doc @@ to_tsquery('simple', %s) OR search_text ILIKE %s OR %s <%% search_text)", [tsquery, like, q],
+            "ts_rank_cd(search_doc, to_tsquery('simple', %s)) + word_similarity(%s, search_text)", [tsquery, q])
+
+def list_filter(args):
+    """build_filter + 검색어(q) → (조건 목록, 파라미터, search_filter 결과)"""
+    conds, params = build_filter(args)
+    search = search_filter(args.get("q"))
+    if search:
+        conds.append(search[0]); params += search[1]
+    return conds, params, search
+
+def search_trgm_ready():
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("SELECT to_regclass('investment_search_trgm_idx') IS NOT NULL")
+        return c.fetchone()[0]
+    finally:
+        put_conn(conn)
+
+@cached
+def search_ids(args):
+    """검색어 + 필터에 맞는 id를 점수순으로 한 페이지 + 다음 페이지 커서 (첫 페이지에는 전체 건수)"""
+    conds, params, search = list_filter(args)
+    score, score_params = search[2], search[3]
+    limit = page_limit(args)
+    cursor = args.get("cursor")
+    page_conds, page_params = list(conds), list(params)
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        page_conds.append(f"({score}, id) < (%s::real, %s)")
+        page_params += score_params + [value, row_id]
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, f"SELECT id, {score} FROM investment{where_sql(page_conds)} ORDER BY 2 DESC, id DESC LIMIT %s",
+                         score_params + page_params + [limit + 1])
+        rows = c.fetchall()
+        total = None
+        if not cursor:
+            execute_prepared(c, f"SELECT COUNT(*) FROM investment{where_sql(conds)}", params); total = c.fetchone()[0]
+    finally:
+        put_conn(conn)
+    more = len(rows) > limit; rows = rows[:limit]
+    return {"ids": [r[0] for r in rows], "next": encode_cursor(rows[-1][1], rows[-1][0]) if more else None, "total": total}
+
+# ===== 조회 목록 API (키셋 페이지네이션) =====
+# 기존: 전체 행을 LIST_TPL에 박아 넣고 JS에서 필터/정렬
+# 변경: 필터/정렬/페이지를 SQL로 처리, (정렬값, id) 키셋으로 다음 페이지 조회
+# 정렬 컬럼 → (정렬식, 커서 값 캐스팅 타입)
+LIST_SORT_COLUMNS = {
+    "id": ("id", "integer"),
+    **{col: (f"COALESCE({col},'')", "text") for col in (
+        "product", "corporation", "invest_type", "invest_item", "purpose")},
+    **{col: (f"COALESCE({col}, DATE '0001-01-01')", "date") for col in MONTH_COLUMNS},
+    **{col: (f"COALESCE({col},0)", "real") for col in (
+        "base_amount", "order_price_target", "order_price_actual", "saving_target", "saving_actual")},
+}
+LIST_PAGE_SIZE = 200
+LIST_PAGE_MAX = 1000
+LIST_TOTALS_SQL = """SELECT COALESCE(SUM(row_count),0), COALESCE(SUM(base_amount),0), COALESCE(SUM(order_price_target),0),
+    COALESCE(SUM(order_price_actual),0), COALESCE(SUM(saving_target),0), COALESCE(SUM(saving_actual),0), """ + REDUCE_SUMS + """
+    FROM investment_rollup{where}"""
+# 검색 중에는 롤업으로 거를 수 없으므로 investment에서 직접 합계
+LIST_SEARCH_TOTALS_SQL = "SELECT COUNT(*), " + ", ".join(f"COALESCE(SUM({col}::float8),0)" for col in ROLLUP_SUMS) + " FROM investment{where}"
+
+def encode_cursor(value, row_id):
+    return base64.urlsafe_b64encode(json.dumps([value, row_id], ensure_ascii=False, default=str).encode()).decode()
+
+def decode_cursor(cursor):
+    value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return value, int(row_id)
+
+def list_order(args, search=None):
+    """sort/dir 요청 파라미터 → (정렬식, 정렬식 파라미터, 커서 캐스팅 타입, ASC|DESC) — 검색 중 sort=rank는 검색 점수"""
+    order = "ASC" if args.get("dir") == "asc" else "DESC"
+    if search and args.get("sort") == "rank":
+        return search[2], search[3], "real", order
+    sort = args.get("sort") if args.get("sort") in LIST_SORT_COLUMNS else "id"
+    expr, cast = LIST_SORT_COLUMNS[sort]
+    return expr, [], cast, order
+
+def page_limit(args):
+    try:
+        return max(1, min(int(args.get("limit") or LIST_PAGE_SIZE), LIST_PAGE_MAX))
+    except ValueError:
+        return LIST_PAGE_SIZE
+
+@cached
+def get_list_page(args):
+    """필터/정렬 조건의 한 페이지 + 다음 페이지 커서 (첫 페이지에는 합계 포함)"""
+    conds, params, search = list_filter(args)
+    expr, expr_params, cast, order = list_order(args, search)
+    limit = page_limit(args)
+    cursor = args.get("cursor")
+    page_conds, page_params = list(conds), list(params)
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        page_conds.append(f"({expr}, id) {'>' if order == 'ASC' else '<'} (%s::{cast}, %s)")
+        page_params += expr_params + [value, row_id]
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, f"SELECT {ROW_SELECT}, {expr} FROM investment_rows{where_sql(page_conds)} ORDER BY {expr} {order}, id {order} LIMIT %s",
+                  expr_params + page_params + expr_params + [limit + 1])
+        rows = c.fetchall()
+        totals = None
+        if not cursor:
+            execute_prepared(c, (LIST_SEARCH_TOTALS_SQL if search else LIST_TOTALS_SQL).format(where=where_sql(conds)), params)
+            cnt, base, opt, opa, sgt, sga, *reduce = c.fetchone()
+            totals = {"count": cnt, "base": round(base, 4), "opt": round(opt, 4), "opa": round(opa, 4),
+                      "sgt": round(sgt, 4), "sga": round(sga, 4), "reduce": [round(v, 4) for v in reduce]}
+    finally:
+        put_conn(conn)
+    more = len(rows) > limit; rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1][-1], rows[-1][0]) if more else None
+    return {"rows": [InvestmentRow._make(r[:-1]) for r in rows], "next": next_cursor, "totals": totals}
+
+# ?format=columnar : 행 배열 대신 컬럼별 배열 + 범주형 컬럼 사전 인코딩 (JS decodeColumnar()로 같은 행 모양 복원)
+COLUMNAR_DICT_COLUMNS = (1, 2, 3, 4)   # invest_type, product, corporation, purpose
+
+def columnar(rows, dict_columns=COLUMNAR_DICT_COLUMNS):
+    """[[...], ...] → {"n": 행 수, "cols": [컬럼별 값], "dicts": {컬럼 번호: 고유값 목록}} (사전 컬럼 값은 고유값 인덱스)"""
+    cols, dicts = [list(col) for col in zip(*rows)], {}
+    for i, col in enumerate(cols):   # 정수값 실수 12.0 → 12 (JS에서는 같은 Number)
+        if all(isinstance(v, float) for v in col): cols[i] = [int(v) if v.is_integer() else v for v in col]
+    for i in dict_columns:
+        if i >= len(cols): continue
+        index = {}
+        cols[i] = [index.setdefault(v, len(index)) for v in cols[i]]
+        dicts[i] = list(index)
+    return {"n": len(rows), "cols": cols, "dicts": dicts}
+
+# ===== 엑셀/CSV 내보내기 (서버 스트리밍) =====
+# 기존: 브라우저에서 DATA 전체로 SheetJS 워크북 생성
+# 변경: 서버 측(named) 커서로 EXPORT_CHUNK 행씩 읽어 제너레이터로 바로 전송 → 행 수와 무관하게 메모리 일정
+EXPORT_CHUNK = 2000
+EXPORT_HEADERS = ["제품","법인","유형","항목","목적","발주목표","발주실적","셋업목표","셋업실적","양산목표","양산실적","연기사유",
+    "Base","발주가목표","발주가실적","절감목표","절감실적","①","②","③","④","⑤","⑥","⑦","⑧","⑨","활동","목표%","실적%"]
+
+def export_row(r):
+    """InvestmentRow → 내보내기 컬럼 순서 (목표%/실적% 포함)"""
+    return [r.product, r.corporation, r.invest_type, r.invest_item, r.purpose, *r[6:13], *r[13:27], r.activity,
+            r.rate_target, "-" if r.rate_actual is None else r.rate_actual]
+
+def iter_export_chunks(args):
+    """필터/정렬 조건의 행을 EXPORT_CHUNK 단위 리스트로 반환 (연결은 끝까지 읽거나 중단될 때 반환)"""
+    conds, params, search = list_filter(args)
+    expr, expr_params, _, order = list_order(args, search)
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor(name="export_cursor"); c.itersize = EXPORT_CHUNK
+        c.execute(f"SELECT {ROW_SELECT} FROM investment_rows{where_sql(conds)} ORDER BY {expr} {order}, id {order}", params + expr_params)
+        while True:
+            rows = c.fetchmany(EXPORT_CHUNK)
+            if not rows: break
+            yield [export_row(InvestmentRow._make(r)) for r in rows]
+    finally:
+        put_conn(conn)
+
+def stream_csv(args):
+    buf = io.StringIO(); w = csv.writer(buf)
+    w.writerow(EXPORT_HEADERS)
+    yield ("\ufeff" + buf.getvalue()).encode("utf-8")   # BOM: 엑셀에서 한글 깨짐 방지
+    for chunk in iter_export_chunks(args):
+        buf.seek(0); buf.truncate(); w.writerows(chunk)
+        yield buf.getvalue().encode("utf-8")
+
+class _ChunkSink(io.RawIOBase):
+    """zipfile 출력을 받아 두었다가 pop()으로 꺼내는 비탐색(non-seekable) 스트림"""
+    def __init__(self):
+        self.chunks = []
+    def writable(self):
+        return True
+    def write(self, b):
+        self.chunks.append(bytes(b)); return len(b)
+    def pop(self):
+        data = b"".join(self.chunks); self.chunks.clear(); return data
+
+_XML_ILLEGAL = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+XLSX_PARTS = {
+    "[Content_Types].xml": '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>',
+    "_rels/.rels": '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    "xl/workbook.xml": '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="투자실적" sheetId="1" r:id="rId1"/></sheets></workbook>',
+    "xl/_rels/workbook.xml.rels": '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>',
+    "xl/styles.xml": '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>',
+}
+
+def xlsx_row(values):
+    cells = []
+    for v in values:
+        if v is None or v == "":
+            cells.append("<c/>")
+        elif isinstance(v, (int, float)):
+            cells.append(f"<c><v>{v}</v></c>")
+        else:
+            t = xml_escape(str(v).translate(_XML_ILLEGAL))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{t}</t></is></c>')
+    return "<row>" + "".join(cells) + "</row>"
+
+def stream_xlsx(args):
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, body in XLSX_PARTS.items():
+            zf.writestr(name, body)
+        with zf.open("xl/worksheets/sheet1.xml", "w") as ws:
+            ws.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                + xlsx_row(EXPORT_HEADERS)).encode("utf-8"))
+            for chunk in iter_export_chunks(args):
+                ws.write("".join(xlsx_row(r) for r in chunk).encode("utf-8"))
+                yield sink.pop()
+            ws.write(b"</sheetData></worksheet>")
+    yield sink.pop()
+
+def download_headers(ext):
+    name = quote(f"설비투자비_{datetime.now().strftime('%Y-%m-%d')}.{ext}")
+    return {"Content-Disposition": f"attachment; filename=export.{ext}; filename*=UTF-8''{name}"}
+
+# ===== 대량 가져오기 (CSV/XLSX → COPY) =====
+# 내보내기와 같은 컬럼 양식의 파일을 검증 → 스테이징 테이블에 COPY → investment/investment_monthly에 한 번에 반영
+# 한 행이라도 오류가 있으면 아무것도 저장하지 않고 행별 오류 목록을 돌려준다
+INVEST_TYPES = ("확장", "경상")
+IMPORT_MONTH_COLS = range(5, 11)    # 발주/셋업/양산 목표·실적
+IMPORT_NUM_COLS = range(12, 26)     # Base ~ ⑨
+MONTH_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+def _cell_text(v):
+    if v is None: return ""
+    if isinstance(v, float) and v.is_integer(): v = int(v)
+    return str(v).strip()
+
+def _cell_month(v):
+    if isinstance(v, float):   # 엑셀 날짜 셀(일련번호)
+        return (datetime(1899, 12, 30) + timedelta(days=v)).strftime("%Y-%m")
+    s = _cell_text(v)
+    return s[:7] if re.match(r"^\d{4}-\d{2}-\d{2}", s) else s
+
+def _col_index(ref):
+    n = 0
+    for ch in ref:
+        if not ch.isalpha(): break
+        n = n * 26 + ord(ch.upper()) - 64
+    return n - 1
+
+def read_csv_rows(data):
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("cp949")   # 한글 엑셀에서 저장한 CSV
+    for i, row in enumerate(csv.reader(io.StringIO(text, newline="")), 1):
+        yield i, row
+
+def read_xlsx_rows(data):
+    """첫 번째 시트의 (행 번호, 셀 값 목록)"""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        rid = ET.fromstring(zf.read("xl/workbook.xml")).find(f"{XLSX_NS}sheets/{XLSX_NS}sheet").get(XLSX_REL_NS + "id")
+        rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        target = next(r.get("Target") for r in rels if r.get("Id") == rid)
+        sheet = target.lstrip("/") if target.startswith("/") else "xl/" + target
+        shared = []
+        if "xl/sharedStrings.xml" in zf.namelist():
+            for _, el in ET.iterparse(zf.open("xl/sharedStrings.xml")):
+                if el.tag == XLSX_NS + "si":
+                    shared.append("".join(t.text or "" for t in el.iter(XLSX_NS + "t"))); el.clear()
+        rownum = 0
+        for _, el in ET.iterparse(zf.open(sheet)):
+            if el.tag != XLSX_NS + "row": continue
+            rownum = int(el.get("r") or rownum + 1); vals = []
+            for c in el.iter(XLSX_NS + "c"):
+                if c.get("r"):
+                    vals.extend([None] * (_col_index(c.get("r")) - len(vals)))
+                t = c.get("t"); v = c.find(XLSX_NS + "v")
+                if t == "inlineStr": val = "".join(x.text or "" for x in c.iter(XLSX_NS + "t"))
+                elif v is None or v.text is None: val = None
+                elif t == "s": val = shared[int(v.text)]
+                elif t in ("str", "e"): val = v.text
+                elif t == "b": val = v.text == "1"
+                else: val = float(v.text)
+                vals.append(val)
+            el.clear()
+            yield rownum, vals
+
+def parse_import_row(vals):
+    """내보내기 양식 한 행 → (INVEST_COLUMNS 순서 값, 오류 목록)"""
+    vals = list(vals) + [None] * (len(EXPORT_HEADERS) - len(vals))
+    errors = []
+    product, corp, itype, item, purpose = (_cell_text(v) for v in vals[:5])
+    if product not in CORPORATIONS: errors.append(f"제품 '{product}' 없음")
+    elif corp not in CORPORATIONS[product]: errors.append(f"법인 '{corp}'은(는) {product} 법인이 아님")
+    if itype not in INVEST_TYPES: errors.append(f"유형 '{itype}' 없음")
+    if purpose not in ALL_PURPOSES: errors.append(f"목적 '{purpose}' 없음")
+    months = []
+    for i in IMPORT_MONTH_COLS:
+        m = _cell_month(vals[i])
+        if m and not MONTH_RE.match(m): errors.append(f"{EXPORT_HEADERS[i]} '{m}' 형식 오류 (YYYY-MM)")
+        months.append(m)
+    nums = []
+    for i in IMPORT_NUM_COLS:
+        v = vals[i]
+        if _cell_text(v) in ("", "-"):
+            nums.append(0.0); continue
+        try:
+            n = float(v)
+            if not math.isfinite(n): raise ValueError(v)
+        except (TypeError, ValueError):
+            errors.append(f"{EXPORT_HEADERS[i]} '{v}' 숫자 아님"); n = 0.0
+        nums.append(n)
+    # 절감실적 = 활동별 합계(saving_total)와 같은 값 (입력 화면과 동일)
+    return (itype, product, corp, purpose, item, *months, _cell_text(vals[11]), *nums, nums[4], _cell_text(vals[26])), errors
+
+def validate_import(rows):
+    """헤더 확인 + 행별 검증 → (유효 행 목록, [{row, errors}])"""
+    valid, report, header_seen = [], [], False
+    for rownum, vals in rows:
+        if not any(_cell_text(v) for v in vals): continue
+        if not header_seen:   # 첫 번째 비어 있지 않은 행 = 헤더
+            header_seen = True
+            if [_cell_text(v) for v in vals[:27]] != EXPORT_HEADERS[:27]:
+                return [], [{"row": rownum, "errors": ["헤더가 내보내기 양식과 다릅니다"]}]
+            continue
+        row, errors = parse_import_row(vals)
+        if errors: report.append({"row": rownum, "errors": errors})
+        else: valid.append(row)
+    return valid, report
+
+def import_investments(rows):
+    """검증된 행 → COPY(스테이징) → investment + investment_monthly (한 트랜잭션)"""
+    cols = ", ".join(INVEST_COLUMNS); months = [INVEST_COLUMNS.index(col) for col in MONTH_COLUMNS]
+    buf = io.StringIO(); w = csv.writer(buf, quoting=csv.QUOTE_NONNUMERIC)   # 빈 문자열은 ''로 (월 컬럼은 FORCE_NULL로 NULL)
+    for seq, row in enumerate(rows):
+        row = list(row)
+        for i in months: row[i] = month_date(row[i])
+        w.writerow((seq, *row))
+    buf.seek(0)
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute(f"CREATE TEMP TABLE investment_import ON COMMIT DROP AS SELECT 0 AS seq, {cols} FROM investment WITH NO DATA")
+        c.copy_expert(f"COPY investment_import (seq, {cols}) FROM STDIN WITH (FORMAT csv, FORCE_NULL ({', '.join(MONTH_COLUMNS)}))", buf)
+        c.execute(f"""WITH ins AS (
+                INSERT INTO investment ({cols}, created_at, updated_at)
+                SELECT {cols}, now(), now() FROM investment_import ORDER BY seq
+                RETURNING *),
+            monthly AS ({ledger_insert_sql("ins")}),
+            rollup AS ({rollup_upsert_sql("ins")})
+            SELECT COUNT(*), MIN(id), MAX(id) FROM ins""", (LEDGER_FROM, LEDGER_TO))
+        inserted, first_id, last_id = c.fetchone()
+        bump_data_version(c)
+        conn.commit()
+    finally:
+        put_conn(conn)
+    return {"success": True, "inserted": inserted, "first_id": first_id, "last_id": last_id}
+
+# ===== 일괄 수정/삭제 (JSON) =====
+# 여러 행의 수정·삭제를 한 트랜잭션, 행 수와 무관한 고정 개수의 SQL로 처리하고
+# 바뀐 행(InvestmentRow)을 돌려줘서 목록 화면이 새로고침 없이 그 행만 고친다
+ROWS_BATCH_MAX = 1000
+TEXT_COLUMNS = ("invest_type", "product", "corporation", "purpose", "invest_item", "delay_reason", "activity")
+NUM_COLUMNS = INVEST_COLUMNS[12:27]   # base_amount ~ saving_total
+# 요청에 있는 컬럼만 바꾼다: jsonb_populate_record(현재 행, 변경분)
+UPDATE_ROWS_SQL = f"""UPDATE investment i SET ({", ".join(INVEST_COLUMNS)}, updated_at) =
+        (SELECT {", ".join(f"p.{col}" for col in INVEST_COLUMNS)}, now() FROM jsonb_populate_record(i, u.doc) p)
+    FROM jsonb_array_elements(%s::jsonb) u(doc) WHERE i.id = (u.doc->>'id')::int RETURNING i.id"""
+
+def is_row_id(v):
+    """JSON 정수만 (bool, 문자열, 실수는 아님)"""
+    return isinstance(v, int) and not isinstance(v, bool)
+
+def parse_row_patch(d):
+    """{"id": .., 컬럼: 값, ...} → (jsonb_populate_record용 변경분, 오류 목록)"""
+    if not isinstance(d, dict): return None, ["객체가 아님"]
+    errors, patch = [], {}
+    if is_row_id(d.get("id")): patch["id"] = d["id"]
+    else: errors.append(f"id '{d.get('id')}' 정수 아님")
+    for col, v in d.items():
+        if col == "id": continue
+        if col in MONTH_COLUMNS:
+            v = _cell_text(v)
+            if v and not MONTH_RE.match(v): errors.append(f"{col} '{v}' 형식 오류 (YYYY-MM)")
+            else: patch[col] = f"{v}-01" if v else None
+        elif col in NUM_COLUMNS:
+            try:
+                patch[col] = float(v) if _cell_text(v) else 0.0
+                if not math.isfinite(patch[col]): raise ValueError(v)
+            except (TypeError, ValueError):
+                errors.append(f"{col} '{v}' 숫자 아님")
+        elif col in TEXT_COLUMNS: patch[col] = _cell_text(v)
+        else: errors.append(f"알 수 없는 컬럼 '{col}'")
+    if "product" in patch and patch["product"] not in CORPORATIONS: errors.append(f"제품 '{patch['product']}' 없음")
+    if "invest_type" in patch and patch["invest_type"] not in INVEST_TYPES: errors.append(f"유형 '{patch['invest_type']}' 없음")
+    if "purpose" in patch and patch["purpose"] not in ALL_PURPOSES: errors.append(f"목적 '{patch['purpose']}' 없음")
+    return patch, errors
+
+def get_row_changes(since):
+    """since(이전 응답의 version) 이후 바뀐 행과 삭제된 id — since가 0이거나 sync_floor 이하면 전체(full)
+    version = 이 조회 스냅샷의 xmin: 그보다 작은 트랜잭션은 모두 끝났으므로 다음 요청은 row_version >= version만 보면 됨"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        c.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")   # 아래 조회 모두 같은 스냅샷
+        execute_prepared(c, "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint, sync_floor FROM data_version WHERE id = 1")
+        version, floor = c.fetchone()
+        full = since <= floor
+        if full:
+            execute_prepared(c, f"SELECT {ROW_SELECT} FROM investment_rows ORDER BY id DESC"); deleted = []
+            rows = c.fetchall()
+        else:
+            execute_prepared(c, f"SELECT {ROW_SELECT} FROM investment_rows WHERE row_version >= %s ORDER BY id DESC", (since,))
+            rows = c.fetchall()
+            execute_prepared(c, "SELECT id FROM investment_tombstone WHERE row_version >= %s", (since,)); deleted = [r[0] for r in c.fetchall()]
+    finally:
+        put_conn(conn)
+    return {"version": version, "full": full, "fields": InvestmentRow._fields,
+            "rows": list(map(InvestmentRow._make, rows)), "deleted": deleted}
+
+def fetch_rows(c, ids):
+    execute_prepared(c, f"SELECT {ROW_SELECT} FROM investment_rows WHERE id = ANY(%s) ORDER BY id DESC", (list(ids),))
+    return list(map(InvestmentRow._make, c.fetchall()))
+
+def corporation_errors(c, patches):
+    """제품/법인을 바꾸는 변경분을 현재 행 값과 합쳐 검사 (한쪽만 보내도 가져오기/입력 화면과 같은 조합만) — 해당 행은 잠금"""
+    touched = [p for p in patches if "product" in p or "corporation" in p]
+    if not touched: return []
+    execute_prepared(c, "SELECT id, product, corporation FROM investment WHERE id = ANY(%s) ORDER BY id FOR UPDATE",
+                     (sorted({p["id"] for p in touched}),))
+    current = {row_id: (product, corporation) for row_id, product, corporation in c.fetchall()}
+    errors = []
+    for p in touched:
+        if p["id"] not in current: continue   # 없는 id는 missing으로
+        product = p.get("product", current[p["id"]][0]); corporation = p.get("corporation", current[p["id"]][1])
+        if product not in CORPORATIONS: errors.append({"id": p["id"], "errors": [f"제품 '{product}' 없음"]})
+        elif corporation not in CORPORATIONS[product]:
+            errors.append({"id": p["id"], "errors": [f"법인 '{corporation}'은(는) {product} 법인이 아님"]})
+    return errors
+
+def update_rows(patches):
+    """검증된 변경분 목록 → 제품/법인 조합 검사(현재 행과 합쳐서), 롤업 빼기, UPDATE, 원장 다시 쓰기, 롤업 더하기 (한 트랜잭션)
+    롤업 빼기(rollup_apply)가 행을 잠그므로 빼는 행 = 이어서 UPDATE되는 행 (없는 id는 양쪽 모두 제외)"""
+    ids = [p["id"] for p in patches]
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        errors = corporation_errors(c, patches)
+        if errors:
+            conn.rollback(); return {"success": False, "errors": errors}
+        rollup_apply(c, -1, ids)
+        execute_prepared(c, UPDATE_ROWS_SQL, (json.dumps(patches, ensure_ascii=False),)); updated = sorted({r[0] for r in c.fetchall()})
+        execute_prepared(c, "DELETE FROM investment_monthly WHERE id = ANY(%s)", (updated,))
+        execute_prepared(c, "WITH src AS (SELECT * FROM investment WHERE id = ANY(%s)) " + ledger_insert_sql("src"),
+                         (updated, LEDGER_FROM, LEDGER_TO))
+        rollup_apply(c, +1, updated)
+        if updated: bump_data_version(c, "upsert", updated)
+        rows = fetch_rows(c, updated)
+        conn.commit()
+    finally:
+        put_conn(conn)
+    return {"success": True, "rows": rows, "missing": sorted(set(ids) - set(updated))}
+
+def delete_rows(ids):
+    """ids 행 삭제 (investment_monthly는 FK ON DELETE CASCADE로 같이 삭제)
+    롤업은 DELETE ... RETURNING으로 이 트랜잭션이 실제로 지운 행만 뺌 — 같은 행을 동시에 지우면 늦은 쪽은 0행"""
+    conn = get_conn_tuple()
+    try:
+        c = conn.cursor()
+        execute_prepared(c, f"""WITH gone AS (DELETE FROM investment WHERE id = ANY(%s) RETURNING *),
+            rollup AS ({rollup_upsert_sql("gone", -1)}) SELECT id FROM gone""", (list(ids),))
+        deleted = sorted(r[0] for r in c.fetchall())
+        execute_prepared(c, "DELETE FROM investment_rollup WHERE row_count <= 0")
+        if deleted: bump_data_version(c, "delete", deleted)
+        conn.commit()
+    finally:
+        put_conn(conn)
+    return {"success": True, "deleted": deleted, "missing": sorted(set(ids) - set(deleted))}
+
+migrate()   # 롤업 SQL 헬퍼를 사용하므로 정의 이후에 실행
+SEARCH_TRGM = search_trgm_ready()
+
+# ===== 로그인 =====
+@app.route("/login", methods=["GET", "POST"])
+def login():
+    if request.method == "POST":
+        username = request.form.get("username")
+        password = request.form.get("password")
+
+        if username == "admin" and password == "1234":
+            session["user"] = username
+            return redirect("/dashboard")
+        else:
+            return render_page("login", error="아이디 또는 비밀번호 오류")
+
+    return static_page("login")
+
+
+# ===== 로그아웃 =====
+@app.route("/logout")
+def logout():
+    session.clear()
+    return redirect("/login")
+
+# ===== 응답 gzip =====
+# JSON/HTML 응답은 클라이언트가 gzip을 받으면 압축 (스트리밍 내보내기, 작은 응답은 제외)
+# 압축 여부가 Accept-Encoding에 달렸으므로 압축하지 않은 응답에도 Vary, 압축한 본문은 ETag를 구분 (바이트가 다르므로)
+GZIP_MIN_SIZE = 1024
+GZIP_MIMETYPES = ("application/json", "text/html")
+GZIP_ETAG_SUFFIX = "-gz"
+
+@app.after_request
+def gzip_response(resp):
+    if resp.status_code != 200 or resp.is_streamed or resp.direct_passthrough or resp.mimetype not in GZIP_MIMETYPES:
+        return resp
+    resp.vary.add("Accept-Encoding")
+    if "Content-Encoding" in resp.headers or not request.accept_encodings["gzip"]: return resp
+    data = resp.get_data()
+    if len(data) < GZIP_MIN_SIZE: return resp
+    resp.set_data(gzip.compress(data, 6)); resp.headers["Content-Encoding"] = "gzip"
+    etag, weak = resp.get_etag()
+    if etag: resp.set_etag(etag + GZIP_ETAG_SUFFIX, weak)
+    return resp
+
+@app.route("/static/<name>")
+def static_file(name):
+    entry = ASSET_FILES.get(name)
+    if not entry: return "Not Found", 404
+    content_type, bodies = entry
+    enc = next((e for e in ("br", "gzip") if e in bodies and request.accept_encodings[e]), "identity")
+    resp = Response(bodies[enc], content_type=content_type)
+    if enc != "identity": resp.headers["Content-Encoding"] = enc
+    if len(bodies) > 1: resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
+
+@app.route("/")
+@app.route("/edit/<int:row_id>")
+@login_required
+def index(row_id=None):
+    edit_data = None
+    if row_id:
+        conn = get_conn_tuple()
+        try:
+            c = conn.cursor()
+            execute_prepared(c, f"SELECT {ROW_SELECT} FROM investment_rows WHERE id = %s", (row_id,)); edit_data = c.fetchone()
+        finally:
+            put_conn(conn)
+        if not edit_data: return "데이터를 찾을 수 없습니다.", 404
+        edit_data = InvestmentRow._make(edit_data)
+    ctx = dict(products=PRODUCTS, corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False), all_purposes=ALL_PURPOSES)
+    if not edit_data: return static_page("input", **ctx)
+    return render_page("input", edit_data=edit_data, row_id=row_id, **ctx)
+
+@app.route("/save", methods=["POST"])
+@login_required
+def save():
+    conn = get_conn_tuple()
+    try:
+        f = request.form; c = conn.cursor()
+        row_id = f.get("row_id")
+        values = (f.get("invest_type") or "", f.get("product") or "", f.get("corporation") or "", f.get("purpose") or "",
+            f.get("invest_item") or "", *(month_date(f.get(col)) for col in MONTH_COLUMNS),
+            f.get("delay_reason") or "", nz(f.get("base_amount")), nz(f.get("order_price_target")),
+            nz(f.get("order_price_actual")), nz(f.get("saving_target")), nz(f.get("saving_actual")),
+            nz(f.get("reduce_1")), nz(f.get("reduce_2")), nz(f.get("reduce_3")), nz(f.get("reduce_4")),
+            nz(f.get("reduce_5")), nz(f.get("reduce_6")), nz(f.get("reduce_7")), nz(f.get("reduce_8")),
+            nz(f.get("reduce_9")), nz(f.get("saving_total")), f.get("activity") or "")
+        if row_id:
+            rollup_apply(c, -1, [int(row_id)])
+            execute_prepared(c, """UPDATE investment SET invest_type=%s,product=%s,corporation=%s,purpose=%s,invest_item=%s,
+                order_target=%s,order_actual=%s,setup_target=%s,setup_actual=%s,mass_target=%s,mass_actual=%s,delay_reason=%s,
+                base_amount=%s,order_price_target=%s,order_price_actual=%s,saving_target=%s,saving_actual=%s,
+                reduce_1=%s,reduce_2=%s,reduce_3=%s,reduce_4=%s,reduce_5=%s,reduce_6=%s,reduce_7=%s,reduce_8=%s,reduce_9=%s,
+                saving_total=%s,activity=%s,updated_at=now() WHERE id=%s""", values + (row_id,))
+            execute_prepared(c, "DELETE FROM investment_monthly WHERE id=%s", (int(row_id),)); target_id = int(row_id)
+        else:
+            execute_prepared(c, """INSERT INTO investment (invest_type,product,corporation,purpose,invest_item,
+                order_target,order_actual,setup_target,setup_actual,mass_target,mass_actual,delay_reason,
+                base_amount,order_price_target,order_price_actual,saving_target,saving_actual,
+                reduce_1,reduce_2,reduce_3,reduce_4,reduce_5,reduce_6,reduce_7,reduce_8,reduce_9,
+                saving_total,activity,created_at,updated_at) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,now(),now())
+                RETURNING id""",
+                values); target_id = c.fetchone()[0]
+        rollup_apply(c, +1, [target_id])
+        execute_prepared(c, "WITH src AS (SELECT * FROM investment WHERE id=%s) " + ledger_insert_sql("src"),
+                  (target_id, LEDGER_FROM, LEDGER_TO))
+        bump_data_version(c, "upsert", [target_id])
+        conn.commit()
+        warn_outside_ledger(target_id, f.get("order_target"), f.get("order_actual"))
+    except Exception as e:
+        import traceback; traceback.print_exc()
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        put_conn(conn)
+        return f"저장 오류: {e}", 500
+    put_conn(conn)
+    return redirect("/list")
+
+@app.route("/dashboard")
+@login_required
+@conditional
+def dashboard():
+    monthly_json = json.dumps(get_monthly_trend({}), ensure_ascii=False)
+    return render_page("dashboard",
+        corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False), monthly_json=monthly_json,
+        all_purposes_json=json.dumps(ALL_PURPOSES, ensure_ascii=False))
+
+@app.route("/api/dashboard/aggregates")
+@login_required
+@conditional
+def dashboard_aggregates():
+    return jsonify(get_aggregates(request.args))
+
+@app.route("/api/dashboard/cube")
+@login_required
+@conditional
+def dashboard_cube():
+    return jsonify(get_cube())
+
+@app.route("/api/dashboard/monthly")
+@login_required
+@conditional
+def dashboard_monthly():
+    """?from=2026&to=2027 (또는 ?year=2026) + product/corp/type/purpose"""
+    try:
+        return jsonify(get_monthly_trend(request.args))
+    except ValueError as e:
+        return jsonify({"success": False, "error": f"잘못된 연도: {e}"}), 400
+
+@app.route("/list")
+@login_required
+@conditional
+def list_page():
+    return static_page("list",
+        months_json=json.dumps(MONTHS, ensure_ascii=False), corporations_json=json.dumps(CORPORATIONS, ensure_ascii=False),
+        all_purposes_json=json.dumps(ALL_PURPOSES, ensure_ascii=False))
+
+@app.route("/api/list")
+@login_required
+@conditional
+def list_api():
+    try:
+        page = get_list_page(request.args)
+        if request.args.get("format") == "columnar": page = {**page, "rows": columnar(page["rows"])}
+        return jsonify(page)
+    except (ValueError, TypeError, psycopg2.DataError) as e:
+        return jsonify({"success": False, "error": f"잘못된 cursor: {e}"}), 400
+
+@app.route("/api/search")
+@login_required
+@conditional
+def search_api():
+    """?q=검색어 (+ product/corp/type/purpose 필터, limit, cursor) → {"ids": 점수순 id, "next": 커서, "total": 전체 건수(첫 페이지)}"""
+    if not search_filter(request.args.get("q")):
+        return jsonify({"success": False, "error": "검색어(q) 없음"}), 400
+    try:
+        return jsonify(search_ids(request.args))
+    except (ValueError, TypeError, psycopg2.DataError) as e:
+        return jsonify({"success": False, "error": f"잘못된 cursor: {e}"}), 400
+
+@app.route("/export.csv")
+@login_required
+def export_csv():
+    return Response(stream_csv(request.args.copy()), mimetype="text/csv", headers=download_headers("csv"))
+
+@app.route("/export.xlsx")
+@login_required
+def export_xlsx():
+    return Response(stream_xlsx(request.args.copy()),
+        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers=download_headers("xlsx"))
+
+@app.route("/import", methods=["POST"])
+@login_required
+def import_upload():
+    f = request.files.get("file")
+    if not f or not f.filename:
+        return jsonify({"success": False, "error": "파일이 없습니다."}), 400
+    data = f.read()
+    try:
+        rows = read_xlsx_rows(data) if data[:2] == b"PK" else read_csv_rows(data)
+        valid, report = validate_import(rows)
+    except (zipfile.BadZipFile, ET.ParseError, KeyError, StopIteration, AttributeError, UnicodeDecodeError, csv.Error) as e:
+        return jsonify({"success": False, "error": f"파일을 읽을 수 없습니다: {e}"}), 400
+    if report:
+        return jsonify({"success": False, "errors": report}), 400
+    if not valid:
+        return jsonify({"success": False, "error": "가져올 행이 없습니다."}), 400
+    try:
+        return jsonify(import_investments(valid))
+    except Exception as e:
+        import traceback; traceback.print_exc()
+        return jsonify({"success": False, "error": f"저장 오류: {e}"}), 500
+
+@app.route("/admin/profiles")
+@login_required
+def profile_list():
+    if not is_profile_admin(): return "권한 없음", 403
+    with _profiles_lock: entries = list(reversed(_profiles.values()))
+    rows = "".join(f'<tr><td><a href="/admin/profiles/{p["id"]}">#{p["id"]}</a></td><td>{p["at"]}</td><td>{p["method"]}</td>'
+                   f'<td>{xml_escape(p["path"])}</td><td>{p["status"]}</td><td style="text-align:right">{p["ms"]}ms</td></tr>'
+                   for p in entries)
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>프로파일</title></head><body style="font-family:monospace">'
+            f'<h3>요청 프로파일 (최근 {PROFILE_KEEP}개, 이 워커)</h3><p>?_profile=1 또는 X-Profile: 1 헤더로 요청하면 기록됩니다.</p>'
+            f'<table border="1" cellpadding="4" style="border-collapse:collapse">{rows}</table></body></html>')
+
+@app.route("/admin/profiles/<int:pid>")
+@login_required
+def profile_detail(pid):
+    if not is_profile_admin(): return "권한 없음", 403
+    with _profiles_lock: p = _profiles.get(pid)
+    if not p: return "프로파일을 찾을 수 없습니다. (다른 워커에서 기록되었거나 오래되어 삭제됨)", 404
+    return Response(p["text"], mimetype="text/plain")
+
+@app.errorhandler(PoolTimeout)
+def pool_timeout(e):
+    """DB_POOL_TIMEOUT 안에 연결을 못 받으면 500 대신 503 + Retry-After"""
+    app.logger.warning("DB 연결 대기 초과: %s %s — %s", request.method, request.path, e)
+    return jsonify({"success": False, "error": "요청이 많습니다. 잠시 후 다시 시도해 주세요."}), 503, {"Retry-After": "2"}
+
+@app.route("/metrics")
+def metrics():
+    token = os.environ.get("METRICS_TOKEN")
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return "Unauthorized", 401
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+@app.route("/api/cache/stats")
+@login_required
+def cache_stats():
+    return jsonify(query_cache.stats())
+
+@app.route("/delete/<int:row_id>", methods=["POST"])
+@login_required
+def delete_row(row_id):
+    delete_rows([row_id])
+    return jsonify({"success": True})
+
+@app.route("/api/rows/update", methods=["POST"])
+@login_required
+def rows_update():
+    """{"rows": [{"id": 1, "activity": "..", "order_actual": "2026-05"}, ...]} → {"rows": 바뀐 행, "missing": 없는 id}"""
+    body = request.get_json(silent=True)
+    items = body.get("rows") if isinstance(body, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({"success": False, "error": "rows가 없습니다."}), 400
+    if len(items) > ROWS_BATCH_MAX:
+        return jsonify({"success": False, "error": f"한 번에 {ROWS_BATCH_MAX}행까지"}), 400
+    patches, report = [], []
+    for i, d in enumerate(items):
+        patch, errors = parse_row_patch(d)
+        if errors: report.append({"row": i, "id": d.get("id") if isinstance(d, dict) else None, "errors": errors})
+        else: patches.append(patch)
+    if report:
+        return jsonify({"success": False, "errors": report}), 400
+    result = update_rows(patches)
+    return jsonify(result), 200 if result["success"] else 400
+
+@app.route("/api/rows")
+@login_required
+def rows_get():
+    """?since=버전 → 그 뒤로 바뀐 행 + 삭제된 id (get_row_changes, &format=columnar 가능)
+    ?ids=1,2,3 → {"rows": 그 행들 (없는 id는 빠짐)} — 변경 알림을 받은 화면이 바뀐 행만 다시 받을 때"""
+    if "since" in request.args:
+        try:
+            changes = get_row_changes(int(request.args["since"]))
+        except ValueError:
+            return jsonify({"success": False, "error": "since는 정수"}), 400
+        if request.args.get("format") == "columnar": changes["rows"] = columnar(changes["rows"])
+        return jsonify(changes)
+    try:
+        ids = sorted({int(i) for i in request.args.get("ids", "").split(",") if i.strip()})
+    except ValueError:
+        return jsonify({"success": False, "error": "ids는 쉼표로 구분한 정수"}), 400
+    if not ids or len(ids) > ROWS_BATCH_MAX:
+        return jsonify({"success": False, "error": f"ids는 1~{ROWS_BATCH_MAX}개"}), 400
+    conn = get_conn_tuple()
+    try:
+        rows = fetch_rows(conn.cursor(), ids)
+    finally:
+        put_conn(conn)
+    return jsonify({"rows": rows})
+
+@app.route("/api/events")
+@login_required
+def events():
+    """text/event-stream — event: change, data: {"op": "upsert"|"delete"|"bulk", "ids": [...], "version": n}"""
+    def stream():
+        q = None   # 제너레이터가 실제로 시작될 때 구독 (응답을 보내기 전에 끊기면 큐가 남지 않게)
+        try:
+            q = change_listener.subscribe()
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    payload = q.get(timeout=SSE_PING)
+                except queue.Empty:
+                    yield ": ping\n\n"; continue
+                yield f"event: change\ndata: {payload}\n\n"
+        finally:
+            if q is not None: change_listener.unsubscribe(q)
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route("/api/rows/delete", methods=["POST"])
+@login_required
+def rows_delete():
+    """{"ids": [1, 2, ...]} → {"deleted": 삭제된 id, "missing": 없는 id}"""
+    body = request.get_json(silent=True)
+    ids = body.get("ids") if isinstance(body, dict) else None
+    if not isinstance(ids, list) or not all(is_row_id(i) for i in ids):   # "123" → 1, 2, 3 같은 해석 방지
+        return jsonify({"success": False, "error": "ids는 정수 목록이어야 합니다."}), 400
+    ids = sorted(set(ids))
+    if not ids or len(ids) > ROWS_BATCH_MAX:
+        return jsonify({"success": False, "error": f"ids는 1~{ROWS_BATCH_MAX}개"}), 400
+    return jsonify(delete_rows(ids))
+
+INPUT_TPL = r"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>설비투자비 한계돌파 실적 관리 시스템</title>
+<link rel="stylesheet" href="{{ asset('input.css') }}"></head><body>
+<div class="header">
+  <h1>📋 <span class="i18n" data-ko="설비투자비 한계돌파 실적 관리 시스템" data-en="Facility Investment Breakthrough System">설비투자비 한계돌파 실적 관리 시스템</span></h1>
+  <div class="header-right">
+    <div class="lang-toggle-header">
+      <button class="lang-btn-h active" id="langKoI" onclick="setLang('ko')">🇰🇷 한글</button>
+      <button class="lang-btn-h" id="langEnI" onclick="setLang('en')">🇺🇸 ENG</button>
+    </div>
+    <a href="/dashboard" class="header-btn">🏠 <span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
+    <a href="/" class="header-btn">📄 Data <span class="i18n" data-ko="입력" data-en="Entry">입력</span></a>
+    <a href="/list" class="header-btn">📊 <span class="i18n" data-ko="투자실적 조회" data-en="Records">투자실적 조회</span></a>
+  </div>
+</div>
+<div class="container">
+  <form method="post" action="/save" id="mainForm">
+  {%- if row_id -%}<input type="hidden" name="row_id" value="{{ row_id }}">{%- endif -%}
+  <div class="row">
+    <div class="card"><div class="card-header pink">📌 <span class="i18n" data-ko="투자 분류" data-en="Investment Classification">투자 분류</span></div><div class="card-body">
+        <div class="form-group"><div class="form-label">💼 <span class="i18n" data-ko="투자 유형" data-en="Investment Type">투자 유형</span></div>
+          <div class="toggle-group">
+            <div class="toggle-btn {%- if not edit_data or edit_data[1]=='확장' %} active{%- endif -%}" onclick="selectType(this,'확장')"><span class="i18n" data-ko="확장" data-en="Expansion">확장</span></div>
+            <div class="toggle-btn {%- if edit_data and edit_data[1]=='경상' %} active{%- endif -%}" onclick="selectType(this,'경상')"><span class="i18n" data-ko="경상" data-en="Recurring">경상</span></div>
+          </div><input type="hidden" name="invest_type" id="invest_type" value="{%- if edit_data -%}{{ edit_data[1] or '확장' }}{%- else -%}확장{%- endif -%}"></div>
+        <div class="form-row">
+          <div class="form-group"><div class="form-label">📦 <span class="i18n" data-ko="제품" data-en="Product">제품</span></div>
+            <select name="product" id="product" onchange="updateCorporations()">{%- for p in products -%}<option value="{{ p }}" {%- if edit_data and edit_data[2]==p %} selected{%- endif -%}>{{ p }}</option>{%- endfor -%}</select></div>
+          <div class="form-group"><div class="form-label">🌍 <span class="i18n" data-ko="법인" data-en="Corporation">법인</span></div>
+            <select name="corporation" id="corporation"></select></div>
+        </div>
+        <div class="info-box"><div class="info-box-title">💡 TIP</div><div class="info-box-text"><span class="i18n" data-ko="• 5천만원 미만인 경상투자 건은 Base금액을 집행가로 기입
+• 해외 법인은 HQ 생산기술에서 검토/지원해주는 투자 건만 기입" data-en="• For recurring investments under 50M KRW, enter Base amount as execution price
+• For overseas subsidiaries, enter only investments reviewed/supported by HQ Prod. Tech.">• 5천만원 미만인 경상투자 건은 Base금액을 집행가로 기입<br>• 해외 법인은 HQ 생산기술에서 검토/지원해주는 투자 건만 기입</span></div></div>
+    </div></div>
+    <div class="card"><div class="card-header cyan">📋 <span class="i18n" data-ko="투자 항목 상세" data-en="Investment Details">투자 항목 상세</span></div><div class="card-body">
+        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></div>
+          <select name="purpose" id="purpose_select">{%- for p in all_purposes -%}<option value="{{ p }}" {%- if edit_data and edit_data[4]==p %} selected{%- endif -%}>{{ p }}</option>{%- endfor -%}</select></div>
+        <div class="form-group"><div class="form-label">📝 <span class="i18n" data-ko="투자항목" data-en="Item">투자항목</span></div>
+          <input type="text" name="invest_item" value="{%- if edit_data -%}{{ edit_data[5] or '' }}{%- endif -%}" placeholder="예: 창원 선진화 오븐라인" id="invest_item_input"></div>
+    </div></div>
+  </div>
+  <div class="card card-full"><div class="card-header amber">📅 <span class="i18n" data-ko="투자 주요 일정" data-en="Schedule">투자 주요 일정</span></div><div class="card-body">
+      <div class="form-row">
+        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="발주 목표" data-en="Order Target">발주 목표</span></div><input type="month" name="order_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[6] or '' }}{%- endif -%}"></div>
+        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="발주 실적" data-en="Order Actual">발주 실적</span></div><input type="month" name="order_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[7] or '' }}{%- endif -%}"></div></div>
+      <div class="form-row">
+        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="셋업 목표" data-en="Setup Target">셋업 목표</span></div><input type="month" name="setup_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[8] or '' }}{%- endif -%}"></div>
+        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="셋업 실적" data-en="Setup Actual">셋업 실적</span></div><input type="month" name="setup_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[9] or '' }}{%- endif -%}"></div></div>
+      <div class="form-row">
+        <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="양산 목표" data-en="Mass Target">양산 목표</span></div><input type="month" name="mass_target" class="month-i" value="{%- if edit_data -%}{{ edit_data[10] or '' }}{%- endif -%}"></div>
+        <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="양산 실적" data-en="Mass Actual">양산 실적</span></div><input type="month" name="mass_actual" class="month-i" value="{%- if edit_data -%}{{ edit_data[11] or '' }}{%- endif -%}"></div></div>
+      <div class="form-group"><div class="form-label">❓ <span class="i18n" data-ko="연기사유" data-en="Delay Reason">연기사유</span></div><input type="text" name="delay_reason" value="{%- if edit_data -%}{{ edit_data[12] or '' }}{%- endif -%}" placeholder="예 : 제품개발 지연에 따른 양산 일정 지연" id="delay_reason_input" style="color:#999" onfocus="this.style.color='#333'" onblur="if(!this.value)this.style.color='#999'"></div>
+  </div></div>
+  <div class="row" style="margin-top:24px">
+    <div class="card"><div class="card-header blue">💰 <span class="i18n" data-ko="투자금액 (억원)" data-en="Amount (100M KRW)">투자금액 (억원)</span></div><div class="card-body">
+        <div class="form-group"><div class="form-label">💵 Base</div><input type="number" name="base_amount" step="0.01" value="{%- if edit_data -%}{{ edit_data[13] or '' }}{%- endif -%}" placeholder="0.00"></div>
+        <div class="form-row">
+          <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="발주가 목표" data-en="Order Price Tgt">발주가 목표</span></div><input type="number" name="order_price_target" step="0.01" value="{%- if edit_data -%}{{ edit_data[14] or '' }}{%- endif -%}" placeholder="0.00"></div>
+          <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="발주가 실적" data-en="Order Price Act">발주가 실적</span></div><input type="number" name="order_price_actual" step="0.01" value="{%- if edit_data -%}{{ edit_data[15] or '' }}{%- endif -%}" placeholder="0.00"></div></div>
+    </div></div>
+    <div class="card"><div class="card-header violet">📊 <span class="i18n" data-ko="절감 실적 (억원)" data-en="Savings (100M KRW)">절감 실적 (억원)</span></div><div class="card-body">
+        <div class="form-row">
+          <div class="form-group"><div class="form-label">🎯 <span class="i18n" data-ko="절감 목표" data-en="Savings Target">절감 목표</span></div><input type="number" name="saving_target" step="0.01" value="{%- if edit_data -%}{{ edit_data[16] or '' }}{%- endif -%}" placeholder="0.00"></div>
+          <div class="form-group"><div class="form-label">✅ <span class="i18n" data-ko="절감 실적(자동)" data-en="Savings(auto)">절감 실적(자동)</span></div><input id="saving_actual" name="saving_actual" readonly value="{%- if edit_data -%}{{ edit_data[17] or '' }}{%- endif -%}" placeholder="0.00"></div></div>
+    </div></div>
+  </div>
+  <div class="card card-full"><div class="card-header emerald">📊 <span class="i18n" data-ko="절감 활동 실적 (억원)" data-en="Reduction Activities (100M KRW)">절감 활동 실적 (억원)</span></div><div class="card-body">
+      <div class="table-wrapper"><table class="reduce-table"><thead><tr>
+        <th style="width:110px"><span class="i18n" data-ko="항목" data-en="Item">항목</span></th><th style="width:100px"><span class="i18n" data-ko="합계" data-en="Total">합계</span></th>
+        <th><span class="reduce-number">①</span><span class="i18n" data-ko="신기술/신공법" data-en="New Tech/Method">신기술/신공법</span></th>
+            <th><span class="reduce-number">②</span><span class="i18n" data-ko="염가형 부품" data-en="Low-cost Parts">염가형 부품</span></th>
+            <th><span class="reduce-number">③</span><span class="i18n" data-ko="중국/Local 설비" data-en="China/Local Equip">중국/Local 설비</span></th>
+            <th><span class="reduce-number">④</span><span class="i18n" data-ko="중국/한국 Collabo" data-en="CN/KR Collabo">중국/한국 Collabo</span></th>
+            <th><span class="reduce-number">⑤</span><span class="i18n" data-ko="컨테이너(FR) 최소화" data-en="Container(FR) Min.">컨테이너(FR) 최소화</span></th>
+            <th><span class="reduce-number">⑥</span><span class="i18n" data-ko="출장인원 최소화" data-en="Travel Staff Min.">출장인원 최소화</span></th>
+            <th><span class="reduce-number">⑦</span><span class="i18n" data-ko="유휴설비" data-en="Idle Equip">유휴설비</span></th>
+            <th><span class="reduce-number">⑧</span><span class="i18n" data-ko="사양최적화" data-en="Spec Opt.">사양최적화</span></th>
+            <th><span class="reduce-number">⑨</span><span class="i18n" data-ko="기타" data-en="Others">기타</span></th>
+      </tr></thead><tbody><tr>
+        <td><span class="i18n" data-ko="절감 실적" data-en="Savings">절감 실적</span></td>
+        <td><input id="total_display" readonly value="{%- if edit_data -%}{{ edit_data[27] or '0.00' }}{%- else -%}0.00{%- endif -%}"></td>
+        {%- for i in range(18,27) -%}<td><input class="reduce" type="number" name="reduce_{{ i-17 }}" step="0.01" value="{%- if edit_data -%}{{ edit_data[i] or '' }}{%- endif -%}" oninput="calcTotal()"></td>{%- endfor -%}
+      </tr></tbody></table></div>
+      <div class="activity-section"><div class="activity-label">📝 <span class="i18n" data-ko="활동내용" data-en="Activity">활동내용</span></div>
+        <textarea name="activity" placeholder="예 : 1) cabinet 가공설비 신기술 적용, 3) 모터 중국설, 6) Local 인원 활용한 한국 출장자 축소(100 → 50명)" id="activity_input" style="color:#999" onfocus="this.style.color='#333'" onblur="if(!this.value)this.style.color='#999'">{%- if edit_data -%}{{ edit_data[28] or '' }}{%- endif -%}</textarea></div>
+  </div></div>
+  <input type="hidden" name="saving_total" id="saving_total" value="{%- if edit_data -%}{{ edit_data[27] or '' }}{%- endif -%}">
+  <div class="button-group">
+    <button type="submit" class="btn-primary">💾 <span class="i18n" data-ko="저장" data-en="Save">저장</span></button>
+    <a href="/list" class="btn-secondary">📊 <span class="i18n" data-ko="조회" data-en="View">조회</span></a>
+  </div></form>
+</div>
+<script>
+const CORPORATIONS={{ corporations_json | safe }};
+const EDIT_PRODUCT={%- if edit_data -%}"{{ edit_data[2] or '키친' }}"{%- else -%}"키친"{%- endif -%};
+const EDIT_CORPORATION={%- if edit_data -%}"{{ edit_data[3] or '' }}"{%- else -%}""{%- endif -%};
+</script><script src="{{ asset('input.js') }}"></script></body></html>"""
+
+# ===== DASHBOARD TEMPLATE =====
+DASHBOARD_TPL = r"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>대시보드</title>
+<link rel="stylesheet" href="{{ asset('dashboard.css') }}">
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+</head><body>
+<div class="sidebar">
+  <div class="logo-wrap">
+    <img src="{{ asset('logo-sidebar.jpg') }}" style="width:46px;height:46px;border-radius:8px;object-fit:contain;background:transparent" alt="LG">
+    <div class="logo-text-group"><span class="logo-text-lg">LG</span><span class="logo-text-sub">전자</span></div>
+  </div>
+  <div class="menu-section">
+    <div class="menu-label"><span class="i18n" data-ko="설비투자비 한계돌파" data-en="Investment Breakthrough">설비투자비 한계돌파</span></div>
+    <a href="/dashboard" class="menu-item active"><span class="menu-icon">🏠</span><span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
+    <a href="/list" class="menu-item"><span class="menu-icon">📋</span><span class="i18n" data-ko="투자실적 조회" data-en="Records">투자실적 조회</span></a>
+    <a href="/" class="menu-item"><span class="menu-icon">✏️</span><span class="i18n" data-ko="Data 입력" data-en="Data Entry">Data 입력</span></a>
+    </div>
+<div style="padding:10px 18px 18px">
+    <a href="#" onclick="event.preventDefault();confirmLogout()" style="display:flex;align-items:center;gap:7px;background:rgba(255,255,255,0.06);color:#8a94a6;padding:10px 16px;border-radius:8px;text-decoration:none;font-size:13px;font-weight:500;justify-content:center;transition:all 0.2s;border:1px solid rgba(255,255,255,0.08)"><span style="font-size:15px">🔓</span> <span class="i18n" data-ko="로그아웃" data-en="Logout">로그아웃</span></a>
+  </div>
+</div>
+<div class="main">
+  <div class="topbar"><div class="topbar-title">📊 <span class="i18n" data-ko="'26년 설비 투자비 한계돌파 현황" data-en="'26 Facility Investment Breakthrough">'26년 설비 투자비 한계돌파 현황</span></div><div class="topbar-sub" style="font-size:17px;font-weight:600"><span class="i18n" data-ko="창원생산기술실" data-en="Changwon Prod. Tech.">창원생산기술실</span></div></div>
+  <div class="filter-bar">
+    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="제품" data-en="Product">제품</span></div><select id="fProduct" onchange="onProductChange()"></select></div>
+    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="법인" data-en="Corp.">법인</span></div><select id="fCorp" onchange="applyFilter()"><option value="">전체</option></select></div>
+    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="투자유형" data-en="Type">투자유형</span></div><select id="fType" onchange="applyFilter()"></select></div>
+    <div class="filter-group"><div class="filter-label"><span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></div><select id="fPurpose" onchange="applyFilter()"><option value="">전체</option></select></div>
+    <div class="lang-toggle"><button class="lang-btn active" id="langKo" onclick="setLang('ko')">🇰🇷 한글</button><button class="lang-btn" id="langEn" onclick="setLang('en')">🇺🇸 ENG</button></div>
+  </div>
+  <div class="kpi-grid">
+    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="건수" data-en="Count">건수</span></div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpCnt">0</span><span class="kpi-unit"><span class="i18n" data-ko="건" data-en="cases">건</span></span></div></div>
+    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label">Base</div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpBase">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
+    <div class="kpi-card expand"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></div><div class="kpi-badge expand"><span class="i18n" data-ko="확장 투자" data-en="Expansion">확장 투자</span></div></div><div><span class="kpi-value" id="kExpSave">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
+    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="건수" data-en="Count">건수</span></div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorCnt">0</span><span class="kpi-unit"><span class="i18n" data-ko="건" data-en="cases">건</span></span></div></div>
+    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label">Base</div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorBase">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
+    <div class="kpi-card normal"><div class="kpi-top"><div class="kpi-label"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></div><div class="kpi-badge normal"><span class="i18n" data-ko="경상 투자" data-en="Recurring">경상 투자</span></div></div><div><span class="kpi-value" id="kNorSave">0</span><span class="kpi-unit"><span class="i18n" data-ko="억원" data-en="100M">억원</span></span></div></div>
+  </div>
+  <div class="chart-grid chart-row-2" style="margin-bottom:20px">
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">💰 <span class="i18n" data-ko="전체 Base 대비 절감 실적" data-en="Total Base vs Savings">전체 Base 대비 절감 실적</span></div></div><div class="chart-wrap"><canvas id="cBaseTotal"></canvas></div></div>
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">📦 <span class="i18n" data-ko="제품별 Base 대비 절감 실적" data-en="Product Base vs Savings">제품별 Base 대비 절감 실적</span></div></div><div class="chart-wrap"><canvas id="cBaseProduct"></canvas></div></div>
+  </div>
+  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">📊 <span class="i18n" data-ko="투자유형별 절감 실적" data-en="Savings by Type">투자유형별 절감 실적</span></div></div>
+<div style="display:grid;grid-template-columns:240px 1fr;gap:0;height:320px;overflow:hidden">
+  <div class="invest-type-total-wrap"><div class="invest-type-total-label">Total</div><div style="position:relative;height:280px"><canvas id="cInvestTypeTotal"></canvas></div></div>
+  <div style="position:relative;padding-left:8px;height:320px"><div style="position:relative;height:300px"><canvas id="cInvestTypeProduct"></canvas></div></div>
+</div>
+  </div>
+  <div class="chart-grid chart-row-3" style="margin-bottom:20px">
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">🔧 <span class="i18n" data-ko="절감 활동별 실적" data-en="By Activity">절감 활동별 실적</span></div></div><div class="chart-wrap activity"><canvas id="cActivity"></canvas></div></div>
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">🥧 <span class="i18n" data-ko="제품별 절감 실적" data-en="By Product">제품별 절감 실적</span></div></div><div class="chart-wrap pie"><canvas id="cPie"></canvas></div></div>
+  </div>
+  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">🌍 <span class="i18n" data-ko="법인별 절감 목표 및 실적" data-en="Corp. Target vs Actual">법인별 절감 목표 및 실적</span></div></div><div class="chart-wrap tall"><canvas id="cCorp"></canvas></div></div>
+  </div>
+  <div class="chart-grid chart-row-4" style="margin-bottom:20px">
+    <div class="chart-card"><div class="chart-header"><div class="chart-title">📅 <span class="i18n" data-ko="월별 절감 실적" data-en="Monthly Savings">월별 절감 실적</span></div><select id="fYear" class="year-select" onchange="loadMonthly()"></select></div><div class="chart-wrap monthly"><canvas id="cMonthly"></canvas></div></div>
+  </div>
+</div>
+<!-- World Map Modal -->
+<script>
+const CORPS_MAP={{ corporations_json | safe }};const CUBE_WORKER="{{ asset('cube.js') }}",ROWCACHE_URL="{{ asset('rowcache.js') }}";let MONTHLY_DATA={{ monthly_json | safe }};const ALL_PURPOSES={{ all_purposes_json | safe }};
+</script><script src="{{ asset('dashboard.js') }}"></script></body></html>"""
+
+# ===== LIST TEMPLATE =====
+LIST_TPL = r"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>실적 조회</title>
+<link rel="stylesheet" href="{{ asset('list.css') }}">
+</head><body>
+<div class="top-header">
+  <h2>📊 <span class="i18n" data-ko="설비 투자비 활동 실적 조회" data-en="Investment Performance">설비 투자비 활동 실적 조회</span></h2>
+  <div class="top-header-right">
+    <div class="lang-toggle-list"><button class="lang-btn-list active" id="langKo2" onclick="setLang('ko')">🇰🇷 한글</button><button class="lang-btn-list" id="langEn2" onclick="setLang('en')">🇺🇸 ENG</button></div>
+    <button class="excel-btn" onclick="downloadExcel()">📥 Excel</button>
+    <button class="excel-btn" onclick="downloadCsv()">📥 CSV</button>
+    <button class="excel-btn" onclick="document.getElementById('importFile').click()">📤 <span class="i18n" data-ko="가져오기" data-en="Import">가져오기</span></button><input type="file" id="importFile" accept=".csv,.xlsx" style="display:none" onchange="uploadImport(this)">
+    <a href="/dashboard">🏠 <span class="i18n" data-ko="대시보드" data-en="Dashboard">대시보드</span></a>
+    <a href="/">◀ <span class="i18n" data-ko="입력" data-en="Entry">입력</span></a>
+  </div>
+</div>
+<div class="filter-bar">
+  <label><span class="i18n" data-ko="제품" data-en="Product">제품</span></label>
+  <select id="fp" onchange="applyFilter();updateFilterCorps()"></select>
+  <label><span class="i18n" data-ko="법인" data-en="Corp.">법인</span></label>
+  <select id="fc" onchange="applyFilter()"></select>
+  <label><span class="i18n" data-ko="투자유형" data-en="Type">투자유형</span></label>
+  <select id="ft" onchange="applyFilter()"></select>
+  <label><span class="i18n" data-ko="투자목적" data-en="Purpose">투자목적</span></label>
+  <select id="fpu" onchange="applyFilter()"></select>
+  <label><span class="i18n" data-ko="검색" data-en="Search">검색</span></label>
+  <input id="fq" type="search" class="search-box" placeholder="항목 / 절감활동 / 연기사유" oninput="onSearch()">
+  <div class="bulk-bar">
+    <select id="bf"><option value="order_actual" class="i18n" data-ko="발주실적" data-en="Order Act">발주실적</option><option value="setup_actual" class="i18n" data-ko="셋업실적" data-en="Setup Act">셋업실적</option><option value="mass_actual" class="i18n" data-ko="양산실적" data-en="Mass Act">양산실적</option><option value="delay_reason" class="i18n" data-ko="연기사유" data-en="Delay Reason">연기사유</option><option value="activity" class="i18n" data-ko="절감활동" data-en="Activity">절감활동</option></select>
+    <input id="bv" placeholder="YYYY-MM / text">
+    <button onclick="bulkEdit()">✏️ <span class="i18n" data-ko="선택 일괄 수정" data-en="Edit selected">선택 일괄 수정</span></button>
+    <button onclick="deleteSelected()">🗑️ <span class="i18n" data-ko="선택 삭제" data-en="Delete selected">선택 삭제</span></button>
+  </div>
+  <div class="legend">
+    <div class="legend-item"><span class="sig s-g"></span><span class="i18n" data-ko="목표초과" data-en="Above">목표초과</span></div>
+    <div class="legend-item"><span class="sig s-y"></span><span class="i18n" data-ko="미달" data-en="Below">미달</span></div>
+    <div class="legend-item"><span class="sig s-x"></span><span class="i18n" data-ko="미입력" data-en="N/A">미입력</span></div>
+  </div>
+</div>
+<div class="table-container"><div class="table-wrap">
+  <table id="mainTable"><thead>
+<tr class="gh">
+  <th class="g-c" colspan="6" style="position:sticky;left:0;z-index:21;text-align:center"><span class="i18n" data-ko="투자 분류" data-en="Classification">투자 분류</span></th>
+      <th class="g-s" colspan="7">📅 <span class="i18n" data-ko="일정" data-en="Schedule">일정</span></th>
+      <th class="g-v" colspan="4">💰 <span class="i18n" data-ko="투자절감" data-en="Savings">투자절감</span></th>
+      <th class="g-r" colspan="11">📊 <span class="i18n" data-ko="절감활동" data-en="Activities">절감활동</span></th>
+      <th class="g-e" colspan="3">🎯 <span class="i18n" data-ko="목표" data-en="Target">목표</span></th>
+    </tr>
+    <tr>
+      <th class="sc c0"><input type="checkbox" id="selAll" onchange="selectAll(this.checked)"> <span class="i18n" data-ko="수정" data-en="Edit">수정</span></th><th class="sc c1"><span class="i18n" data-ko="제품" data-en="Product">제품</span></th><th class="sc c2"><span class="i18n" data-ko="법인" data-en="Corp">법인</span></th><th class="sc c3"><span class="i18n" data-ko="유형" data-en="Type">유형</span></th><th class="sc c4"><span class="i18n" data-ko="투자항목" data-en="Item">투자항목</span></th><th class="sc c5"><span class="i18n" data-ko="목적" data-en="Purpose">목적</span></th>
+      <th class="gs"><span class="i18n" data-ko="발주목표" data-en="Order Tgt">발주목표</span></th><th class="gs"><span class="i18n" data-ko="발주실적" data-en="Order Act">발주실적</span></th><th class="gs"><span class="i18n" data-ko="셋업목표" data-en="Setup Tgt">셋업목표</span></th><th class="gs"><span class="i18n" data-ko="셋업실적" data-en="Setup Act">셋업실적</span></th><th class="gs"><span class="i18n" data-ko="양산목표" data-en="Mass Tgt">양산목표</span></th><th class="gs"><span class="i18n" data-ko="양산실적" data-en="Mass Act">양산실적</span></th><th class="gs"><span class="i18n" data-ko="연기사유" data-en="Delay">연기사유</span></th>
+      <th class="gv">Base</th><th class="gv"><span class="i18n" data-ko="발주가목표" data-en="Ord.Price Tgt">발주가목표</span></th><th class="gv"><span class="i18n" data-ko="발주가실적" data-en="Ord.Price Act">발주가실적</span></th><th class="gv"><span class="i18n" data-ko="절감목표" data-en="Save Tgt">절감목표</span></th>
+      <th class="gr"><span class="i18n" data-ko="절감실적" data-en="Savings">절감실적</span></th><th class="gr reduce-col"><span class="i18n" data-ko="①신기술/신공법" data-en="①NewTech">①신기술/신공법</span></th><th class="gr reduce-col"><span class="i18n" data-ko="②염가형 부품" data-en="②LowCost">②염가형 부품</span></th><th class="gr reduce-col"><span class="i18n" data-ko="③중국/Local 설비" data-en="③China/Local">③중국/Local 설비</span></th><th class="gr reduce-col"><span class="i18n" data-ko="④중국/한국 Collabo" data-en="④CN/KR Collabo">④중국/한국 Collabo</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑤컨테이너(FR) 최소화" data-en="⑤Container Min">⑤컨테이너(FR) 최소화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑥출장인원 최소화" data-en="⑥Travel Min">⑥출장인원 최소화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑦유휴설비" data-en="⑦Idle">⑦유휴설비</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑧사양최적화" data-en="⑧Spec Opt">⑧사양최적화</span></th><th class="gr reduce-col"><span class="i18n" data-ko="⑨기타" data-en="⑨Others">⑨기타</span></th><th class="gr"><span class="i18n" data-ko="활동" data-en="Activity">활동</span></th>
+      <th class="ge"><span class="i18n" data-ko="목표%" data-en="Tgt%">목표%</span></th><th class="ge"><span class="i18n" data-ko="실적%" data-en="Act%">실적%</span></th><th class="ge">Signal</th>
+    </tr>
+  </thead><tbody id="tableBody"></tbody><tfoot id="tableFoot"></tfoot></table>
+</div><div class="footer-info" id="footerInfo">총 0건</div></div>
+<script>
+const MONTHS={{ months_json | safe }};const CORPORATIONS={{ corporations_json | safe }};const ALL_PURPOSES={{ all_purposes_json | safe }};
+</script><script src="{{ asset('rowcache.js') }}"></script><script src="{{ asset('list.js') }}"></script></body></html>"""
+
+# ===== LOGIN TEMPLATE =====
+LOGIN_TPL = r"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>로그인 | 설비투자 한계돌파 시스템</title>
+<link rel="stylesheet" href="{{ asset('login.css') }}">
+</head>
+<body>
+
+<div class="login-card">
+    <div class="logo-area">
+        <img src="{{ asset('logo-login.jpg') }}" alt="LG Logo" style="height:85px">
+    </div>
+
+    <h1 class="system-title">설비투자 한계돌파 시스템</h1>
+    <p class="system-subtitle">Facility Investment Management</p>
+
+    {% if error %}
+    <div class="error-msg">⚠️ {{ error }}</div>
+    {% endif %}
+
+    <form method="post">
+        <div class="form-group">
+            <label class="form-label">ID (사번)</label>
+            <input type="text" name="username" class="input-field" placeholder="admin" required>
+        </div>
+        <div class="form-group">
+            <label class="form-label">Password</label>
+            <input type="password" name="password" class="input-field" placeholder="••••" required>
+        </div>
+        <button type="submit" class="login-btn">로그인</button>
+    </form>
+
+    <div class="footer-text">
+        © 2024 LG Electronics. Production Tech. Group.
+    </div>
+</div>
+
+</body>
+</html>"""
+
+# ===== 템플릿 (시작 시 한 번 컴파일) =====
+# render_template_string은 호출마다 템플릿 전체를 파싱/컴파일 → 모듈 로드 시 한 번만 컴파일해 두고 재사용
+TEMPLATES = {name: app.jinja_env.from_string(src) for name, src in
+             (("input", INPUT_TPL), ("dashboard", DASHBOARD_TPL), ("list", LIST_TPL), ("login", LOGIN_TPL))}
+_static_pages = {}
+
+def render_page(name, **ctx):
+    t0 = time.perf_counter()
+    try:
+        return render_template(TEMPLATES[name], **ctx)
+    finally:
+        add_phase("template", time.perf_counter() - t0)
+
+def static_page(name, **ctx):
+    """요청마다 달라지는 값이 없는 페이지(목록, 로그인, 새 입력 화면)는 워커당 한 번만 렌더링"""
+    html = _static_pages.get(name)
+    if html is None: html = _static_pages[name] = render_page(name, **ctx)
+    return html
+
+if __name__ == "__main__":
+    print("🚀 서버 시작: http://127.0.0.1:5000")
     app.run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
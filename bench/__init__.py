@@ -0,0 +1,9 @@
+"""성능 벤치마크 (python -m bench.<모듈>)
+
+- datagen : 로컬 PostgreSQL에 investment / investment_monthly / investment_rollup 합성 데이터 생성
+- micro   : 조회/저장/화면 렌더링 마이크로 벤치마크
+- load    : 동시 부하 (Flask 테스트 클라이언트 또는 로컬 gunicorn)
+- compare : 결과 JSON을 기준선(baseline)과 비교해 회귀 확인
+
+모든 명령은 app.py와 같은 DATABASE_URL을 사용 — 운영 DB에는 절대 실행하지 말 것
+"""
@@ -0,0 +1,56 @@
+"""벤치마크 공통 — 앱 로드, 통계, 결과 JSON 저장"""
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "bench", "results")
+
+def load_app():
+    """app 모듈 import (DATABASE_URL 필요, 마이그레이션도 이때 적용)"""
+    if not os.environ.get("DATABASE_URL"):
+        sys.exit("DATABASE_URL을 로컬 벤치마크용 DB로 설정하세요")
+    sys.path.insert(0, ROOT)
+    import app
+    app.app.testing = True
+    return app
+
+def login(client):
+    client.post("/login", data={"username": "admin", "password": "1234"})
+    return client
+
+def summarize(samples):
+    """초 단위 측정값 → ms 통계"""
+    s = sorted(samples)
+    if not s: return {"n": 0}
+    pct = lambda p: s[min(len(s) - 1, int(round(p / 100 * (len(s) - 1))))] * 1000
+    return {"n": len(s), "mean_ms": round(sum(s) / len(s) * 1000, 3), "p50_ms": round(pct(50), 3),
+            "p95_ms": round(pct(95), 3), "p99_ms": round(pct(99), 3), "max_ms": round(s[-1] * 1000, 3)}
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+def row_count(app):
+    conn = app.get_conn_tuple()
+    try:
+        c = conn.cursor(); c.execute("SELECT COUNT(*) FROM investment"); return c.fetchone()[0]
+    finally:
+        app.put_conn(conn)
+
+def save_result(kind, results, out=None, **meta):
+    """결과를 JSON으로 저장 (out 미지정 시 bench/results/<kind>-<시각>.json) → 경로"""
+    doc = {"kind": kind, "at": datetime.now().isoformat(timespec="seconds"), "git": git_rev(),
+           "python": platform.python_version(), **meta, "results": results}
+    if not out:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"{kind}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {out}")
+    return out
@@ -0,0 +1,43 @@
+"""결과 비교 — python -m bench.compare 기준선.json 새결과.json [--threshold 0.1]
+
+지연(p50/p95)·메모리는 커지면, 처리량(rps)은 작아지면 회귀 — threshold(비율)를 넘는 항목이 있으면 종료 코드 1
+"""
+import argparse
+import json
+
+HIGHER_IS_WORSE = ("p50_ms", "p95_ms", "peak_kb", "rss_mb", "error_rate")
+LOWER_IS_WORSE = ("rps",)
+
+def _flatten(doc):
+    """{"results": {이름: {지표: 값}}, 최상위 지표} → {(이름, 지표): 값}"""
+    out = {(name, k): v for name, r in doc["results"].items() for k, v in r.items() if isinstance(v, (int, float))}
+    out.update({("(전체)", k): doc[k] for k in (*HIGHER_IS_WORSE, *LOWER_IS_WORSE) if isinstance(doc.get(k), (int, float))})
+    return out
+
+def report(baseline, current, threshold=0.1):
+    with open(baseline, encoding="utf-8") as f: base = json.load(f)
+    with open(current, encoding="utf-8") as f: cur = json.load(f)
+    for key in ("kind", "rows", "target", "workers", "concurrency", "write_ratio"):
+        if base.get(key) != cur.get(key):
+            print(f"주의: 실행 조건이 다름 — {key}: 기준선 {base.get(key)}, 현재 {cur.get(key)}")
+    b, c = _flatten(base), _flatten(cur); regressions = 0
+    print(f"기준선 {base.get('git')} ({base.get('at')})  →  현재 {cur.get('git')} ({cur.get('at')})")
+    for key in sorted(set(b) & set(c)):
+        name, metric = key
+        if metric not in HIGHER_IS_WORSE + LOWER_IS_WORSE or not b[key]: continue
+        change = (c[key] - b[key]) / b[key]
+        worse = change > threshold if metric in HIGHER_IS_WORSE else change < -threshold
+        regressions += worse
+        print(f"{'✗' if worse else ' '} {name:<42} {metric:<10} {b[key]:>12.2f} → {c[key]:>12.2f}  ({change:+.1%})")
+    print(f"회귀 {regressions}건 (기준 ±{threshold:.0%})")
+    return 1 if regressions else 0
+
+def main():
+    p = argparse.ArgumentParser(description="벤치마크 결과를 기준선과 비교")
+    p.add_argument("baseline"); p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화 비율 (기본 0.1 = 10%%)")
+    a = p.parse_args()
+    raise SystemExit(report(a.baseline, a.current, a.threshold))
+
+if __name__ == "__main__":
+    main()
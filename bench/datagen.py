@@ -0,0 +1,79 @@
+"""합성 데이터 생성 — python -m bench.datagen --rows 100000 [--reset] [--seed 1]
+
+investment를 COPY로 채운 뒤 월별 원장/롤업은 앱과 같은 SQL(ledger_insert_sql, rollup_select_sql)로 다시 만든다
+"""
+import argparse
+import csv
+import io
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from .common import load_app
+
+BATCH = 50_000
+ITEMS = ["오븐 라인", "도장 설비", "프레스 금형", "조립 컨베이어", "검사 지그", "사출기", "용접 로봇", "포장기"]
+ACTIVITIES = ["국산화", "사양 최적화", "중국 설비 적용", "중고 설비 활용", "공용화", "자체 제작", "업체 경쟁 입찰"]
+REASONS = ["", "", "", "업체 납기 지연", "사양 변경", "예산 재검토"]
+
+def month(rnd, start, spread):
+    y, m = divmod(start.year * 12 + start.month - 1 + rnd.randrange(spread), 12)
+    return date(y, m + 1, 1)
+
+def fake_row(rnd, app, now):
+    """investment 한 행 (INVEST_COLUMNS 순서 + created_at, updated_at)"""
+    product = rnd.choice(app.PRODUCTS); base = round(rnd.lognormvariate(3, 1), 1)
+    order_target = month(rnd, date(2026, 1, 1), 36)
+    done = rnd.random() < 0.6
+    order_actual = month(rnd, order_target, 4) if done else None
+    setup = month(rnd, order_target, 6); mass = month(rnd, setup, 4)
+    saving_target = round(base * rnd.uniform(0.1, 0.5), 1)
+    reduce = [round(rnd.choice((0, 0, 0, rnd.uniform(0, base * 0.1))), 1) for _ in range(9)]
+    saving_actual = round(sum(reduce), 1) if done else 0.0
+    created = now - timedelta(minutes=rnd.randrange(60 * 24 * 365))
+    return (rnd.choice(app.INVEST_TYPES), product, rnd.choice(app.CORPORATIONS[product]), rnd.choice(app.ALL_PURPOSES),
+            f"{rnd.choice(ITEMS)} {rnd.randrange(1, 100)}호", order_target, order_actual,
+            setup, setup if done else None, mass, mass if done and rnd.random() < 0.5 else None, rnd.choice(REASONS),
+            base, round(base * 0.9, 1), round(base * 0.8, 1) if done else 0.0, saving_target, saving_actual,
+            *reduce, saving_actual, rnd.choice(ACTIVITIES), created, created)
+
+def generate(app, rows, reset=False, seed=1):
+    rnd = random.Random(seed); now = datetime.now().astimezone()
+    cols = ", ".join((*app.INVEST_COLUMNS, "created_at", "updated_at"))
+    conn = app.get_conn_tuple()
+    try:
+        c = conn.cursor(); t0 = time.perf_counter()
+        if reset: c.execute("TRUNCATE investment, investment_monthly, investment_rollup RESTART IDENTITY")
+        done = 0
+        while done < rows:
+            n = min(BATCH, rows - done); buf = io.StringIO(); w = csv.writer(buf)
+            for _ in range(n):
+                w.writerow(["" if v is None else v for v in fake_row(rnd, app, now)])
+            buf.seek(0)
+            c.copy_expert(f"COPY investment ({cols}) FROM STDIN WITH (FORMAT csv)", buf)
+            done += n; print(f"  investment {done:,}/{rows:,}", end="\r", flush=True)
+        print()
+        # 월별 원장/롤업은 전체를 다시 만든다 (rebuild-monthly / rebuild-rollup과 같은 SQL)
+        c.execute("DELETE FROM investment_monthly")
+        c.execute(app.ledger_insert_sql("investment"), (app.LEDGER_FROM, app.LEDGER_TO)); monthly = c.rowcount
+        c.execute("DELETE FROM investment_rollup")
+        c.execute(f"INSERT INTO investment_rollup ({app.ROLLUP_COLUMNS}) " + app.rollup_select_sql("investment")); groups = c.rowcount
+        app.bump_data_version(c)
+        conn.commit()
+        conn.autocommit = True
+        c.execute("VACUUM ANALYZE investment"); c.execute("VACUUM ANALYZE investment_monthly"); c.execute("VACUUM ANALYZE investment_rollup")
+        conn.autocommit = False
+    finally:
+        app.put_conn(conn)
+    print(f"investment {rows:,}행, 월별 원장 {monthly:,}행, 롤업 {groups:,}개 그룹 ({time.perf_counter() - t0:.1f}s)")
+
+def main():
+    p = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    p.add_argument("--rows", type=int, default=10_000, help="추가할 investment 행 수 (1k ~ 1M)")
+    p.add_argument("--reset", action="store_true", help="기존 investment/원장/롤업을 비우고 시작")
+    p.add_argument("--seed", type=int, default=1)
+    a = p.parse_args()
+    generate(load_app(), a.rows, a.reset, a.seed)
+
+if __name__ == "__main__":
+    main()
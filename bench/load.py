@@ -0,0 +1,156 @@
+"""동시 부하 — python -m bench.load [--concurrency 8] [--duration 20] [--url http://127.0.0.1:8000 | --gunicorn 4]
+
+기본은 같은 프로세스의 Flask 테스트 클라이언트(스레드마다 로그인한 클라이언트),
+--url은 실행 중인 서버, --gunicorn N은 로컬 gunicorn(워커 N개)을 띄워서 부하를 준다
+요청 종류는 MIX 비율로 고르고, 저장 요청으로 만든 행은 끝나면 삭제한다
+"""
+import argparse
+import http.cookiejar
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from .common import ROOT, load_app, login, row_count, save_result, summarize
+from . import compare
+
+MIX = [("GET /api/list", 35), ("GET /api/list?product=키친&sort=base_amount", 15), ("GET /api/dashboard/aggregates", 25),
+       ("GET /api/dashboard/aggregates?product=리빙", 10), ("GET /dashboard", 8), ("GET /list", 7)]
+LOAD_ITEM = "부하 테스트"   # 저장 요청으로 만든 행 표시 (끝나고 삭제)
+SAVE_FORM = {"invest_type": "경상", "product": "리빙", "corporation": "KR", "purpose": "기타", "invest_item": LOAD_ITEM,
+             "order_target": "2026-03", "base_amount": "7", "saving_target": "1"}
+
+class TestClientSession:
+    def __init__(self, app):
+        self.client = login(app.app.test_client())
+    def request(self, method, path, data=None):
+        r = self.client.open(path, method=method, data=data)
+        return r.status_code
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+class HttpSession:
+    def __init__(self, base):
+        self.base = base.rstrip("/")
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect)
+        self.request("POST", "/login", {"username": "admin", "password": "1234"})
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        url = self.base + urllib.parse.quote(path, safe="/?&=")
+        try:
+            with self.opener.open(urllib.request.Request(url, data=body, method=method), timeout=30) as r:
+                r.read(); return r.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0)); return s.getsockname()[1]
+
+def start_gunicorn(workers):
+    port = free_port()
+    proc = subprocess.Popen([sys.executable, "-m", "gunicorn", "-w", str(workers), "-b", f"127.0.0.1:{port}", "app:app"],
+                            cwd=ROOT, env=os.environ.copy())
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close(); break
+        except OSError:
+            time.sleep(0.1)
+    else:
+        proc.terminate(); sys.exit("gunicorn이 시작되지 않았습니다")
+    return proc, f"http://127.0.0.1:{port}"
+
+def rss_mb(pid):
+    """pid와 자식 프로세스의 RSS 합계 (MB, 리눅스 /proc)"""
+    total, pids = 0, [pid]
+    while pids:
+        p = pids.pop()
+        try:
+            with open(f"/proc/{p}/status") as f:
+                total += next(int(l.split()[1]) for l in f if l.startswith("VmRSS:"))
+            with open(f"/proc/{p}/task/{p}/children") as f: pids += [int(x) for x in f.read().split()]
+        except (OSError, StopIteration):
+            pass
+    return round(total / 1024, 1)
+
+def worker(session, deadline, write_ratio, samples, errors, lock, seed):
+    rnd = random.Random(seed); names = [n for n, _ in MIX]; weights = [w for _, w in MIX]
+    local = {}; local_err = {}
+    while time.perf_counter() < deadline:
+        if rnd.random() < write_ratio: name, method, path, data = "POST /save", "POST", "/save", SAVE_FORM
+        else:
+            name = rnd.choices(names, weights)[0]; method, path = name.split(" ", 1); data = None
+        t0 = time.perf_counter()
+        try:
+            status = session.request(method, path, data)
+        except Exception:
+            status = 0
+        local.setdefault(name, []).append(time.perf_counter() - t0)
+        if not (200 <= status < 400): local_err[name] = local_err.get(name, 0) + 1
+    with lock:
+        for k, v in local.items(): samples.setdefault(k, []).extend(v)
+        for k, v in local_err.items(): errors[k] = errors.get(k, 0) + v
+
+def cleanup(app):
+    """저장 요청으로 만든 행 삭제 (롤업/원장/데이터 버전 함께)"""
+    conn = app.get_conn_tuple()
+    try:
+        c = conn.cursor(); c.execute("SELECT id FROM investment WHERE invest_item = %s", (LOAD_ITEM,))
+        ids = [r[0] for r in c.fetchall()]
+        if ids:
+            app.rollup_apply(c, -1, ids); c.execute("DELETE FROM investment WHERE id = ANY(%s)", (ids,))
+            app.bump_data_version(c)
+        conn.commit()
+    finally:
+        app.put_conn(conn)
+    return len(ids)
+
+def main():
+    p = argparse.ArgumentParser(description="동시 부하 테스트")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--duration", type=float, default=20, help="초")
+    p.add_argument("--write-ratio", type=float, default=0.05, help="저장 요청 비율")
+    p.add_argument("--url", help="실행 중인 서버 주소")
+    p.add_argument("--gunicorn", type=int, metavar="WORKERS", help="로컬 gunicorn을 워커 N개로 띄워서 테스트")
+    p.add_argument("--out"); p.add_argument("--baseline")
+    a = p.parse_args()
+    app = load_app(); proc = None; base = a.url
+    if a.gunicorn: proc, base = start_gunicorn(a.gunicorn)
+    target = base or "flask test client"
+    try:
+        sessions = [HttpSession(base) if base else TestClientSession(app) for _ in range(a.concurrency)]
+        samples, errors, lock = {}, {}, threading.Lock()
+        deadline = time.perf_counter() + a.duration; started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(s, deadline, a.write_ratio, samples, errors, lock, i))
+                   for i, s in enumerate(sessions)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        elapsed = time.perf_counter() - started
+        memory = rss_mb(proc.pid) if proc else (rss_mb(os.getpid()) if not base else None)
+    finally:
+        if proc: proc.terminate(); proc.wait()
+        removed = cleanup(app)
+    total = sum(len(v) for v in samples.values()); failed = sum(errors.values())
+    results = {name: {**summarize(v), "errors": errors.get(name, 0)} for name, v in sorted(samples.items())}
+    for name, r in results.items():
+        print(f"{name:<48} n {r['n']:>6}  p50 {r['p50_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  오류 {r['errors']}")
+    rps = round(total / elapsed, 1)
+    print(f"{target}: 동시 {a.concurrency}, {elapsed:.1f}s, {total}건, {rps} req/s, 오류 {failed}건"
+          + (f", RSS {memory}MB" if memory else "") + f", 정리 {removed}행")
+    out = save_result("load", results, a.out, target="gunicorn" if a.gunicorn else ("url" if base else "testclient"),
+                      workers=a.gunicorn, concurrency=a.concurrency, duration=a.duration, write_ratio=a.write_ratio,
+                      rows=row_count(app), rps=rps, error_rate=round(failed / total, 4) if total else 0,
+                      rss_mb=memory, peak_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1))
+    if a.baseline: raise SystemExit(compare.report(a.baseline, out))
+
+if __name__ == "__main__":
+    main()
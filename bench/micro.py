@@ -0,0 +1,92 @@
+"""마이크로 벤치마크 — python -m bench.micro [--repeat 20] [--only list] [--out 파일] [--baseline 파일]
+
+각 항목을 repeat번 실행해 지연(ms) 통계, 별도 1회 실행으로 tracemalloc 최대 할당(KB)을 기록
+조회 함수는 캐시를 거치지 않는 원래 함수(__wrapped__)로, 화면/API는 cold(캐시 비움)/warm 두 가지로 잰다
+"""
+import argparse
+import time
+import tracemalloc
+
+from .common import load_app, login, row_count, save_result, summarize
+from . import compare
+
+SAVE_FORM = {"invest_type": "확장", "product": "키친", "corporation": "KR", "purpose": "자동화", "invest_item": "벤치마크",
+             "order_target": "2026-05", "order_actual": "2026-06", "base_amount": "12.5", "saving_target": "3",
+             "saving_actual": "2", "reduce_1": "1", "reduce_2": "1", "activity": "bench"}
+
+def cases(app, client):
+    """(이름, 호출 함수, 매 실행 전 준비 함수)"""
+    clear = lambda: app.query_cache.entries.clear()
+    drain = lambda chunks: sum(map(len, chunks))   # 내보내기 제너레이터는 끝까지 읽어야 전체 비용
+    kitchen = {"product": "키친", "sort": "base_amount", "dir": "desc"}
+    page2 = {**kitchen, "cursor": app.get_list_page.__wrapped__(kitchen)["next"]}   # 목록 화면의 "더 보기" (행이 적으면 첫 페이지)
+    out = [
+        ("get_aggregates", lambda: app.get_aggregates.__wrapped__({}), None),
+        ("get_aggregates[product]", lambda: app.get_aggregates.__wrapped__({"product": "키친"}), None),
+        ("get_cube", app.get_cube.__wrapped__, None),
+        ("get_monthly_trend", lambda: app.get_monthly_trend.__wrapped__({}), None),
+        ("get_monthly_trend[all years]", lambda: app.get_monthly_trend.__wrapped__({"from": app.TREND_YEARS[0], "to": app.TREND_YEARS[-1]}), None),
+        ("get_list_page", lambda: app.get_list_page.__wrapped__({}), None),
+        ("get_list_page[sort=base_amount]", lambda: app.get_list_page.__wrapped__({"sort": "base_amount", "dir": "desc"}), None),
+        ("get_list_page[q=컨베이어]", lambda: app.get_list_page.__wrapped__({"q": "컨베이어", "sort": "rank"}), None),
+        ("get_list_page[product, cursor]", lambda: app.get_list_page.__wrapped__(page2), None),
+        ("iter_export_chunks", lambda: drain(app.iter_export_chunks({})), None),
+        ("stream_csv[product]", lambda: drain(app.stream_csv({"product": "키친"})), None),
+        ("search_ids[q=컨베이어]", lambda: app.search_ids.__wrapped__({"q": "컨베이어"}), None),
+        ("search_ids[q=설비 지연, product]", lambda: app.search_ids.__wrapped__({"q": "설비 지연", "product": "키친"}), None),
+    ]
+    for path in ("/dashboard", "/list", "/api/list?format=columnar", "/api/dashboard/aggregates", "/api/dashboard/cube", "/api/search?q=%EC%BB%A8%EB%B2%A0"):
+        get = lambda path=path: client.get(path, headers={"Accept-Encoding": "gzip"})
+        out += [(f"GET {path} (cold)", get, clear), (f"GET {path} (warm)", get, None)]
+    for path in ("/export.csv", "/export.csv?product=%ED%82%A4%EC%B9%9C&q=%EC%BB%A8%EB%B2%A0", "/export.xlsx"):   # 캐시 없음, 본문 끝까지 받음
+        out.append((f"GET {path}", lambda path=path: client.get(path).get_data(), None))
+    return out
+
+def run_save(app, client, repeat):
+    """새 행 저장 → 같은 행 수정 → 삭제 (만든 행은 모두 지움)"""
+    ins, upd, dele = [], [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); client.post("/save", data=SAVE_FORM); ins.append(time.perf_counter() - t0)
+        conn = app.get_conn_tuple()
+        try:
+            c = conn.cursor(); c.execute("SELECT MAX(id) FROM investment"); row_id = c.fetchone()[0]
+        finally:
+            app.put_conn(conn)
+        t0 = time.perf_counter(); client.post("/save", data={**SAVE_FORM, "row_id": str(row_id), "base_amount": "20"})
+        upd.append(time.perf_counter() - t0)
+        t0 = time.perf_counter(); client.post(f"/delete/{row_id}"); dele.append(time.perf_counter() - t0)
+    return {"POST /save (insert)": summarize(ins), "POST /save (update)": summarize(upd), "POST /delete": summarize(dele)}
+
+def peak_kb(fn, prepare=None):
+    if prepare: prepare()
+    tracemalloc.start()
+    try:
+        fn(); return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+def main():
+    p = argparse.ArgumentParser(description="마이크로 벤치마크")
+    p.add_argument("--repeat", type=int, default=20)
+    p.add_argument("--only", default="", help="이름에 이 문자열이 들어간 항목만")
+    p.add_argument("--out", help="결과 JSON 경로 (기본 bench/results/micro-<시각>.json)")
+    p.add_argument("--baseline", help="비교할 기준선 JSON")
+    a = p.parse_args()
+    app = load_app(); client = login(app.app.test_client()); results = {}
+    for name, fn, prepare in cases(app, client):
+        if a.only not in name: continue
+        fn()   # 준비 실행 (연결/플랜 캐시)
+        samples = []
+        for _ in range(a.repeat):
+            if prepare: prepare()
+            t0 = time.perf_counter(); fn(); samples.append(time.perf_counter() - t0)
+        results[name] = {**summarize(samples), "peak_kb": peak_kb(fn, prepare)}
+        print(f"{name:<42} p50 {results[name]['p50_ms']:>9.2f}ms  p95 {results[name]['p95_ms']:>9.2f}ms  peak {results[name]['peak_kb']:>9.1f}KB")
+    if "save" in a.only or not a.only:
+        for name, r in run_save(app, client, a.repeat).items():
+            results[name] = r; print(f"{name:<42} p50 {r['p50_ms']:>9.2f}ms  p95 {r['p95_ms']:>9.2f}ms")
+    out = save_result("micro", results, a.out, rows=row_count(app), repeat=a.repeat)
+    if a.baseline: raise SystemExit(compare.report(a.baseline, out))
+
+if __name__ == "__main__":
+    main()
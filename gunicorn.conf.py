@@ -0,0 +1,30 @@
+# gunicorn 설정 — 저장소 루트에서 `gunicorn app:app`으로 실행하면 자동으로 읽음 (명령줄 옵션이 우선)
+# /api/events(Server-Sent Events)는 화면이 열려 있는 동안 요청 하나를 계속 잡고 있으므로
+# 기본 sync 워커(워커당 요청 1개)로는 탭 몇 개만 열려도 다른 요청이 막힘 → 스레드 워커(gthread)
+import os
+import sys
+import tempfile
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:" + os.environ.get("PORT", "8000"))
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.environ.get("GUNICORN_THREADS", "32"))   # 워커당 동시 요청 수 = 열린 SSE 연결 + 일반 요청
+timeout = 60        # gthread에서는 워커 응답 없음 감지용 — 오래 열린 SSE 응답은 끊지 않음
+keepalive = 5
+
+# /metrics는 요청을 받은 워커 하나가 응답 → 워커들이 METRICS_DIR에 써 둔 스냅샷을 합쳐서 응답 (app.render_metrics)
+# 지정하지 않으면 임시 디렉터리 — 마스터에서 설정한 환경변수를 fork된 워커가 물려받음
+if not os.environ.get("METRICS_DIR"):
+    os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="invest-metrics-")
+
+def on_starting(server):
+    """이전 실행의 스냅샷 삭제 (카운터가 지난 실행 값에서 이어지지 않게)"""
+    d = os.environ["METRICS_DIR"]
+    os.makedirs(d, exist_ok=True)
+    for name in os.listdir(d):
+        if name.endswith((".json", ".tmp")): os.remove(os.path.join(d, name))
+
+def worker_exit(server, worker):
+    """워커 종료 직전 마지막 값 기록 (마지막 주기 이후 증가분)"""
+    app = sys.modules.get("app")
+    if app is not None and app.METRICS_DIR: app.write_metrics_snapshot()
@@ -0,0 +1,31 @@
+// 대시보드 집계 워커: 큐브(제품×법인×유형×목적 셀)를 한 번 만들어 두고
+// 필터 메시지마다 셀을 한 번 훑어 /api/dashboard/aggregates와 같은 모양(total/by_type/by_product/product_type/by_corp)을 돌려준다
+// 큐브 출처: IndexedDB 행 캐시(rowcache.js, ?rc=URL)가 있으면 로컬 행으로 바로 만들고 차이 동기화 후 {refresh} 알림, 없으면 /api/dashboard/cube
+const RC=new URL(self.location.href).searchParams.get('rc');
+if(RC)try{importScripts(RC);}catch(e){}
+const LOCAL=typeof RowCache!=='undefined'&&typeof indexedDB!=='undefined';
+let CUBE=null;
+function fetchCube(){return fetch('/api/dashboard/cube',{credentials:'same-origin'}).then(r=>{if(!r.ok)throw new Error(r.status);return r.json();}).then(d=>d.cells);}
+function cubeFromRows(rows){const m=new Map();
+  for(const r of rows){const k=r[2]+'\t'+r[3]+'\t'+r[1]+'\t'+r[4];let c=m.get(k);if(!c){c=[r[2]||'',r[3]||'',r[1]||'',r[4]||'',0,0,0,0,0,0,0,0,0,0,0,0,0];m.set(k,c);}
+    c[4]++;c[5]+=r[13]||0;c[6]+=r[16]||0;c[7]+=r[17]||0;for(let i=0;i<9;i++)c[8+i]+=r[18+i]||0;}
+  return[...m.values()];}
+function synced(){return RowCache.sync().then(cubeFromRows);}
+function fromCache(){return RowCache.cached().then(rows=>{if(!rows.length)return synced();
+  synced().then(cells=>{CUBE=Promise.resolve(cells);postMessage({refresh:true});},()=>{});return cubeFromRows(rows);});}
+function keep(p){CUBE=p.catch(e=>{CUBE=null;throw e;});return CUBE;}
+function load(){return CUBE||keep(LOCAL?fromCache().catch(fetchCube):fetchCube());}
+function cell(){return{count:0,base:0,target:0,actual:0,reduce:[0,0,0,0,0,0,0,0,0]};}
+function add(o,c){o.count+=c[4];o.base+=c[5];o.target+=c[6];o.actual+=c[7];for(let i=0;i<9;i++)o.reduce[i]+=c[8+i];}
+function at(map,k){return map[k]||(map[k]=cell());}
+function aggregate(cells,f){
+  const out={total:cell(),by_type:{},by_product:{},product_type:{},by_corp:{}};
+  for(const c of cells){
+    const product=c[0]||"",corp=c[1]||"",itype=c[2]||"",purpose=c[3]||"";
+    if((f.product&&product!==f.product)||(f.corp&&corp!==f.corp)||(f.type&&itype!==f.type)||(f.purpose&&purpose!==f.purpose))continue;
+    add(out.total,c);add(at(out.by_type,itype),c);add(at(out.by_product,product),c);add(at(out.by_corp,corp),c);
+    add(at(out.product_type[product]||(out.product_type[product]={}),itype),c);
+  }
+  return out;
+}
+onmessage=e=>{const m=e.data;if(m.reload){if(LOCAL)keep(synced().catch(fetchCube));else CUBE=null;return;}load().then(cells=>postMessage({seq:m.seq,agg:aggregate(cells,m.filter)}),err=>postMessage({seq:m.seq,filter:m.filter,error:String(err)}));};
@@ -0,0 +1,47 @@
+const PRODUCTS=['키친','빌트인쿠킹','리빙','부품','ES'];
+const PRODUCTS_EN={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
+function pn(k){return getLang()==='en'?(PRODUCTS_EN[k]||k):k;}function getLang(){return localStorage.getItem('app_lang')||'ko';}
+const _allCorps=[...new Set(Object.values(CORPS_MAP).flat())].sort();const ALL_CORPS_ORDERED=['KR',..._allCorps.filter(c=>c!=='KR')];
+let AGG=null,aggSeq=0;
+const charts={};
+function t(ko,en){return getLang()==='en'?en:ko;}
+const EMPTY={count:0,base:0,target:0,actual:0,reduce:[0,0,0,0,0,0,0,0,0]};
+function g(...path){let o=AGG;for(const k of path)o=o&&o[k];return o||EMPTY;}
+function setLang(l){localStorage.setItem('app_lang',l);document.getElementById('langKo').classList.toggle('active',l==='ko');document.getElementById('langEn').classList.toggle('active',l==='en');applyLang();initProductFilter();initTypeFilter();initCorpFilter(document.getElementById('fProduct').value);initPurposeFilter();initYearFilter();renderAll();}
+function applyLang(){const l=getLang();document.getElementById('langKo').classList.toggle('active',l==='ko');document.getElementById('langEn').classList.toggle('active',l==='en');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});}
+const _PU={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
+function initPurposeFilter(){const l=getLang(),s=document.getElementById('fPurpose');s.innerHTML='<option value="">'+t('전체','All')+'</option>';ALL_PURPOSES.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(_PU[p]||p):p;s.appendChild(o);});}
+function initProductFilter(){const s=document.getElementById('fProduct'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';PRODUCTS.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=pn(p);s.appendChild(o);});if(cur)s.value=cur;}
+function initTypeFilter(){const s=document.getElementById('fType'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';const o1=document.createElement('option');o1.value='확장';o1.textContent=t('확장','Expansion');s.appendChild(o1);const o2=document.createElement('option');o2.value='경상';o2.textContent=t('경상','Recurring');s.appendChild(o2);if(cur)s.value=cur;}
+function initCorpFilter(product){const s=document.getElementById('fCorp'),cur=s.value;s.innerHTML='<option value="">'+t('전체','All')+'</option>';const corps=product&&CORPS_MAP[product]?CORPS_MAP[product]:ALL_CORPS_ORDERED;corps.forEach(c=>{const o=document.createElement('option');o.value=c;o.textContent=c;s.appendChild(o);});if([...s.options].some(o=>o.value===cur))s.value=cur;}
+function onProductChange(){initCorpFilter(document.getElementById('fProduct').value);applyFilter();}
+// 필터 집계는 워커(cube.js)가 큐브 셀을 한 번 훑어서 계산, 워커를 못 쓰면 서버 집계 API로
+const CUBE=window.Worker?new Worker(CUBE_WORKER+'?rc='+encodeURIComponent(ROWCACHE_URL)):null;
+if(CUBE)CUBE.onmessage=e=>{const d=e.data;if(d.refresh){applyFilter();return;}if(d.seq!==aggSeq)return;if(d.error){fetchAggregates(d.seq,d.filter);return;}AGG=d.agg;renderAll();};
+// 변경 알림(/api/events)이 오면 잠깐 모았다가 큐브/월별 추이를 다시 받아 현재 필터로 다시 집계
+let changeTimer=0;
+function listenChanges(){if(!window.EventSource)return;new EventSource('/api/events').addEventListener('change',()=>{clearTimeout(changeTimer);changeTimer=setTimeout(()=>{if(CUBE)CUBE.postMessage({reload:true});monthlyQ=null;applyFilter();},300);});}
+function fetchAggregates(seq,f){fetch('/api/dashboard/aggregates?'+new URLSearchParams(f)).then(r=>r.json()).then(d=>{if(seq!==aggSeq)return;AGG=d;renderAll();});}
+function filterValues(){return{product:document.getElementById('fProduct').value,corp:document.getElementById('fCorp').value,type:document.getElementById('fType').value,purpose:document.getElementById('fPurpose').value};}
+function applyFilter(){const f=filterValues(),seq=++aggSeq;if(CUBE)CUBE.postMessage({seq,filter:f});else fetchAggregates(seq,f);loadMonthly();}
+// 월별 추이: 연도 선택/필터가 바뀌면 /api/dashboard/monthly만 다시 받아 chart_Monthly만 다시 그림
+let monthlySeq=0,monthlyQ=null;
+function initYearFilter(){const s=document.getElementById('fYear'),M=MONTHLY_DATA,cur=s.value||(M.from===M.to?String(M.from):'all');s.innerHTML='';M.years.forEach(y=>{const o=document.createElement('option');o.value=y;o.textContent=t(y+'년',String(y));s.appendChild(o);});if(M.years.length>1){const o=document.createElement('option');o.value='all';o.textContent=t('전체 ('+M.years[0]+'~'+M.years[M.years.length-1]+')','All ('+M.years[0]+'-'+M.years[M.years.length-1]+')');s.appendChild(o);}s.value=cur;}
+function monthlyQuery(){const y=document.getElementById('fYear').value,Y=MONTHLY_DATA.years;return new URLSearchParams({...filterValues(),from:y==='all'?Y[0]:y,to:y==='all'?Y[Y.length-1]:y}).toString();}
+function loadMonthly(){const q=monthlyQuery();if(q===monthlyQ)return;monthlyQ=q;const seq=++monthlySeq;fetch('/api/dashboard/monthly?'+q).then(r=>r.json()).then(d=>{if(seq!==monthlySeq||!d.labels)return;MONTHLY_DATA=d;chart_Monthly();});}
+function updateKPI(){const e=g('by_type','확장'),n=g('by_type','경상');document.getElementById('kExpCnt').textContent=e.count;document.getElementById('kExpBase').textContent=e.base.toFixed(1);document.getElementById('kExpSave').textContent=e.actual.toFixed(1);document.getElementById('kNorCnt').textContent=n.count;document.getElementById('kNorBase').textContent=n.base.toFixed(1);document.getElementById('kNorSave').textContent=n.actual.toFixed(1);}
+const P={gray:'rgba(180,180,180,0.85)',grayL:'rgba(180,180,180,0.4)',red:'rgba(180,30,30,0.85)',purple:'rgba(102,126,234,0.85)',green:'rgba(16,185,129,0.85)',amber:'rgba(245,158,11,0.85)',blue:'rgba(59,130,246,0.85)',blueL:'rgba(59,130,246,0.3)',teal:'rgba(20,184,166,0.85)',violet:'rgba(139,92,246,0.85)',pink:'rgba(236,72,153,0.85)',orange:'rgba(249,115,22,0.85)'};
+function mk(id,cfg){if(charts[id])charts[id].destroy();charts[id]=new Chart(document.getElementById(id),cfg);}
+const barLP={id:'barLabel',afterDatasetsDraw(ch){if(ch.config.type==='doughnut'||ch.config.type==='pie')return;const{ctx}=ch;ch.data.datasets.forEach((ds,di)=>{const m=ch.getDatasetMeta(di);if(m.hidden)return;m.data.forEach((bar,idx)=>{const v=ds.data[idx];if(!v||v<=0)return;ctx.save();ctx.font='600 11px "Noto Sans KR",sans-serif';ctx.fillStyle='#374151';ctx.textAlign='center';ctx.textBaseline='bottom';if(ch.config.options?.indexAxis==='y'){ctx.textAlign='left';ctx.textBaseline='middle';ctx.fillText(v.toFixed(1),bar.x+4,bar.y);}else{ctx.fillText(v.toFixed(1),bar.x,bar.y-4);}ctx.restore();});});}};
+Chart.register(barLP);
+function chart_BaseTotal(){const tot=g('total');mk('cBaseTotal',{type:'bar',data:{labels:[t('전체','Total')],datasets:[{label:t('Base 금액','Base'),data:[tot.base],backgroundColor:P.purple,borderRadius:6,maxBarThickness:60},{label:t('절감 실적','Savings'),data:[tot.actual],backgroundColor:P.green,borderRadius:6,maxBarThickness:60}]},options:{responsive:true,maintainAspectRatio:false,layout:{padding:{top:20}},plugins:{legend:{position:'top',labels:{font:{size:12},padding:12}}},scales:{y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(tot.base,tot.actual)*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
+function chart_BaseProduct(){const b=PRODUCTS.map(p=>g('by_product',p).base),s=PRODUCTS.map(p=>g('by_product',p).actual);mk('cBaseProduct',{type:'bar',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{label:t('Base 금액','Base'),data:b,backgroundColor:P.purple,borderRadius:5,maxBarThickness:40},{label:t('절감 실적','Savings'),data:s,backgroundColor:P.green,borderRadius:5,maxBarThickness:40}]},options:{responsive:true,maintainAspectRatio:false,layout:{padding:{top:20}},plugins:{legend:{position:'top',labels:{font:{size:12},padding:12}}},scales:{y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(...b,...s)*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
+function chart_InvestTypeTotal(){const e=g('by_type','확장'),n=g('by_type','경상'),eT=e.target,eA=e.actual,nT=n.target,nA=n.actual;mk('cInvestTypeTotal',{type:'bar',data:{labels:[t('확장','Exp.'),t('경상','Rec.')],datasets:[{label:t('목표','Target'),data:[eT,nT],backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:4},{label:t('실적','Actual'),data:[eA,nA],backgroundColor:P.red,borderRadius:4}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{display:false}},scales:{x:{ticks:{font:{size:13}}},y:{beginAtZero:true,max:Math.ceil(Math.max(eT,eA,nT,nA)*1.25)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
+function chart_InvestTypeProduct(){const eT=[],eA=[],nT=[],nA=[];PRODUCTS.forEach(p=>{const e=g('product_type',p,'확장'),n=g('product_type',p,'경상');eT.push(e.target);eA.push(e.actual);nT.push(n.target);nA.push(n.actual);});mk('cInvestTypeProduct',{type:'bar',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{label:t('확장목표','Exp.Tgt'),data:eT,backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:3},{label:t('확장실적','Exp.Act'),data:eA,backgroundColor:P.red,borderRadius:3},{label:t('경상목표','Rec.Tgt'),data:nT,backgroundColor:'rgba(160,160,160,0.25)',borderColor:'rgba(160,160,160,0.7)',borderWidth:2,borderRadius:3},{label:t('경상실적','Rec.Act'),data:nA,backgroundColor:'rgba(180,30,30,0.5)',borderRadius:3}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:11},boxWidth:12,padding:8}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,max:Math.ceil(Math.max(...eT,...eA,...nT,...nA)*1.25)||10,title:{display:true,text:t('억원','100M'),font:{size:12}}}}}});}
+function chart_Activity(){const aL=[t('합계','Total'),t('①신기술 신공법','①New Tech'),t('②염가형 부품','②Low-cost Parts'),t('③중국/Local 설비','③China/Local'),t('④중국/한국 Collabo','④CN/KR Collabo'),t('⑤컨테이너(FR) 최소화','⑤Container Min.'),t('⑥출장인원 최소화','⑥Travel Min.'),t('⑦유휴설비','⑦Idle Equip'),t('⑧사양 최적화','⑧Spec Opt.'),t('⑨기타','⑨Others')];const tS=g('total').actual,aD=g('total').reduce;const cols=[P.orange,P.amber,P.green,P.teal,P.blue,P.violet,P.pink,P.purple,P.red];mk('cActivity',{type:'bar',data:{labels:aL,datasets:[{label:t('절감(억원)','Savings'),data:[tS,...aD],backgroundColor:[P.purple,...cols],borderRadius:5}]},options:{responsive:true,maintainAspectRatio:false,indexAxis:'y',plugins:{legend:{display:false}},scales:{x:{beginAtZero:true,title:{display:true,text:t('억원','100M'),font:{size:12}}},y:{ticks:{font:{size:12},padding:6}}}}});}
+function chart_Pie(){const pd=PRODUCTS.map(p=>g('by_product',p).actual),total=pd.reduce((a,b)=>a+b,0);const pc=[P.purple,P.amber,P.green,P.blue,P.red];const centerPlugin={id:'ctr',afterDraw(ch){const{ctx,chartArea:{left,right,top,bottom}}=ch;const cx=(left+right)/2,cy=(top+bottom)/2;ctx.save();ctx.font='700 22px "Noto Sans KR",sans-serif';ctx.fillStyle='#1a202c';ctx.textAlign='center';ctx.textBaseline='middle';ctx.fillText(total.toFixed(1),cx,cy-8);ctx.font='500 12px "Noto Sans KR",sans-serif';ctx.fillStyle='#718096';ctx.fillText(t('억원','100M'),cx,cy+14);ctx.restore();}};const lblPlugin={id:'plbl',afterDatasetsDraw(ch){const{ctx}=ch;ch.getDatasetMeta(0).data.forEach((arc,i)=>{const v=ch.data.datasets[0].data[i];if(!v||v<=0)return;const{x,y}=arc.tooltipPosition();ctx.save();ctx.font='600 12px "Noto Sans KR",sans-serif';ctx.fillStyle='#fff';ctx.textAlign='center';ctx.textBaseline='middle';ctx.fillText(v.toFixed(1),x,y);ctx.restore();});}};mk('cPie',{type:'doughnut',data:{labels:PRODUCTS.map(p=>pn(p)),datasets:[{data:pd,backgroundColor:pc,borderWidth:2,borderColor:'#fff'}]},options:{responsive:true,maintainAspectRatio:false,cutout:'55%',plugins:{legend:{position:'bottom',labels:{boxWidth:13,padding:12,font:{size:13}}}}},plugins:[centerPlugin,lblPlugin]});}
+function chart_Corp(){const cT={},cA={};ALL_CORPS_ORDERED.forEach(c=>{cT[c]=g('by_corp',c).target;cA[c]=g('by_corp',c).actual;});mk('cCorp',{type:'bar',data:{labels:ALL_CORPS_ORDERED,datasets:[{label:t('절감 목표','Target'),data:ALL_CORPS_ORDERED.map(c=>cT[c]),backgroundColor:P.blueL,borderColor:P.blue,borderWidth:2,borderRadius:4},{label:t('절감 실적','Actual'),data:ALL_CORPS_ORDERED.map(c=>cA[c]),backgroundColor:P.green,borderRadius:4}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:13}}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,suggestedMax:Math.ceil(Math.max(...ALL_CORPS_ORDERED.map(c=>cT[c]),...ALL_CORPS_ORDERED.map(c=>cA[c]))*1.2)||10,title:{display:true,text:t('억원','100M'),font:{size:13}}}}}});}
+function chart_Monthly(){const M=MONTHLY_DATA,one=M.from===M.to,EN=['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];const labels=M.labels.map(l=>{const m=+l.slice(5);return one?(getLang()==='en'?EN[m-1]:m+'월'):l.slice(2);});const tgt=M.target,act=M.actual,cT=M.cum_target.map(v=>+v.toFixed(2)),cA=M.cum_actual.map(v=>+v.toFixed(2));const mB=Math.max(...tgt,...act,1),mC=Math.max(...cT,...cA,1);mk('cMonthly',{type:'bar',data:{labels,datasets:[{type:'bar',label:t('절감목표','Target'),data:tgt,order:1,backgroundColor:P.grayL,borderColor:P.gray,borderWidth:2,borderRadius:4,yAxisID:'y'},{type:'bar',label:t('절감실적','Actual'),data:act,order:2,backgroundColor:P.red,borderRadius:4,yAxisID:'y'},{type:'line',label:t('누적목표','Cum.Tgt'),data:cT,order:3,borderColor:'rgba(130,130,130,0.95)',backgroundColor:'transparent',borderDash:[6,3],borderWidth:2,pointRadius:5,pointBackgroundColor:'white',pointBorderColor:'rgba(130,130,130,0.95)',pointBorderWidth:2,tension:0.1,yAxisID:'y2'},{type:'line',label:t('누적실적','Cum.Act'),data:cA,order:4,borderColor:P.red,backgroundColor:'transparent',borderWidth:2.5,pointRadius:5,pointBackgroundColor:'white',pointBorderColor:P.red,pointBorderWidth:2,tension:0.1,yAxisID:'y2'}]},options:{responsive:true,maintainAspectRatio:false,plugins:{legend:{position:'top',labels:{font:{size:12},boxWidth:14,padding:20}}},scales:{x:{ticks:{font:{size:12}}},y:{beginAtZero:true,position:'left',max:Math.ceil(mB*3),title:{display:true,text:t('월별(억원)','Monthly'),font:{size:12}}},y2:{beginAtZero:true,position:'right',max:Math.ceil(mC*1.3),title:{display:true,text:t('누적(억원)','Cumulative'),font:{size:12}},grid:{drawOnChartArea:false}}}}});}
+function renderAll(){updateKPI();chart_BaseTotal();chart_BaseProduct();chart_InvestTypeTotal();chart_InvestTypeProduct();chart_Activity();chart_Pie();chart_Corp();chart_Monthly();}
+window.onload=function(){initProductFilter();initTypeFilter();initCorpFilter('');initPurposeFilter();initYearFilter();monthlyQ=monthlyQuery();applyLang();renderAll();applyFilter();listenChanges();};
+function confirmLogout(){if(confirm('로그아웃 하시겠습니까?'))window.location.href='/logout';}
@@ -0,0 +1,41 @@
+function updateCorporations(){const p=document.getElementById('product').value,s=document.getElementById('corporation');s.innerHTML='';(CORPORATIONS[p]||[]).forEach(c=>{const o=document.createElement('option');o.value=c;o.textContent=c;s.appendChild(o)});}
+function selectType(btn,type){document.querySelectorAll('.toggle-btn').forEach(b=>b.classList.remove('active'));btn.classList.add('active');document.getElementById('invest_type').value=type;}
+function calcTotal(){let s=0;document.querySelectorAll(".reduce").forEach(e=>{s+=Number(e.value)||0;});const t=s.toFixed(2);document.getElementById("saving_actual").value=t;document.getElementById("saving_total").value=t;document.getElementById("total_display").value=t;}
+function setLang(l){localStorage.setItem('app_lang',l);applyLang();}
+function applyLang(){const l=localStorage.getItem('app_lang')||'ko';document.querySelectorAll('.lang-btn-h').forEach(b=>b.classList.remove('active'));if(l==='ko'&&document.getElementById('langKoI'))document.getElementById('langKoI').classList.add('active');if(l==='en'&&document.getElementById('langEnI'))document.getElementById('langEnI').classList.add('active');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});
+const PE={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
+const ps=document.getElementById('product');if(ps){[...ps.options].forEach(o=>{if(o.value)o.textContent=l==='en'?(PE[o.value]||o.value):o.value;});}
+const ii=document.getElementById('invest_item_input');if(ii&&!ii.value)ii.placeholder=l==='en'?'e.g. Changwon advanced oven line':'예: 창원 선진화 오븐라인';
+const dr=document.getElementById('delay_reason_input');if(dr&&!dr.value)dr.placeholder=l==='en'?'e.g. Mass production delayed due to product development delay':'예 : 제품개발 지연에 따른 양산 일정 지연';
+const ai=document.getElementById('activity_input');if(ai&&!ai.value)ai.placeholder=l==='en'?'e.g. 1) New tech for cabinet processing, 3) China motor equip, 6) Reduce travel staff (100→50)':'예 : 1) cabinet 가공설비 신기술 적용, 3) 모터 중국설, 6) Local 인원 활용한 한국 출장자 축소(100 → 50명)';
+const PU={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
+const pu=document.getElementById('purpose_select');if(pu){[...pu.options].forEach(o=>{if(o.value)o.textContent=l==='en'?(PU[o.value]||o.value):o.value;});}
+document.documentElement.lang=l==='en'?'en':'ko';
+document.querySelectorAll('.month-i').forEach(m=>{
+  if(!m.parentElement.classList.contains('month-wrap')){
+    const w=document.createElement('div');
+    w.className='month-wrap';
+    w.style.cssText='position:relative;width:100%';
+    m.parentElement.insertBefore(w,m);
+    w.appendChild(m);
+    const ov=document.createElement('span');
+    ov.className='month-overlay';
+    ov.style.cssText='position:absolute;left:16px;top:0;width:calc(100% - 32px);height:100%;display:none;pointer-events:none;font-size:15px;color:#999;z-index:1;display:flex;align-items:center';
+    w.appendChild(ov);
+    m.addEventListener('change',()=>{const cl=localStorage.getItem('app_lang')||'ko';ov.style.display=m.value?'none':(cl==='en'?'flex':'none');});
+  }
+  const ov=m.parentElement.querySelector('.month-overlay');
+  if(ov){
+    ov.textContent=l==='en'?'YYYY-MM':'';
+    if(l==='en'&&!m.value){
+      m.style.color='transparent';ov.style.display='flex';
+      m.onfocus=function(){this.style.color='';ov.style.display='none';};
+      m.onblur=function(){if(!this.value){this.style.color='transparent';ov.style.display='flex';}};
+    } else {
+      m.style.color='';ov.style.display='none';
+      m.onfocus=null;m.onblur=null;
+    }
+  }
+});
+}
+window.onload=function(){updateCorporations();if(EDIT_CORPORATION)document.getElementById('corporation').value=EDIT_CORPORATION;calcTotal();applyLang();}
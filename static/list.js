@@ -0,0 +1,87 @@
+let ROWS=[],TOTALS=null,CURSOR=null,PENDING=null,SORT='id',DIR='desc',listSeq=0;
+const SORT_COLS=[null,'product','corporation','invest_type','invest_item','purpose','order_target','order_actual','setup_target','setup_actual','mass_target','mass_actual',null,'base_amount','order_price_target','order_price_actual','saving_target','saving_actual'];
+function f(v){return(v!=null&&v!=="")? v:"-";}
+const SELECTED=new Set();
+function postJson(url,body){return fetch(url,{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify(body)}).then(r=>r.json());}
+function toggleRow(id,on){if(on)SELECTED.add(id);else SELECTED.delete(id);}
+function selectAll(on){ROWS.forEach(r=>toggleRow(r[0],on));document.querySelectorAll('.rsel').forEach(x=>x.checked=on);}
+function refreshTotals(){const q=listQuery();q.set('limit','1');return fetch('/api/list?'+q).then(r=>r.json()).then(d=>{if(d.totals){TOTALS=d.totals;renderFoot();}});}
+function patchRows(rows,deleted){const m=new Map(rows.map(r=>[r[0],r])),del=new Set(deleted||[]);del.forEach(id=>SELECTED.delete(id));ROWS=ROWS.filter(r=>!del.has(r[0])).map(r=>m.get(r[0])||r);renderTable();if(LOCAL)RowCache.sync().then(useLocal);else refreshTotals();}
+function deleteRows(ids){if(!ids.length||!confirm(ids.length>1?tl(ids.length+'건 삭제?','Delete '+ids.length+' rows?'):"삭제?"))return;postJson('/api/rows/delete',{ids}).then(d=>{if(d.success)patchRows([],d.deleted);else alert(d.error);});}
+function deleteRow(id){deleteRows([id]);}
+// 다른 화면/사용자의 변경 알림(/api/events): 삭제는 바로 빼고, 수정/추가는 그 행만 /api/rows?ids=로 받아 교체 (bulk면 처음부터 다시)
+function rowFilter(){const q=listQuery(),conds=[['product',2],['corp',3],['type',1],['purpose',4]].map(([k,i])=>[q.get(k),i]).filter(([v])=>v);return r=>conds.every(([v,i])=>r[i]===v);}
+function applyChange(d){if(LOCAL){RowCache.sync().then(useLocal);return;}if(d.op==='delete'){patchRows([],d.ids);return;}if(d.op==='bulk'||listSearch()){loadPage(true);return;}
+  fetch('/api/rows?ids='+d.ids.join(',')).then(r=>r.json()).then(x=>{if(!x.rows)return;const matchesFilter=rowFilter(),have=new Set(ROWS.map(r=>r[0])),got=new Set(x.rows.map(r=>r[0]));
+    const keep=x.rows.filter(matchesFilter),gone=d.ids.filter(id=>!got.has(id)).concat(x.rows.filter(r=>!matchesFilter(r)).map(r=>r[0]));
+    const fresh=keep.filter(r=>!have.has(r[0]));if(fresh.length&&SORT==='id'&&DIR==='desc')ROWS=fresh.concat(ROWS);
+    patchRows(keep.filter(r=>have.has(r[0])),gone);});}
+function listenChanges(){if(!window.EventSource)return;new EventSource('/api/events').addEventListener('change',e=>applyChange(JSON.parse(e.data)));}
+function deleteSelected(){deleteRows([...SELECTED]);}
+function bulkEdit(){const col=document.getElementById('bf').value,v=document.getElementById('bv').value,ids=[...SELECTED];if(!ids.length||!col)return;postJson('/api/rows/update',{rows:ids.map(id=>({id,[col]:v}))}).then(d=>{if(d.success)patchRows(d.rows,d.missing);else alert(d.errors?d.errors.map(e=>e.id+': '+e.errors.join(', ')).join('\n'):d.error);});}
+function updateFilterCorps(){const p=document.getElementById('fp').value,s=document.getElementById('fc');let corps=[];if(p&&CORPORATIONS[p])corps=CORPORATIONS[p];else{const a=new Set();Object.values(CORPORATIONS).forEach(x=>x.forEach(c=>a.add(c)));corps=[...a].sort();}const cur=s.value;s.innerHTML='<option value="">'+tl('전체','All')+'</option>';corps.forEach(c=>{const o=document.createElement('option');o.value=o.textContent=c;s.appendChild(o);});if(corps.includes(cur))s.value=cur;}
+// 가상 스크롤: 보이는 행 ± VBUF만 DOM으로 만들고 위/아래는 높이만 차지하는 빈 행(vpad)
+const _LP={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
+const _TP={'확장':'Expansion','경상':'Recurring'};
+const _PP={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};
+const VBUF=15,NCOLS=31;let ROW_H=44,VWIN=null,vFrame=0,_en=false;
+function _t(v,map){return _en?(map[v]||v):(v||'-');}
+function rowHtml(r,i){
+  const rid=r[0];let h="<tr class='vr r"+(i&1)+"'>";
+  h+="<td class='sc c0'><div class='row-actions'><input type='checkbox' class='rsel'"+(SELECTED.has(rid)?" checked":"")+" onchange='toggleRow("+rid+",this.checked)'><a href='/edit/"+rid+"' class='icon-btn icon-edit'>✏️</a><button class='icon-btn icon-del' onclick='deleteRow("+rid+")'>🗑️</button></div></td>";
+  h+="<td class='sc c1'>"+_t(r[2],_LP)+"</td><td class='sc c2'>"+f(r[3])+"</td><td class='sc c3'>"+_t(r[1],_TP)+"</td><td class='sc c4 left'>"+f(r[5])+"</td><td class='sc c5'>"+_t(r[4],_PP)+"</td>";
+  h+="<td>"+f(r[6])+"</td><td>"+f(r[7])+"</td><td>"+f(r[8])+"</td><td>"+f(r[9])+"</td><td>"+f(r[10])+"</td><td>"+f(r[11])+"</td><td class='left'>"+f(r[12])+"</td>";
+  h+="<td>"+f(r[13])+"</td><td>"+f(r[14])+"</td><td>"+f(r[15])+"</td><td>"+f(r[16])+"</td><td>"+f(r[17])+"</td>";
+  for(let i=18;i<=26;i++){h+="<td>"+f(r[i])+"</td>";}
+  h+="<td class='act-cell' title='"+String(r[28]||"").replace(/'/g,"&#39;")+"'>"+f(r[28])+"</td>";
+  const rTgt=r[31],rActNum=r[32],rAct=rActNum===null?"-":(rActNum?rActNum.toFixed(1):"0");
+  let sig="s-x";if(rActNum!==null)sig=rActNum>=rTgt?"s-g":"s-y";
+  return h+"<td>"+rTgt+"%</td><td>"+(rAct!=="-"?rAct+"%":"-")+"</td><td style='text-align:center'><span class='sig "+sig+"' style='display:inline-block'></span></td></tr>";
+}
+function vpad(n){return n>0?"<tr class='vpad'><td colspan='"+NCOLS+"' style='height:"+n*ROW_H+"px'></td></tr>":"";}
+function renderWindow(){
+  vFrame=0;const w=document.querySelector('.table-wrap'),tb=document.getElementById("tableBody"),n=ROWS.length;
+  const top=Math.max(0,w.scrollTop-document.querySelector('#mainTable thead').offsetHeight);
+  const last=Math.min(n,Math.ceil((top+w.clientHeight)/ROW_H)+VBUF),first=Math.min(last,Math.max(0,Math.floor(top/ROW_H)-VBUF));
+  if(VWIN&&VWIN[0]===first&&VWIN[1]===last&&VWIN[2]===n)return;VWIN=[first,last,n];
+  let out=vpad(first);for(let i=first;i<last;i++)out+=rowHtml(ROWS[i],i);
+  tb.innerHTML=out+vpad(n-last);
+  const tr=tb.querySelector('tr.vr'),h=tr?tr.getBoundingClientRect().height:0;
+  if(h&&Math.abs(h-ROW_H)>0.5){ROW_H=h;VWIN=null;renderWindow();}   // 첫 렌더에서 실제 행 높이로 보정
+}
+function scheduleWindow(){if(!vFrame)vFrame=requestAnimationFrame(renderWindow);}
+// 합계는 서버가 준 TOTALS로 문자열 한 번에 (행 DOM과 무관)
+function renderFoot(){
+  const tot=TOTALS||{count:0,base:0,opt:0,opa:0,sgt:0,sga:0,reduce:[0,0,0,0,0,0,0,0,0]};
+  let foot="<tr><td colspan='6' style='text-align:center;background:#fef9c3;font-weight:700'>"+tl('합계','Total')+"</td><td colspan='7' style='background:#fef9c3'></td>";
+  foot+="<td>"+tot.base.toFixed(2)+"</td><td>"+tot.opt.toFixed(2)+"</td><td>"+tot.opa.toFixed(2)+"</td><td>"+tot.sgt.toFixed(2)+"</td><td>"+tot.sga.toFixed(2)+"</td>";
+  tot.reduce.forEach(v=>{foot+="<td>"+v.toFixed(2)+"</td>";});foot+="<td colspan='4' style='background:#fef9c3'></td></tr>";
+  document.getElementById("tableFoot").innerHTML=foot;document.getElementById("footerInfo").textContent=tl("총 "+tot.count+"건","Total "+tot.count+" items");
+}
+function renderTable(){_en=localStorage.getItem('app_lang')==='en';VWIN=null;renderWindow();renderFoot();}
+function listSearch(){return document.getElementById('fq').value.trim();}
+// 검색어가 있으면 서버 검색(/api/list?q=, 점수순) — 로컬 모드여도 서버에서
+let searchTimer=0;function onSearch(){clearTimeout(searchTimer);searchTimer=setTimeout(()=>{const q=listSearch();if(q&&SORT!=='rank'){SORT='rank';DIR='desc';}else if(!q&&SORT==='rank')SORT='id';loadPage(true);},250);}
+function listQuery(){return new URLSearchParams({q:listSearch(),product:document.getElementById("fp").value,corp:document.getElementById("fc").value,type:document.getElementById("ft").value,purpose:document.getElementById("fpu").value,sort:SORT,dir:DIR,format:'columnar'});}
+// 로컬 모드: IndexedDB 행 캐시(rowcache.js)로 전체 행을 브라우저에 두고 필터/정렬/합계를 여기서 — 캐시를 못 쓰면 서버 페이지 조회
+let LOCAL=null;
+const SORT_INDEX={id:0,invest_type:1,product:2,corporation:3,purpose:4,invest_item:5,order_target:6,order_actual:7,setup_target:8,setup_actual:9,mass_target:10,mass_actual:11,base_amount:13,order_price_target:14,order_price_actual:15,saving_target:16,saving_actual:17};
+function localTotals(rows){const t={count:rows.length,base:0,opt:0,opa:0,sgt:0,sga:0,reduce:[0,0,0,0,0,0,0,0,0]};for(const r of rows){t.base+=r[13]||0;t.opt+=r[14]||0;t.opa+=r[15]||0;t.sgt+=r[16]||0;t.sga+=r[17]||0;for(let i=0;i<9;i++)t.reduce[i]+=r[18+i]||0;}return t;}
+function localView(){const i=SORT_INDEX[SORT],num=i===0||i>=13,s=DIR==='asc'?1:-1,keep=rowFilter();   // 서버 정렬과 같게: NULL은 0/'' , 같으면 id
+  ROWS=LOCAL.filter(keep).sort((a,b)=>{const x=num?(a[i]||0):(a[i]||''),y=num?(b[i]||0):(b[i]||'');return(x<y?-1:x>y?1:a[0]-b[0])*s;});
+  TOTALS=localTotals(ROWS);CURSOR=null;renderTable();}
+function useLocal(rows){LOCAL=rows;if(listSearch())loadPage(true);else localView();}
+function startRows(){if(!(window.RowCache&&window.indexedDB)){loadPage(true);return;}
+  RowCache.cached().then(rows=>{if(rows.length)useLocal(rows);else loadPage(true);},()=>loadPage(true)).then(()=>RowCache.sync()).then(useLocal).catch(()=>{});}
+function loadPage(reset){if(LOCAL&&!listSearch()){if(reset){SELECTED.clear();const a=document.getElementById('selAll');if(a)a.checked=false;document.querySelector('.table-wrap').scrollTop=0;localView();}return Promise.resolve();}if(reset){ROWS=[];TOTALS=null;CURSOR=null;PENDING=null;SELECTED.clear();const a=document.getElementById('selAll');if(a)a.checked=false;document.querySelector('.table-wrap').scrollTop=0;}else if(PENDING)return PENDING;else if(!CURSOR)return Promise.resolve();const q=listQuery(),seq=reset?++listSeq:listSeq;if(CURSOR)q.set('cursor',CURSOR);PENDING=fetch('/api/list?'+q).then(r=>r.json()).then(d=>{if(seq!==listSeq)return;PENDING=null;for(const r of decodeColumnar(d.rows))ROWS.push(r);CURSOR=d.next;if(d.totals){TOTALS=d.totals;renderTable();}else renderWindow();});return PENDING;}
+function initSort(){document.querySelectorAll('#mainTable thead tr:nth-child(2) th').forEach((th,i)=>{const col=SORT_COLS[i];if(!col)return;th.style.cursor='pointer';th.onclick=()=>{if(SORT===col)DIR=DIR==='desc'?'asc':'desc';else{SORT=col;DIR='asc';}loadPage(true);};});}
+function applyFilter(){loadPage(true);}
+function downloadExcel(){location.href='/export.xlsx?'+listQuery();}
+function downloadCsv(){location.href='/export.csv?'+listQuery();}
+function uploadImport(inp){const file=inp.files[0];if(!file)return;const fd=new FormData();fd.append('file',file);inp.value='';fetch('/import',{method:'POST',body:fd}).then(r=>r.json()).then(d=>{if(d.success){alert(tl(d.inserted+'건 가져오기 완료',d.inserted+' rows imported'));loadPage(true);}else if(d.errors){alert(tl('가져오기 실패 (오류 '+d.errors.length+'행)','Import failed ('+d.errors.length+' rows)')+'\n'+d.errors.slice(0,20).map(e=>e.row+': '+e.errors.join(', ')).join('\n'));}else alert(d.error);});}
+function setLang(l){localStorage.setItem('app_lang',l);document.getElementById('langKo2').classList.toggle('active',l==='ko');document.getElementById('langEn2').classList.toggle('active',l==='en');applyLang();initListFilters();applyFilter();}
+function applyLang(){const l=localStorage.getItem('app_lang')||'ko';document.getElementById('langKo2').classList.toggle('active',l==='ko');document.getElementById('langEn2').classList.toggle('active',l==='en');document.querySelectorAll('.i18n').forEach(el=>{const t=el.getAttribute('data-'+l);if(t)el.innerHTML=t.replace(/\n/g,'<br>');});}
+const LP={'키친':'Kitchen','빌트인쿠킹':'Built-in Cooking','리빙':'Living','부품':'Parts','ES':'ES'};
+function tl(ko,en){return(localStorage.getItem('app_lang')==='en')?en:ko;}
+function initListFilters(){const l=localStorage.getItem('app_lang')||'ko';const fp=document.getElementById('fp'),cfp=fp.value;fp.innerHTML='<option value="">'+tl('전체','All')+'</option>';['키친','빌트인쿠킹','리빙','부품','ES'].forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(LP[p]||p):p;fp.appendChild(o);});if(cfp)fp.value=cfp;const ft=document.getElementById('ft'),cft=ft.value;ft.innerHTML='<option value="">'+tl('전체','All')+'</option>';const o1=document.createElement('option');o1.value='확장';o1.textContent=tl('확장','Expansion');ft.appendChild(o1);const o2=document.createElement('option');o2.value='경상';o2.textContent=tl('경상','Recurring');ft.appendChild(o2);if(cft)ft.value=cft;updateFilterCorps();const _PP2={'신규라인':'New Line','자동화':'Automation','라인 개조':'Line Remodel','Overhaul':'Overhaul','신모델 대응':'New Model','T/Time 향상':'T/Time Improve','고장 수리':'Repair','안전':'Safety','설비 이설':'Equip. Relocation','노후 교체':'Aging Replace','설비 개선':'Equip. Improve','기타':'Others'};const fpu=document.getElementById('fpu'),cfpu=fpu.value;fpu.innerHTML='<option value="">'+tl('전체','All')+'</option>';ALL_PURPOSES.forEach(p=>{const o=document.createElement('option');o.value=p;o.textContent=l==='en'?(_PP2[p]||p):p;fpu.appendChild(o);});if(cfpu)fpu.value=cfpu;}
+window.onload=function(){applyLang();initListFilters();initSort();document.querySelector('.table-wrap').addEventListener('scroll',e=>{scheduleWindow();const w=e.target;if(w.scrollTop+w.clientHeight>w.scrollHeight-400)loadPage(false);});window.addEventListener('resize',scheduleWindow);startRows();listenChanges();}
@@ -0,0 +1,28 @@
+// 행 캐시 (IndexedDB): 처음 한 번 전체를 받아 두고, 이후에는 /api/rows?since=버전 으로 바뀐 행/삭제된 id만 받아 반영
+// 조회 화면(<script>)과 대시보드 워커(importScripts)가 같이 씀 — RowCache.cached(): 로컬 행, RowCache.sync(): 서버와 맞춘 행
+function decodeColumnar(d){const cs=d.cols.map((c,i)=>d.dicts[i]?c.map(k=>d.dicts[i][k]):c),out=new Array(d.n);for(let r=0;r<d.n;r++){const row=new Array(cs.length);for(let j=0;j<cs.length;j++)row[j]=cs[j][r];out[r]=row;}return out;}
+const RowCache=(()=>{
+  const DB='investment-rows';let dbp=null,mem=null,meta=null,syncing=null,again=false;
+  function req(r){return new Promise((ok,fail)=>{r.onsuccess=()=>ok(r.result);r.onerror=()=>fail(r.error);});}
+  function open(){if(!dbp){const r=indexedDB.open(DB,1);r.onupgradeneeded=()=>{r.result.createObjectStore('rows');r.result.createObjectStore('meta');};dbp=req(r);}return dbp;}
+  function sorted(){return[...mem.values()].sort((a,b)=>b[0]-a[0]);}
+  // rows: id → 행 배열, meta: {version, fields}
+  async function load(){if(mem)return;const db=await open(),t=db.transaction(['rows','meta']);
+    const[rows,m]=await Promise.all([req(t.objectStore('rows').getAll()),req(t.objectStore('meta').get('sync'))]);
+    mem=new Map(rows.map(r=>[r[0],r]));meta=m||{version:0,fields:null};}
+  async function cached(){await load();return meta.version?sorted():[];}
+  async function pull(){await load();
+    const d=await fetch('/api/rows?format=columnar&since='+meta.version,{credentials:'same-origin'}).then(r=>{if(!r.ok)throw new Error(r.status);return r.json();});
+    if(!d.full&&JSON.stringify(d.fields)!==JSON.stringify(meta.fields)){meta={version:0,fields:null};return pull();}   // 행 모양이 바뀐 배포 → 전체
+    const full=d.full,rows=decodeColumnar(d.rows);
+    const db=await open(),t=db.transaction(['rows','meta'],'readwrite'),st=t.objectStore('rows');
+    if(full){st.clear();mem.clear();}
+    for(const id of d.deleted){st.delete(id);mem.delete(id);}
+    for(const r of rows){st.put(r,r[0]);mem.set(r[0],r);}
+    meta={version:d.version,fields:d.fields};t.objectStore('meta').put(meta,'sync');
+    await new Promise((ok,fail)=>{t.oncomplete=ok;t.onerror=()=>fail(t.error);});
+    return sorted();}
+  // 동기화 중에 또 요청되면(변경 알림) 끝난 뒤 한 번 더
+  function sync(){if(syncing){again=true;return syncing;}again=false;syncing=pull().finally(()=>{syncing=null;});return syncing.then(rows=>again?sync():rows);}
+  return{cached,sync};
+})();